@@ -42,54 +42,104 @@
 #
 #############################################################################  
 
-from vnpy import *           #Core Library for VN-100 interfacing
-
-from tkinter import *           #TKinter module for GUI 
-from tkinter.ttk import Style
+from vnpy import EzAsyncData    #Core Library for VN-100 interfacing
 
 import os, re, datetime, time, sched            #Importing modules used for time formatting and system information
 from datetime import timedelta
 
-import pandas as pd                             #Import pandas module for improved data structures
-from pandas import DataFrame
-import pandas_datareader
-
 import numpy as np                              #Import NumPy for scientific computing capabilities
 
-import matplotlib                               #Import matplotlib for plotting capabilities
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2TkAgg
-from matplotlib.figure import Figure
-import matplotlib.animation as animation
-from matplotlib import style
-import matplotlib.dates as mdates
-matplotlib.use("TkAgg")         #Must be placed before matplotlib.pyplot import or will have no effect
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
+## tkinter and matplotlib are imported further down, once the sensor is streaming, and
+## pandas only when the data is saved, so that the first sample does not wait for them.
+## python -m csacs.import_budget checks that the startup path stays free of them.
 
 #############################################################################
 
 
-""" Set Up Empty Arrays for Program """
-
-pitch_history = []
-roll_history = []
-yaw_history = []
-pitch_rate_history = []
-roll_rate_history = []
-yaw_rate_history = []
-current_time = []
-augmented_current_time = []
 i = 0
 
 """ Connect to VectorNav VN-100 using vn.core library """
 
-vs = VnSensor()
-vs.connect("/dev/ttyUSB1",115200)
+from csacs.telemetry import TelemetryStore
+from csacs.acquisition import AsyncAcquisition
+
+## With --simulate the sensor and the motor controllers are replaced by a simulated air
+## bearing (see csacs/simulation.py), so the program runs on any computer.  --replay plays
+## back a session recorded with --record (see csacs/recording.py) instead of the sensor;
+## motor commands then go to simulated controllers.  --speed runs the simulation or replay,
+## the controller and the plots that many times faster than real time.
+import argparse
+from csacs import clock
+
+parser = argparse.ArgumentParser(description = 'CSACS control software')
+parser.add_argument('--simulate', action = 'store_true', help = 'run against the simulated air bearing')
+parser.add_argument('--replay', metavar = 'PATH', help = 'replay a recorded sensor session')
+parser.add_argument('--record', metavar = 'PATH', help = 'record the raw sensor data to PATH')
+parser.add_argument('--speed', type = float, default = 1.0, help = 'simulation or replay speed, times real time')
+options = parser.parse_args()
+
+simulation = None
+replayer = None
+if options.simulate:
+    from csacs.simulation import Simulation
+    clock.set_speed(options.speed)
+    simulation = Simulation()
+    ez = simulation.connect()
+elif options.replay:
+    from csacs.recording import Replayer
+    clock.set_speed(options.speed)
+    replayer = Replayer(options.replay)
+    ez = replayer.connect()
+else:
+    ez = EzAsyncData.connect("/dev/ttyUSB1",115200)
+vs = ez.sensor
+
+recorder = None
+if options.record:
+    from csacs.recording import RawRecorder
+    recorder = RawRecorder(vs, options.record)
+    recorder.start()
+
+## Stream binary output at 200 Hz into the telemetry store.  The GUI, the controller
+## and the logger all read from the store and never wait on the serial port.  The
+## store keeps the last 5 minutes in memory; set spill_path to keep the whole run on disk.
+SENSOR_RATE_HZ = 200
+store = TelemetryStore(capacity = SENSOR_RATE_HZ*60*5, spill_path = None)
+acquisition = AsyncAcquisition(ez, store, rate_hz = SENSOR_RATE_HZ)
+acquisition.configure()
+acquisition.start()
 
 """ Connect to Haydon-Kerk Motors and Motor Controllers """
-import serial
-outP = serial.Serial(port="/dev/ttyUSB0", baudrate=57600, bytesize=8, parity='N', stopbits=1, timeout=2 ) # Pitch Motor
-out = serial.Serial(port="/dev/ttyUSB2", baudrate=57600, bytesize=8, parity='N', stopbits=1, timeout=2 ) # Roll Motor
+if simulation is not None:
+    outP = simulation.motor_ports['pitch'] # Pitch Motor
+    out = simulation.motor_ports['roll'] # Roll Motor
+    simulation.start()
+elif replayer is not None:
+    from csacs.simulation import SimulatedMotorPort
+    outP = SimulatedMotorPort('pitch') # Pitch Motor
+    out = SimulatedMotorPort('roll') # Roll Motor
+    replayer.start()
+else:
+    import serial
+    outP = serial.Serial(port="/dev/ttyUSB0", baudrate=57600, bytesize=8, parity='N', stopbits=1, timeout=2 ) # Pitch Motor
+    out = serial.Serial(port="/dev/ttyUSB2", baudrate=57600, bytesize=8, parity='N', stopbits=1, timeout=2 ) # Roll Motor
+
+## Commands are queued to a writer thread per port (see csacs/motors.py), so nobody
+## waits on the serial line and pitch and roll move at the same time.
+from csacs.motors import MotorChannel
+pitch_motor = MotorChannel(outP, name = 'pitch-motor')
+roll_motor = MotorChannel(out, name = 'roll-motor')
+pitch_motor.start()
+roll_motor.start()
+
+## Actuator positions are recorded in the telemetry store next to the sensor samples.
+## Set POSITION_QUERY to the controllers' position query command to read the actual
+## positions back; while it is None the commanded positions (in full steps) are recorded.
+from csacs.motors import ActuatorMonitor
+POSITION_QUERY = None
+actuators = ActuatorMonitor(store, {'pitch_position': pitch_motor, 'roll_position': roll_motor},
+                            query = POSITION_QUERY)
+actuators.start()
 
 ## Check if connected (DEBUG ONLY)
 # outP.isOpen()
@@ -98,6 +148,16 @@ out = serial.Serial(port="/dev/ttyUSB2", baudrate=57600, bytesize=8, parity='N',
 
 """ Graphics Options """
 
+from tkinter import *           #TKinter module for GUI 
+from tkinter.ttk import Style
+from tkinter import filedialog    #Directory dialog of the Save Data button
+
+import matplotlib                               #Import matplotlib for plotting capabilities
+matplotlib.use("TkAgg")         #Must be placed before the other matplotlib imports or will have no effect
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+from matplotlib import style
+
 LARGE_FONT = ("Verdana", 12) # Change this, just defining some new font to use in our labels
 style.use("bmh")
 
@@ -106,97 +166,35 @@ fig.suptitle('Live Accelerometer Graph',fontsize=14)
 a = fig.add_subplot(211)
 b = fig.add_subplot(212)
 
-""" Set up our animation function.  This has to be located here for whatever reason to work.
-    The animate function collects data and plots it in real time so the user can observe
-    the time history and current relative angular location of the air bearing. """ 
-
-def quit_func():
-    quit()
-
-def animate(i):
+""" Set up the live plot.  The lines are created once here and only their data is
+    updated on each frame (see csacs/plotting.py), so the user can observe the time
+    history and current relative angular location of the air bearing at a high frame
+    rate without redrawing the whole figure. """
 
-    """ Grab and Store Data """
+from csacs.plotting import LivePlot
 
-    def get_time():
-        current_time.append(datetime.datetime.now().time())
-    get_time()
-    
-    def read_pitch():
-        pry = vs.readYawPitchRoll()        
-        pitch_history.append(round(pry.y,5))
-    read_pitch()
-
-    def read_roll():
-        pry = vs.readYawPitchRoll()
-        roll_history.append(round(pry.z,5))
-    read_roll()
-
-    def read_yaw():
-        pry = vs.readYawPitchRoll()
-        yaw_history.append(round(pry.x,5))
-    read_yaw()
-
-    def read_pitch_rate():
-        pry_rate = vs.readAngularRateMeasurements()
-        pitch_rate_history.append(round(pry_rate.y,5))
-    read_pitch_rate()
-
-    def read_roll_rate():
-        pry_rate = vs.readAngularRateMeasurements()
-        roll_rate_history.append(round(pry_rate.x,5))
-    read_roll_rate()    
-
-    def read_yaw_rate():
-        pry_rate = vs.readAngularRateMeasurements()
-        yaw_rate_history.append(round(pry_rate.z,5))
-    read_yaw_rate()
-
-
-    """Time Calculations"""
-    graph_length = 50 #In Seconds
-    current_seconds = []
-    for t in current_time:
-        current_seconds.append(t.hour*3600+t.minute*60+t.second+t.microsecond/1000000-(current_time[0].hour*3600+current_time[0].minute*60+current_time[0].second+current_time[0].microsecond/1000000))
-
-    """ Plot Data """
-    a.clear()  ## Clear Graph -- Saves processor memory
-    a.plot(current_seconds, pitch_history, label = 'Pitch')
-    a.plot(current_seconds, roll_history, label = 'Roll')
-    a.plot(current_seconds, yaw_history, label = 'Yaw')
-
-    b.clear()
-    b.plot(current_seconds,pitch_rate_history,label = 'Pitch Rate')
-    b.plot(current_seconds,roll_rate_history,label = 'Roll Rate')
-    b.plot(current_seconds,yaw_rate_history,label = 'Yaw Rate')
-
-    """ Plotting Options """
-    
-    a.set_title('Angular Position vs. Time')
-    a.xaxis.set_major_formatter(mticker.ScalarFormatter())
-    a.set_ylabel('Angular Position (\u00b0)')
-    a.set_xlabel('')
-    for label in a.xaxis.get_ticklabels(): # Rotates time labels by 45 Deg
-        label.set_rotation(45)
-    plt.gca().get_yaxis().get_major_formatter().set_useOffset(False)
-    a.set_autoscaley_on(True)
-    a.set_ylim([-180,180])
-    a.set_autoscalex_on(True)
-    if len(current_seconds)>graph_length:
-        a.set_xlim([current_seconds[-graph_length],current_seconds[-1]])
-    
+live_plot = LivePlot(fig, store, rate_hz = SENSOR_RATE_HZ, window = 50, fps = 20)
+live_plot.add_panel(a, ('pitch', 'roll', 'yaw'), ('Pitch', 'Roll', 'Yaw'), [-180,180],
+                    title = 'Angular Position vs. Time', ylabel = 'Angular Position (\u00b0)')
+live_plot.add_panel(b, ('pitch_rate', 'roll_rate', 'yaw_rate'), ('Pitch Rate', 'Roll Rate', 'Yaw Rate'), [-180,180],
+                    title = 'Angular Rate vs. Time', ylabel = 'Angular Rate (\u00b0/s)', xlabel = 'time (s)')
 
-    b.set_title('Angular Rate vs. Time')
-    b.xaxis.set_major_formatter(mticker.ScalarFormatter())
-    b.set_ylabel('Angular Rate (\u00b0/s)')
-    b.set_xlabel('time (s)')
-    for label in b.xaxis.get_ticklabels():
-        label.set_rotation(45)
-    plt.gca().get_yaxis().get_major_formatter().set_useOffset(False)
-    b.set_autoscaley_on(True)
-    b.set_ylim([-180,180])
-    b.set_autoscalex_on(True)
-    if len(current_time)>graph_length:
-        b.set_xlim([current_seconds[-graph_length],current_seconds[-1]])
+def quit_func():
+    live_plot.stop()
+    controller.stop()
+    actuators.stop()
+    pitch_motor.stop()
+    roll_motor.stop()
+    acquisition.stop()
+    if simulation is not None:
+        simulation.stop()
+    if replayer is not None:
+        replayer.stop()
+    if recorder is not None:
+        recorder.stop()
+    ez.disconnect()
+    store.close()
+    quit()
 
 """ Create the base class for the graphic interface window.  The CSACS class is the base class
     that all other windows are built on.  
@@ -247,188 +245,105 @@ def qf(param):
 def save_data(): 
     ts = time.time()
     base_dir = filedialog.askdirectory()
+    if not base_dir:    # Dialog cancelled
+        return
     filename_time = datetime.datetime.fromtimestamp(ts).strftime('%Y-%m-%d-%H%M')
     filename_base = os.path.join(base_dir, filename_time)
     filename = '%s.csv' % filename_base
     print("Saving Data...")
-    df1 = DataFrame.from_items([('Pitch',pdx), ('Roll',pdy),('Yaw',pdz)]) 
-    df1.stack(level=0, dropna = False) # Takes rows and converts to columns
+    from pandas import DataFrame    #Import pandas here rather than at startup, it takes seconds to load
+    rows, _ = store.since(0)    # Every sample still in the store, one column per field
+    df1 = DataFrame(rows, columns = store.FIELDS)
     df1.to_csv(filename) # outputs to csv file
 
-# Only do this if the Stop button has not been clicked
-def dynamic_balance():
-    pry = vs.readYawPitchRoll()       
-    pitch = round(pry.y,8)
-    roll = round(pry.z,8)
-
-    if pitch >= 10:
-        movePmotor = 'I500000,25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-        outP.write(bytes(movePmotor, 'utf-8'))
-        time.sleep(5)
-        dynamic_balance()
-    elif pitch <=-10:
-        movePmotor = 'I-500000,25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-        outP.write(bytes(movePmotor, 'utf-8'))
-        time.sleep(5)
-        dynamic_balance()
-    elif roll >= 10:
-        moveRmotor = 'I500000,25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-        out.write(bytes(moveRmotor, 'utf-8'))
-        time.sleep(5)
-        dynamic_balance()
-    elif roll <=-10:
-        moveRmotor = 'I-500000,25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-        out.write(bytes(moveRmotor, 'utf-8'))
-        time.sleep(5)
-        dynamic_balance()
-
-        
-    elif pitch >= 5:
-        movePmotor = 'I250000,25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-        outP.write(bytes(movePmotor, 'utf-8'))
-        time.sleep(5)
-        dynamic_balance()
-    elif pitch <= -5:
-        movePmotor = 'I-250000,25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-        outP.write(bytes(movePmotor, 'utf-8'))
-        time.sleep(5)
-        dynamic_balance()
-    elif roll >= 5:
-        moveRmotor = 'I250000,25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-        out.write(bytes(moveRmotor, 'utf-8'))
-        time.sleep(5)
-        dynamic_balance()
-    elif roll <= -5:
-        moveRmotor = 'I-250000,25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-        out.write(bytes(moveRmotor, 'utf-8'))
-        time.sleep(5)
-        dynamic_balance()
-        
-    elif pitch >=2:
-        movePmotor = 'I-100000,25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-        outP.write(bytes(movePmotor, 'utf-8'))
-        time.sleep(5)
-        dynamic_balance()
-    elif pitch <=-2:
-        movePmotor = 'I-100000,25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-        outP.write(bytes(movePmotor, 'utf-8'))
-        time.sleep(5)
-        dynamic_balance()
-    elif roll >=2:
-        moveRmotor = 'I-100000,25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-        out.write(bytes(moveRmotor, 'utf-8'))
-        time.sleep(5)
-        dynamic_balance()
-    elif roll <=-2:
-        moveRmotor = 'I-100000,25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-        out.write(bytes(moveRmotor, 'utf-8'))
-        time.sleep(5)
-        dynamic_balance()
-        
-    elif pitch <= 1:
-        movePmotor = 'I-50000,25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-        outP.write(bytes(movePmotor, 'utf-8'))
-        time.sleep(5)
-        dynamic_balance()
-    elif pitch >= -1:
-        movePmotor = 'I-50000,25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-        outP.write(bytes(movePmotor, 'utf-8'))
-        time.sleep(5)
-        dynamic_balance()
-    elif roll <= 1:
-        moveRmotor = 'I-50000,25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-        out.write(bytes(moveRmotor, 'utf-8'))
-        time.sleep(5)
-        dynamic_balance()
-    elif roll >= -1:
-        moveRmotor = 'I-50000,25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-        out.write(bytes(moveRmotor, 'utf-8'))
-        time.sleep(5)
-        dynamic_balance()
-
-        
-    while pitch > 0.000001 or pitch < 0.000001:
-        if pitch > 0.000001:
-            movePmotor = 'I1,25600,9600,16000,320000,800000,490,122,490,490,50,64\r'
-            outP.write(bytes(movePmotor, 'utf-8'))
-            time.sleep(5)
-            dynamic_balance()
-        else:
-            movePmotor = 'I-1,25600,9600,16000,320000,800000,490,122,490,490,50,64\r'
-            outP.write(bytes(movePmotor, 'utf-8'))
-            time.sleep(5)
-            dynamic_balance()
-    
-    while roll > 0.000001 or roll < 0.000001:
-        if roll > 0.000001:
-            moveRmotor = 'I1,25600,9600,16000,320000,800000,490,122,490,490,50,64\r'
-            out.write(bytes(moveRmotor, 'utf-8'))
-            time.sleep(5)
-            dynamic_balance()
-        else:
-            moveRmotor = 'I-1,25600,9600,16000,320000,800000,490,122,490,490,50,64\r'
-            out.write(bytes(moveRmotor, 'utf-8'))
-            time.sleep(5)
-            dynamic_balance()
-    dynamic_balance()
+""" Dynamic balancing.  The controller runs on its own thread (see csacs/control.py)
+    at CONTROL_PERIOD; every iteration looks at the newest sample, asks balance_law (see
+    csacs/laws.py) for the next pitch and roll moves and queues them on every axis whose
+    previous move has finished.  A move has finished at the end predicted from its speed
+    profile, plus SETTLE_MARGIN seconds or, if POSITION_QUERY is set, once the position
+    readback has stopped changing.  A fine trim therefore takes milliseconds, not 5 s.  Compare laws with python -m csacs.benchmark_laws. """
+
+from csacs.control import ControlLoop
+from csacs.laws import LadderLaw, CubicLaw, PIDLaw
+
+CONTROL_PERIOD = 0.05   # Seconds between controller iterations (20 Hz)
+SETTLE_MARGIN = 0.1     # Seconds added to the predicted end of a move
+
+## Proportional law (steps per degree).  Every move adds to the actuator position, so
+## kp is the fraction of the angle corrected per move: with the platform swinging
+## on the bearing, that has to stay small at a SETTLE_MARGIN this short (tuned with
+## python -m csacs.simulation).  LadderLaw() is the old threshold ladder and
+## CubicLaw(500) the law of CSACS_v4.1.py.
+balance_law = PIDLaw(kp = 1500, max_steps = 500000)
+
+motors = (pitch_motor, roll_motor)
+position_fields = ('pitch_position', 'roll_position')
+last_moves = [None, None]   # MotorCommand of each axis' last move
+last_command = None         # csacs.clock time of the last call to balance_law
+
+def move_finished(axis, now):
+    move = last_moves[axis]
+    if move is None:
+        return True
+    if not move.sent.is_set():
+        return False
+    if move.sent_at is None:    # Coalesced moves that added up to nothing
+        return True
+    if actuators.query is not None:
+        # The readback also has to agree, in case the prediction is too short
+        return now >= move.finish_at and actuators.stopped(position_fields[axis], move.sent_at)
+    return now >= move.finish_at + SETTLE_MARGIN
+
+def dynamic_balance(now):
+    """ One controller iteration; never blocks. """
+    global last_command
+    ready = [move_finished(axis, now) for axis in (0, 1)]
+    if not any(ready):
+        return
+    sample = store.latest()
+    if sample is None:
+        return
+    angle = sample[[2, 3]]                  # pitch, roll
+    rate = np.degrees(sample[[5, 6]])       # pitch_rate, roll_rate
+    dt = CONTROL_PERIOD if last_command is None else now - last_command
+    last_command = now
+
+    steps = balance_law.command(angle, rate, dt)
+    for axis, (motor, n) in enumerate(zip(motors, steps)):
+        if n and ready[axis]:
+            last_moves[axis] = motor.move(int(n))
+
+controller = ControlLoop(dynamic_balance, period = CONTROL_PERIOD, name = 'dynamic-balance')
+
+log_cursor = 0
 
 def read_all():
-
-    def read_time():
-        current_time.append(datetime.datetime.now().time())
-    read_time()
-            
-    def read_pitch():
-        pry = vs.readYawPitchRoll() # imported command from vn.core to read VectorNav VN-100
-        pitch_history.append(round(pry.y,5))
-    read_pitch()
-
-    def read_roll():
-        pry = vs.readYawPitchRoll()
-        roll_history.append(round(pry.z,5))
-    read_roll()
-
-    def read_yaw():
-        pry = vs.readYawPitchRoll()
-        yaw_history.append(round(pry.x,5))
-    read_yaw()
-
-    def read_pitch_rate():
-        pry_rate = vs.readAngularRateMeasurements()
-        pitch_rate_history.append(round(pry_rate.y,5))
-    read_pitch_rate()
-
-    def read_roll_rate():
-        pry_rate = vs.readAngularRateMeasurements()
-        roll_rate_history.append(round(pry_rate.x,5))
-    read_roll_rate()    
-
-    def read_yaw_rate():
-        pry_rate = vs.readAngularRateMeasurements()
-        yaw_rate_history.append(round(pry_rate.z,5))
-    read_yaw_rate()
+    """ Returns every sample (full sensor rate) received since the last call """
+    global log_cursor
+    rows, log_cursor = store.since(log_cursor)
+    return rows
     
-running = True  # Global flag
-
-def scanning():
-    if running:
-        dynamic_balance()
-##        read_all()
-
-    # After 1 second, call scanning again (create a recursive loop)
-    app.after(5000, scanning)
+running = False  # Global flag, True while the controller is balancing
 
 def start():
-    """Enable scanning by setting the global flag to True."""
-    global running
+    """Start balancing: run the controller thread and set the global flag to True."""
+    global running, last_command
     running = True
-    scanning()
+    balance_law.reset()
+    last_command = None
+    controller.start()
 
 def stop():
-    """Stop scanning by setting the global flag to False."""
+    """Stop balancing: set the global flag to False and stop the controller thread."""
     global running
     running = False
-    scanning()
+    controller.stop()
+
+def balancing_status():
+    """Text for the GUI: why balancing stopped, if the controller raised an exception."""
+    if controller.error is None:
+        return ''
+    return 'Balancing stopped: %r' % (controller.error,)
 
 """ This is our main interface page.  All graphs, buttons, labels, and entry boxes are
     defined here.  This class is the first (and only) page that the CSACS class calls. """
@@ -450,60 +365,19 @@ class StartPage(Frame):
     
         # Create Display for current angular position in Pitch, Roll, and Yaw
 
-        def label_pitch_act(label):
-            def read_pitch():
-                pry = vs.readYawPitchRoll() # read in some orientation data from the sensor(pitch, roll, yaw)
-                pitch = round(pry.y,5)
-                w1 = Label(self, text = '%.2f' %pitch).grid(row=3,column=9,padx=10,pady=4)
-                label.after(500,read_pitch)
-                pitch_history.append(pitch)
-            read_pitch()
-
-        def label_roll_act(label):
-            def read_roll():
-                pry = vs.readYawPitchRoll()
-                roll = round(pry.z,5)
-                w2 = Label(self, text = '%.2f' %roll).grid(row=3,column=10,padx=10,pady=4)
-                label.after(500,read_roll)
-                roll_history.append(roll) 
-            read_roll()
-
-        def label_yaw_act(label):
-            def read_yaw():
-                pry = vs.readYawPitchRoll()
-                yaw = round(pry.x,5)
-                w3 = Label(self, text = '%.2f' %yaw).grid(row=3,column=11,padx=10,pady=4)
-                label.after(500,read_yaw)
-                yaw_history.append(yaw)
-            read_yaw()
-
-        def label_pitch_rate_act(label):
-            def read_pitch_rate():
-                pry_rate = vs.readAngularRateMeasurements()
-                pitch_rate = round(pry_rate.y,5)
-                w4 = Label(self,text='%.2f' %pitch_rate).grid(row=6,column=9,padx=10,pady=4)
-                label.after(500,read_pitch_rate)
-                pitch_rate_history.append(pitch_rate)
-            read_pitch_rate()
-
-        def label_roll_rate_act(label):
-            def read_roll_rate():
-                pry_rate = vs.readAngularRateMeasurements()
-                roll_rate = round(pry_rate.x,5)
-                w5 = Label(self,text='%.2f' %roll_rate).grid(row=6,column=10,padx=10,pady=4)
-                label.after(500,read_roll_rate)
-                roll_rate_history.append(roll_rate)
-            read_roll_rate()
-
-        def label_yaw_rate_act(label):
-            def read_yaw_rate():
-                pry_rate = vs.readAngularRateMeasurements()
-                yaw_rate = round(pry_rate.z,5)
-                w6 = Label(self,text='%.2f' %yaw_rate).grid(row=6,column=11,padx=10,pady=4)
-                label.after(500,read_yaw_rate)
-                yaw_rate_history.append(yaw_rate)
-            read_yaw_rate()
-            
+        # The value labels only display the newest stored sample, so refreshing them
+        # costs no serial I/O.
+
+        def label_act(label, field, row, column):
+            index = store.FIELDS.index(field)
+            value = Label(self, text = 'NaN')
+            value.grid(row=row,column=column,padx=10,pady=4)
+            def refresh():
+                sample = store.latest()
+                if sample is not None:
+                    value.config(text = '%.2f' %sample[index])
+                label.after(500,refresh)
+            refresh()
 
 
         label2 = Label(self, text = "Current Angular Position",  font = "Verdana 10 bold").grid(row = 1, column = 9, columnspan=3,pady=4, padx=5)
@@ -518,48 +392,63 @@ class StartPage(Frame):
         label_roll_rate = Label(self,text="Roll Rate (deg/s)").grid(row=5,column=10,padx=10,pady=4)
         label_yaw_rate = Label(self,text="Yaw Rate (deg/s)").grid(row=5,column=11,padx=10,pady=4)
 
-        pitch_history = []
-        roll_history = []
-        yaw_history = []
-
-        pitch_rate_history = []
-        roll_rate_history = []
-        yaw_rate_history = []
-        
         label = Label(self)
-        label_pitch_act(label)
-        label_roll_act(label)
-        label_yaw_act(label)
-        label_pitch_rate_act(label)
-        label_roll_rate_act(label)
-        label_yaw_rate_act(label)
+        label_act(label, 'pitch', 3, 9)
+        label_act(label, 'roll', 3, 10)
+        label_act(label, 'yaw', 3, 11)
+        label_act(label, 'pitch_rate', 6, 9)
+        label_act(label, 'roll_rate', 6, 10)
+        label_act(label, 'yaw_rate', 6, 11)
         
         # Create Mass Properties Entry Matrix
 
-        """ These entry boxes are currently unused and are here for future systems identfication """
+        """ With --simulate these entry boxes set the mass properties of the simulated air bearing
+            (press Enter to apply).  With the hardware they are unused and are here for future
+            systems identfication """
         
         label3 = Label(self, text = "Payload Characteristics", font = "Verdana 10 bold").grid(row = 0, column = 7, columnspan=2,sticky = W)
  
         label_mass = Label(self, text = "Mass (kg):").grid(row = 1, column = 7, sticky = N,pady=3,padx=5)
-        label_MOI_X = Label(self, text = "MOI X (m):").grid(row = 2, column = 7, sticky = N,pady=3,padx=5)
-        label_MOI_Y = Label(self, text = "MOI Y (m):").grid(row = 1, column = 8, sticky = N,pady=3,padx=5)
-        label_MOI_Z = Label(self, text = "MOI Z (m):").grid(row = 2, column = 8, sticky = N, pady=3,padx=5)
+        label_MOI_X = Label(self, text = "MOI X (kg m\u00b2):").grid(row = 2, column = 7, sticky = N,pady=3,padx=5)
+        label_MOI_Y = Label(self, text = "MOI Y (kg m\u00b2):").grid(row = 1, column = 8, sticky = N,pady=3,padx=5)
+        label_MOI_Z = Label(self, text = "MOI Z (kg m\u00b2):").grid(row = 2, column = 8, sticky = N, pady=3,padx=5)
         
-        self.ent_mass = Entry(self).grid(row = 1, column = 7, sticky = S, pady=3,padx=5)
-        self.ent_MOI_X = Entry(self).grid(row = 2, column = 7, sticky = S, pady=3,padx=5)
-        self.ent_MOI_Y = Entry(self).grid(row = 1, column = 8, sticky = S, pady=3,padx=5) 
-        self.ent_MOI_Z = Entry(self).grid(row = 2, column = 8, sticky = S, pady=3,padx=5)
+        self.ent_mass = Entry(self)
+        self.ent_mass.grid(row = 1, column = 7, sticky = S, pady=3,padx=5)
+        self.ent_MOI_X = Entry(self)
+        self.ent_MOI_X.grid(row = 2, column = 7, sticky = S, pady=3,padx=5)
+        self.ent_MOI_Y = Entry(self)
+        self.ent_MOI_Y.grid(row = 1, column = 8, sticky = S, pady=3,padx=5) 
+        self.ent_MOI_Z = Entry(self)
+        self.ent_MOI_Z.grid(row = 2, column = 8, sticky = S, pady=3,padx=5)
+
+        if simulation is not None:
+            model = simulation.model
+            mass_entries = (self.ent_mass, self.ent_MOI_X, self.ent_MOI_Y, self.ent_MOI_Z)
+            for entry, value in zip(mass_entries, (model.mass,) + model.inertia):
+                entry.insert(0, '%g' % value)
+
+            def apply_mass_properties(event):
+                try:
+                    mass, moi_x, moi_y, moi_z = [float(entry.get()) for entry in mass_entries]
+                except ValueError:
+                    print("Mass properties must be numbers.")
+                    return
+                model.set_mass_properties(mass, (moi_x, moi_y, moi_z))
+
+            for entry in mass_entries:
+                entry.bind('<Return>', apply_mass_properties)
         
-        # Create display for current Linear Actuator position
-        # This requires encoder to be enabled.  Future Release Version will have this included
+        # Create display for current Linear Actuator position, as recorded by the actuator monitor
+        # (full steps: the commanded position, or the readback when POSITION_QUERY is set)
         
         label4 = Label(self, text = "Current Linear Actuator Position",  font = "Verdana 10 bold").grid(row = 3, column = 7, columnspan=2,sticky = W, pady = 2, padx = 2)
 
-        label_curact1 = Label(self, text = "Pitch Axis Actuator (mm)").grid(row = 4, column = 7, sticky = N)
-        label_curact2 = Label(self, text = "Roll Axis Actuator (mm):").grid(row = 4, column = 8, sticky = N, padx = 2, pady = 2)
+        label_curact1 = Label(self, text = "Pitch Axis Actuator (steps)").grid(row = 4, column = 7, sticky = N)
+        label_curact2 = Label(self, text = "Roll Axis Actuator (steps):").grid(row = 4, column = 8, sticky = N, padx = 2, pady = 2)
 
-        label_disp_act = Label(self, text = "NaN").grid(row = 4, column = 7, sticky = S, padx = 2, pady = 2)
-        label_disp_act = Label(self, text = "NaN").grid(row = 4, column = 8, sticky = S, padx = 2, pady = 2)
+        label_act(label, 'pitch_position', 4, 7)
+        label_act(label, 'roll_position', 4, 8)
 
             
         # Create Manual Linear Actuator Control Entry Matrix
@@ -579,16 +468,14 @@ class StartPage(Frame):
         def move_x(self):
             if onevar == True: 
                 position_x = self.entryx.get()
-                movePmotor = 'I'+position+',25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-                outP.write(bytes(movePMotor, 'utf-8'))
+                pitch_motor.move(int(position_x))
             else:
                 print("Manual Control Disabled.")
  
         def move_y(self):
             if onevar == True:
                 position_y = self.entryy.get()
-                moveRmotor = 'I'+position+',25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-                out.write(bytes(moveRMotor, 'utf-8'))
+                roll_motor.move(int(position_y))
             else:
                 print("Manual Control Disabled.")
 
@@ -610,7 +497,7 @@ class StartPage(Frame):
         label8 = Label(self, text = "Control Panel",  font = "Verdana 14 bold").grid(row = 8, column = 9, columnspan=3,sticky = W, pady=2)
         self.run_button = Button(self, 
                                  text = "RUN", 
-                                 command = lambda: dynamic_balance()
+                                 command = lambda: start()
                                 ).grid(row = 9, column = 9, sticky = 'WE', pady=3, padx=5)
         
         self.save_button = Button(self,
@@ -627,14 +514,22 @@ class StartPage(Frame):
                                  text = "END",
                                  command = lambda: quit_func()
                                 ).grid(row = 10, column = 10, sticky = 'WE', pady=3, padx=5)
+
+        # The controller runs on its own thread; show here if it stopped with an error
+        status = Label(self, text = '', fg = 'red')
+        status.grid(row = 11, column = 9, columnspan = 3, sticky = W, pady=3, padx=5)
+        def refresh_status():
+            status.config(text = balancing_status())
+            status.after(500, refresh_status)
+        refresh_status()
         
 
 """ These commands tell python to load the CSACS class (and subsequent StartPage class.  The
-    animation function begins and updates every second (1000 ms).  The app.mainloop command
+    live plot begins and redraws 20 times a second.  The app.mainloop command
     tells Python to display the window."""
 
 app = CSACS()
-ani = animation.FuncAnimation(fig, animate, interval=500)
+live_plot.start()
 app.mainloop()
 
 
@@ -49,6 +49,9 @@ import serial
 import os, re, datetime, time, sched            #Importing modules used for time formatting and system information
 from datetime import timedelta
 
+from csacs.laws import CubicLaw
+from csacs.motors import profile
+
 #############################################################################
 
 vs = VnSensor()
@@ -57,6 +60,9 @@ vs.connect("/dev/ttyUSB1",115200)
 outP = serial.Serial(port="/dev/ttyUSB0", baudrate=57600, bytesize=8, parity='N', stopbits=1, timeout=2 ) # Pitch Motor
 out = serial.Serial(port="/dev/ttyUSB2", baudrate=57600, bytesize=8, parity='N', stopbits=1, timeout=2 ) # Roll Motor
 
+balance_law = CubicLaw(500)   # steps = 500*angle**3 on both axes
+coarse = profile('coarse')    # 1/8 microstep moves
+
 def dynamic_balance():
     pry = vs.read_yaw_pitch_roll()       
     pitch = round(pry.y,8)
@@ -65,13 +71,9 @@ def dynamic_balance():
     print(pitch)
     print(roll)
 
-    pitchCorrection = 500*pitch**3
-    movePmotor = 'I'+str(int(round(pitchCorrection)))+',25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-    outP.write(bytes(movePmotor, 'utf-8'))
-
-    rollCorrection = 500*roll**3
-    moveRmotor = 'I'+str(int(round(rollCorrection)))+',25600,9600,16000,320000,800000,490,122,490,490,50,8\r'
-    out.write(bytes(moveRmotor, 'utf-8'))
+    pitchCorrection, rollCorrection = balance_law.command((pitch, roll), (0, 0), 5)
+    outP.write(coarse.encode(pitchCorrection))
+    out.write(coarse.encode(rollCorrection))
 
     time.sleep(5)
 
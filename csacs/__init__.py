@@ -0,0 +1,5 @@
+""" Support modules for the CubeSat Attitude Control Simulator (CSACS) software.
+
+    CSACS_v4.0.py builds the GUI on top of these; they hold the pieces that do not
+    depend on tkinter (sensor acquisition, telemetry storage, etc.) so they can be
+    reused by the headless scripts as well. """
@@ -0,0 +1,131 @@
+""" Asynchronous acquisition of VN-100 data.
+
+    Instead of polling registers (one blocking serial round trip per value), the
+    sensor is configured to stream binary output packets at a fixed rate.  The
+    library receives and parses them on its own background thread; a small Python
+    thread moves the parsed samples into a TelemetryStore that everybody else reads.
+    Samples are drained as flat records straight into a NumPy array, so no Python
+    object is created per sample. """
+
+import threading
+import time
+
+import numpy as np
+
+from vnpy import BinaryOutputRegister, VNOFF
+from vnpy.records import empty_records
+
+# Values from the VN-100 binary output register definitions (libvnc/include/vnenum.h).
+# The Python bindings only accept them as plain integers.
+ASYNCMODE_PORT1 = 1
+COMMONGROUP_TIMESTARTUP = 0x0001
+COMMONGROUP_YAWPITCHROLL = 0x0008
+COMMONGROUP_ANGULARRATE = 0x0020
+
+# Common group fields streamed; vnpy.bulk.BinaryLayout(common=OUTPUT_FIELDS) decodes
+# recordings of them offline.
+OUTPUT_FIELDS = COMMONGROUP_TIMESTARTUP | COMMONGROUP_YAWPITCHROLL | COMMONGROUP_ANGULARRATE
+
+IMU_RATE_HZ = 800   # Binary output rates are a divisor of the internal IMU rate
+
+
+class AsyncAcquisition(object):
+
+    """ Streams YPR, angular rate and time since startup from the sensor into a store.
+
+        ez is a connected vnpy.EzAsyncData and store a telemetry.TelemetryStore.  Call
+        configure() once to program the binary output register, then start()/stop()
+        the receiving thread.  EzAsyncData is put in queue mode so that every packet
+        reaches the store even when this thread falls behind for a moment; packets are
+        then drained in batches of up to batch_size records.  overflow_policy is the
+        EzAsyncData queue policy, OVERFLOW_DROP_OLDEST if None; OVERFLOW_BLOCK makes
+        the receiving side wait instead, for replaying recordings without loss. """
+
+    def __init__(self, ez, store, rate_hz=200, timeout_ms=100, queue_capacity=4096, batch_size=64,
+                 overflow_policy=None):
+        self.ez = ez
+        self.store = store
+        self.rate_hz = rate_hz
+        self.timeout_ms = timeout_ms
+        self.queue_capacity = queue_capacity
+        self.batch_size = batch_size
+        self.overflow_policy = overflow_policy
+        self.received = 0
+        self.untimed = 0    # Packets dropped for lacking the time since startup
+        self._running = False
+        self._thread = None
+
+    def configure(self):
+        """ Turns off the ASCII async output and enables binary output 1. """
+        vs = self.ez.sensor
+        vs.write_async_data_output_type(VNOFF)
+        divisor = max(1, int(round(IMU_RATE_HZ / float(self.rate_hz))))
+        bor = BinaryOutputRegister(ASYNCMODE_PORT1, divisor, OUTPUT_FIELDS, 0, 0, 0, 0, 0)
+        vs.write_binary_output_1(bor)
+
+    @property
+    def running(self):
+        return self._running
+
+    def start(self):
+        if self._running:
+            return
+        policy = self.ez.OVERFLOW_DROP_OLDEST if self.overflow_policy is None else self.overflow_policy
+        self.ez.enable_queue(self.queue_capacity, policy)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name='vn100-acquisition')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.ez.disable_queue()
+
+    @property
+    def dropped(self):
+        """ Number of packets lost because the queue was full. """
+        return self.ez.dropped_count
+
+    def _run(self):
+        records = empty_records(self.batch_size)
+        while self._running:
+            n = self.ez.drain_into(records, self.timeout_ms)
+            if n:
+                rows = records_to_rows(records[:n])
+                self.store.extend(rows)
+                self.received += n
+                self.untimed += n - len(rows)
+
+
+def records_to_rows(records):
+    """ Converts an array of vnpy.records.COMPOSITE_RECORD_DTYPE into TelemetryStore
+        sensor rows (SENSOR_FIELDS).
+
+        Same layout as composite_to_row(), but records without the time since startup
+        are left out: a host clock fallback would mix two time bases in the store and
+        give the whole batch one timestamp. """
+    records = records[~np.isnan(records['time'])]
+    rows = np.empty((len(records), 7))
+    rows[:, 0] = records['time']
+    rows[:, 1:4] = records['ypr']
+    rows[:, 4:7] = records['rate'][:, ::-1]
+    return rows
+
+
+def composite_to_row(cd):
+    """ Converts a CompositeData into a TelemetryStore sensor row (SENSOR_FIELDS).
+
+        The sensor's time since startup is used as timestamp when the packet has
+        it, otherwise the host monotonic clock. """
+    row = np.full(7, np.nan)
+    row[0] = cd.time_startup * 1e-9 if cd.has_time_startup else time.monotonic()
+    if cd.has_yaw_pitch_roll:
+        ypr = cd.yaw_pitch_roll
+        row[1:4] = ypr.x, ypr.y, ypr.z
+    if cd.has_angular_rate:
+        rate = cd.angular_rate
+        row[4:7] = rate.z, rate.y, rate.x
+    return row
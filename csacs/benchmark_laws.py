@@ -0,0 +1,117 @@
+""" Convergence-time benchmark of the balancing control laws.
+
+    Usage: python -m csacs.benchmark_laws [recording.bin] [--deg-per-step X] ...
+
+    recording.bin is a telemetry spill file (see TelemetryStore).  Its pitch and
+    roll give the starting attitudes of the simulated runs (one every --every
+    seconds of the recording) and the sensor noise, estimated as the scatter of
+    pitch and roll around a 1 s moving average, which is added to every simulated
+    measurement.  Without a recording, starting attitudes are spread over +-15 deg
+    with no noise.
+
+    The air bearing is modelled as settling (first order, time constant --tau)
+    towards the attitude that the current balance mass positions give; moving an
+    actuator by one step shifts that attitude by --deg-per-step degrees.  A law
+    is given a new command every --period seconds, standing in for the time the
+    actuators take to move plus settling.  A run has converged once pitch and
+    roll stay within --tolerance degrees until the end of the horizon.
+
+    The model parameters are rough; the point is to compare laws on the same
+    runs, not to predict absolute times. """
+
+import argparse
+
+import numpy as np
+
+from csacs.laws import LadderLaw, CubicLaw, PIDLaw
+from csacs.telemetry import load_spill
+
+
+def recorded_conditions(path, every):
+    """ Returns ((2, n) starting attitudes, (2,) noise standard deviation) from a recording. """
+    data = load_spill(path)
+    attitude = np.vstack((data['pitch'], data['roll'])).astype(np.float64)
+    rate = 1.0 / np.median(np.diff(data['time']))
+    width = max(int(rate), 1)
+    kernel = np.ones(width) / width
+    smooth = np.vstack([np.convolve(axis, kernel, mode='same') for axis in attitude])
+    noise = np.std((attitude - smooth)[:, width:-width], axis=1)
+    starts = attitude[:, ::max(int(every * rate), 1)]
+    return starts, noise
+
+
+def simulate(law, start, noise, deg_per_step, tau, period, horizon, dt=0.05, seed=0):
+    """ Runs law from every column of the (2, n) start at once.  Returns the attitude
+        every dt seconds as a (horizon / dt, 2, n) array. """
+    rng = np.random.RandomState(seed)
+    law.reset()
+    equilibrium = start.copy()
+    angle = start.copy()
+    rate = np.zeros_like(start)
+    history = np.empty((int(horizon / dt),) + start.shape)
+    next_command = 0.0
+    for k in range(len(history)):
+        t = k * dt
+        if t >= next_command:
+            measured = angle + noise[:, None] * rng.standard_normal(angle.shape)
+            steps = law.command(measured, rate, period)
+            equilibrium = equilibrium - deg_per_step * steps
+            next_command += period
+        previous = angle
+        angle = equilibrium + (angle - equilibrium) * np.exp(-dt / tau)
+        rate = (angle - previous) / dt
+        history[k] = angle
+    return history
+
+
+def convergence_times(history, tolerance, dt=0.05):
+    """ Time after which both axes stay inside tolerance, per run (inf if never). """
+    inside = np.all(np.abs(history) <= tolerance, axis=1)
+    # Index of the last sample outside tolerance, counted from the end
+    outside_from_end = np.argmax(~inside[::-1], axis=0)
+    settled = np.where(inside[-1], len(inside) - outside_from_end, np.inf)
+    settled[np.all(inside, axis=0)] = 0
+    return settled * dt
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0].strip())
+    parser.add_argument('recording', nargs='?')
+    parser.add_argument('--every', type=float, default=10.0, help='seconds between starting points')
+    parser.add_argument('--deg-per-step', type=float, default=2e-5)
+    parser.add_argument('--tau', type=float, default=3.0, help='platform time constant in seconds')
+    parser.add_argument('--period', type=float, default=5.0, help='seconds between commands')
+    parser.add_argument('--horizon', type=float, default=600.0)
+    parser.add_argument('--tolerance', type=float, default=0.05)
+    args = parser.parse_args()
+
+    if args.recording:
+        start, noise = recorded_conditions(args.recording, args.every)
+    else:
+        grid = np.linspace(-15, 15, 13)
+        start = np.array(np.meshgrid(grid, grid)).reshape(2, -1)
+        noise = np.zeros(2)
+
+    kp = 1.0 / args.deg_per_step   # Steps that move the equilibrium by one degree
+    laws = [('ladder', LadderLaw()),
+            ('cubic', CubicLaw(500)),
+            ('P', PIDLaw(0.8 * kp, max_steps=500000)),
+            ('PD', PIDLaw(0.9 * kp, kd=2.5 * kp, max_steps=500000)),
+            ('PD scheduled', PIDLaw(0.9 * kp, kd=2.5 * kp, max_steps=500000,
+                                    schedule=((0.2, 2.0), (0.5, 1.0))))]
+
+    print('%d runs, noise %.4f/%.4f deg, tolerance %.3f deg' % (start.shape[1], noise[0], noise[1], args.tolerance))
+    print('%-14s %10s %10s %10s %10s' % ('law', 'converged', 'median s', 'p90 s', 'max s'))
+    for name, law in laws:
+        times = convergence_times(simulate(law, start, noise, args.deg_per_step, args.tau,
+                                           args.period, args.horizon), args.tolerance)
+        done = times[np.isfinite(times)]
+        if len(done):
+            print('%-14s %9.0f%% %10.1f %10.1f %10.1f' % (name, 100.0 * len(done) / len(times),
+                                                      np.median(done), np.percentile(done, 90), done.max()))
+        else:
+            print('%-14s %9.0f%% %10s %10s %10s' % (name, 0, '-', '-', '-'))
+
+
+if __name__ == '__main__':
+    main()
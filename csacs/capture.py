@@ -0,0 +1,253 @@
+""" Indexed capture files of VN-100 binary output, for random access into long sessions.
+
+    A capture holds the raw bytes received from the sensor, as a recording does,
+    followed by an index of the binary packets in them: the sensor time and file
+    offset of every stride-th packet.  A reader memory-maps the file, looks up a
+    time range in the index and decodes only the packets in that range (with
+    vnpy.bulk), so any window of an overnight run loads without reading the rest.
+
+    File format (little endian):
+        header   magic 'CSACSCAP', version (uint16), the six output group field
+                 masks of the packets (uint16 each, see vnpy.bulk.BinaryLayout),
+                 index stride (uint32), wall clock start time (float64)
+        data     the received bytes, unaltered
+        index    (time, offset) pairs (uint64 each): the indexed time field in ns
+                 and the file offset of the packet
+        footer   offset of the index (uint64), number of entries (uint64), 'CAPINDEX'
+
+    The index is written when the capture is closed.  A capture without one (the
+    program was killed) is indexed when it is opened instead.
+
+        python -m csacs.capture convert session.raw session.cap
+        python -m csacs.capture window session.cap START STOP [--output window.npz] """
+
+import argparse
+import mmap
+import struct
+import threading
+import time
+
+import numpy as np
+
+from vnpy import bulk
+
+MAGIC = b'CSACSCAP'
+VERSION = 1
+HEADER = struct.Struct('<8sH6HId')
+FOOTER = struct.Struct('<QQ8s')
+FOOTER_MAGIC = b'CAPINDEX'
+INDEX_DTYPE = np.dtype([('time', '<u8'), ('offset', '<u8')])
+
+# Fields a capture can be indexed by, in order of preference
+TIME_FIELDS = ('time_startup', 'time_gps')
+
+BLOCK_SIZE = 1 << 22    # Bytes scanned at a time while indexing
+
+
+def time_field(layout):
+    """ The field of layout that captures with it are indexed by. """
+    for name in TIME_FIELDS:
+        if name in layout.dtype.names:
+            return name
+    raise ValueError('%r has neither time_startup nor time_gps' % layout)
+
+
+def index_packets(data, start, end, layout, stride):
+    """ Returns the index entries of the packets with layout in data[start:end] (a
+        uint8 array): one for every stride-th packet, starting with the first. """
+    field = time_field(layout)
+    length = layout.length
+    entries = []
+    count = 0
+    for block in range(start, end, BLOCK_SIZE):
+        stop = min(block + BLOCK_SIZE, end)
+        # Scan a packet length past the block so that packets straddling its end are found
+        offsets = bulk.find_packets(data[block:min(stop + length - 1, end)], layout)
+        offsets = offsets[offsets < stop - block]
+        selected = offsets[(count + np.arange(len(offsets))) % stride == 0] + block
+        count += len(offsets)
+        if len(selected):
+            entry = np.empty(len(selected), dtype=INDEX_DTYPE)
+            entry['time'] = bulk.decode_at(data, selected, layout)[field]
+            entry['offset'] = selected
+            entries.append(entry)
+    return np.concatenate(entries) if entries else np.zeros(0, dtype=INDEX_DTYPE)
+
+
+class CaptureWriter(object):
+
+    """ Writes a capture of packets with layout (a vnpy.bulk.BinaryLayout or
+        BinaryOutputRegister) to path.
+
+        write(data, running_index=None) appends received bytes; it has the signature
+        of a raw data received handler, so a live session is captured with
+        sensor.register_raw_data_received_handler(writer.write).  close() indexes
+        the data and writes the index. """
+
+    def __init__(self, path, layout, stride=64, start=None):
+        self.path = path
+        if not isinstance(layout, bulk.BinaryLayout):
+            layout = bulk.BinaryLayout.from_register(layout)
+        self.layout = layout
+        self.stride = stride
+        time_field(self.layout)
+        self.bytes = 0
+        self._lock = threading.Lock()
+        self._file = open(path, 'w+b')
+        if start is None:
+            start = time.time()
+        self._file.write(HEADER.pack(MAGIC, VERSION, *(self.layout.fields + (stride, start))))
+
+    def write(self, data, running_index=None):
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(data)
+            self.bytes += len(data)
+
+    def close(self):
+        with self._lock:
+            if self._file is None:
+                return
+            f, self._file = self._file, None
+        f.flush()
+        end = HEADER.size + self.bytes
+        if self.bytes:
+            m = mmap.mmap(f.fileno(), 0)
+            try:
+                index = index_packets(np.frombuffer(m, dtype=np.uint8), HEADER.size, end, self.layout, self.stride)
+            finally:
+                m.close()
+        else:
+            index = np.zeros(0, dtype=INDEX_DTYPE)
+        f.seek(end)
+        f.write(index.tobytes())
+        f.write(FOOTER.pack(end, len(index), FOOTER_MAGIC))
+        f.close()
+
+
+class Capture(object):
+
+    """ Read access to a capture file through a memory map.
+
+        times are the indexed times in seconds (time_field is the packet field they
+        come from), first and last those of the first and last indexed packet.
+        window() decodes the packets in a time range, columns() all of them; both
+        return a dict of NumPy arrays as vnpy.bulk.decode() does.  The arrays are
+        copies, so they stay valid after close(). """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._data = np.frombuffer(self._mmap, dtype=np.uint8)
+        header = HEADER.unpack_from(self._mmap)
+        if header[0] != MAGIC or header[1] != VERSION:
+            self.close()
+            raise ValueError('%s is not a capture file' % path)
+        self.layout = bulk.BinaryLayout(*header[2:8])
+        self.stride = header[8]
+        self.start = header[9]
+        self.time_field = time_field(self.layout)
+        footer = FOOTER.unpack_from(self._mmap, len(self._mmap) - FOOTER.size) \
+            if len(self._mmap) >= HEADER.size + FOOTER.size else None
+        if footer is not None and footer[2] == FOOTER_MAGIC:
+            self._end = footer[0]
+            self.index = np.frombuffer(self._mmap, dtype=INDEX_DTYPE, count=footer[1], offset=footer[0])
+        else:
+            self._end = len(self._mmap)
+            self.index = index_packets(self._data, HEADER.size, self._end, self.layout, self.stride)
+        self.times = self.index['time'] / 1e9
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def first(self):
+        return self.times[0] if len(self.times) else None
+
+    @property
+    def last(self):
+        return self.times[-1] if len(self.times) else None
+
+    def window(self, start, stop):
+        """ Decodes the packets whose time_field is within [start, stop] seconds.
+            Only the part of the file between the surrounding index entries is read. """
+        times = self.times
+        if not len(times):
+            return self._decode(HEADER.size, HEADER.size)
+        first = max(np.searchsorted(times, start, 'right') - 1, 0)
+        last = np.searchsorted(times, stop, 'right')
+        begin = int(self.index['offset'][first])
+        end = int(self.index['offset'][last]) if last < len(times) else self._end
+        columns = self._decode(begin, end)
+        sample_times = columns[self.time_field] / 1e9
+        keep = (sample_times >= start) & (sample_times <= stop)
+        return dict((name, column[keep]) for name, column in columns.items())
+
+    def columns(self):
+        """ Decodes every packet in the capture. """
+        return self._decode(HEADER.size, self._end)
+
+    def close(self):
+        if self._mmap is None:
+            return
+        self._data = self.index = None
+        self._mmap.close()
+        self._file.close()
+        self._mmap = self._file = None
+
+    def _decode(self, begin, end):
+        return bulk.decode(self._data[begin:end], self.layout)
+
+
+def convert(recording, path, layout, stride=64):
+    """ Writes the raw recording (see csacs.recording) as a capture of packets with layout. """
+    from csacs.recording import read_recording
+
+    start, chunks = read_recording(recording)
+    writer = CaptureWriter(path, layout, stride=stride, start=start)
+    for _, data in chunks:
+        writer.write(data)
+    writer.close()
+    return writer
+
+
+def main():
+    from csacs.acquisition import OUTPUT_FIELDS
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0].strip())
+    commands = parser.add_subparsers(dest='command')
+    p = commands.add_parser('convert', help='convert a raw recording of AsyncAcquisition output')
+    p.add_argument('recording')
+    p.add_argument('path')
+    p.add_argument('--stride', type=int, default=64, help='packets per index entry')
+    p = commands.add_parser('window', help='decode the packets between two sensor times')
+    p.add_argument('path')
+    p.add_argument('start', type=float, help='seconds')
+    p.add_argument('stop', type=float, help='seconds')
+    p.add_argument('--output', help='save the columns to this .npz file')
+    args = parser.parse_args()
+    if args.command == 'convert':
+        writer = convert(args.recording, args.path, bulk.BinaryLayout(common=OUTPUT_FIELDS), args.stride)
+        with Capture(args.path) as capture:
+            print('%d bytes, %d index entries, %.1f to %.1f s' %
+                  (writer.bytes, len(capture.index), capture.first, capture.last))
+    elif args.command == 'window':
+        started = time.monotonic()
+        with Capture(args.path) as capture:
+            columns = capture.window(args.start, args.stop)
+            print('%.1f to %.1f s of %.1f to %.1f s: %d packets in %.3f s' %
+                  (args.start, args.stop, capture.first, capture.last,
+                   len(columns[capture.time_field]), time.monotonic() - started))
+        if args.output:
+            np.savez(args.output, **columns)
+    else:
+        parser.print_help()
+
+
+if __name__ == '__main__':
+    main()
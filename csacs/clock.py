@@ -0,0 +1,44 @@
+""" Time source of the control code.
+
+    Everything in csacs that schedules by time (ControlLoop deadlines, the predicted
+    end of motor moves, actuator readings) reads the time from here instead of
+    time.monotonic().  At the default speed of 1 the two are the same; a simulation
+    (see csacs/simulation.py) calls set_speed() once at startup to run the whole
+    stack faster (or slower) than real time.
+
+    Only scheduling goes through the clock.  Timeouts that guard against a stuck
+    port or thread are real time. """
+
+import time
+
+_speed = 1.0
+_real_origin = time.monotonic()
+_clock_origin = _real_origin
+
+
+def monotonic():
+    """ The current time in seconds, advancing speed() times as fast as real time. """
+    return _clock_origin + (time.monotonic() - _real_origin) * _speed
+
+
+def speed():
+    return _speed
+
+
+def set_speed(speed):
+    """ Sets how many clock seconds pass per real second.  The clock carries on from
+        its current value.  Meant to be called before any threads are started. """
+    global _speed, _real_origin, _clock_origin
+    if speed <= 0:
+        raise ValueError('speed must be positive')
+    now = time.monotonic()
+    _clock_origin = _clock_origin + (now - _real_origin) * _speed
+    _real_origin = now
+    _speed = float(speed)
+
+
+def wait(event, timeout):
+    """ event.wait() for timeout clock seconds (None waits forever). """
+    if timeout is None:
+        return event.wait()
+    return event.wait(max(timeout, 0.0) / _speed)
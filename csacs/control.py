@@ -0,0 +1,81 @@
+""" Fixed-rate control loop.
+
+    The balancing controller runs on its own thread so that neither the serial
+    writes to the motor controllers nor the wait for a move to finish can block
+    the Tk main loop. """
+
+import logging
+import threading
+
+from csacs import clock
+
+log = logging.getLogger(__name__)
+
+
+class ControlLoop(object):
+
+    """ Calls step(now) every period seconds on a background thread.
+
+        now is the deadline of the iteration, in csacs.clock time.  Deadlines are
+        absolute (start + k * period), so the rate does not drift with the time
+        step() takes.  If an iteration finishes after the next deadline has already
+        passed, the deadlines that were missed are counted in missed and skipped,
+        rather than calling step() back to back to catch up.
+
+        step() should do one quick update and return; anything that has to wait
+        (e.g. for a move to finish) should remember when it can continue and return
+        early until then.  An exception raised by step() stops the loop; it is logged
+        and kept in error. """
+
+    def __init__(self, step, period=0.05, name='control-loop'):
+        self.step = step
+        self.period = period
+        self.name = name
+        self.iterations = 0
+        self.missed = 0             # Deadlines skipped because an iteration overran
+        self.max_duration = 0.0     # Longest time spent in step(), in seconds
+        self.error = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self.error = None
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """ Stops the loop and waits for the current iteration to finish. """
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        deadline = clock.monotonic()
+        while not self._stop.is_set():
+            started = clock.monotonic()
+            try:
+                self.step(deadline)
+            except Exception as e:
+                log.exception('%s stopped: step() raised', self.name)
+                self.error = e
+                return
+            finished = clock.monotonic()
+            self.iterations += 1
+            self.max_duration = max(self.max_duration, finished - started)
+
+            deadline += self.period
+            if finished > deadline:
+                late = int((finished - deadline) // self.period) + 1
+                self.missed += late
+                deadline += late * self.period
+            # Event.wait() returns early when stop() is called
+            clock.wait(self._stop, deadline - clock.monotonic())
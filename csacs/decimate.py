@@ -0,0 +1,61 @@
+""" Downsampling of long time series for plotting.
+
+    A line plot can never show more detail than one vertical stroke per pixel
+    column, so there is no point handing matplotlib more than a few points per
+    pixel.  Both functions here take x (increasing, e.g. elapsed time) and y and
+    return a shorter (x, y) pair that looks the same when drawn n_out pixels wide.
+
+    minmax() keeps the lowest and highest sample of every bucket so spikes are
+    never lost; it is fully vectorized and cheap enough to run on every frame.
+    lttb() (Largest-Triangle-Three-Buckets, Steinarsson 2013) keeps one visually
+    representative sample per bucket; it gives smoother lines for zoomed-out views
+    but loops over buckets, so it is better suited to static plots. """
+
+import numpy as np
+
+
+def minmax(x, y, n_out):
+    """ Splits the samples into n_out // 2 buckets of equal size and keeps the
+        minimum and maximum of each, in time order.  Returns at most n_out points. """
+    n = len(x)
+    if n <= n_out:
+        return x, y
+    buckets = max(n_out // 2, 1)
+    size = -(-n // buckets)
+    # The last bucket is padded with the last sample so all buckets reshape into rows
+    rows = np.empty(buckets * size, dtype=y.dtype)
+    rows[:n] = y
+    rows[n:] = y[-1]
+    rows = rows.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    lo = np.minimum(offsets + np.argmin(rows, axis=1), n - 1)
+    hi = np.minimum(offsets + np.argmax(rows, axis=1), n - 1)
+    index = np.empty(2 * buckets, dtype=np.intp)
+    index[0::2] = np.minimum(lo, hi)
+    index[1::2] = np.maximum(lo, hi)
+    return x[index], y[index]
+
+
+def lttb(x, y, n_out):
+    """ Largest-Triangle-Three-Buckets downsampling to n_out points.  The first
+        and last samples are always kept. """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    index = np.empty(n_out, dtype=np.intp)
+    index[0] = 0
+    index[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) is the third triangle corner
+        if i + 2 < len(edges):
+            nx = x[stop:edges[i + 2]].mean()
+            ny = y[stop:edges[i + 2]].mean()
+        else:
+            nx, ny = x[n - 1], y[n - 1]
+        area = np.abs((x[a] - nx) * (y[start:stop] - y[a]) - (x[a] - x[start:stop]) * (ny - y[a]))
+        a = start + int(np.argmax(area))
+        index[i + 1] = a
+    return x[index], y[index]
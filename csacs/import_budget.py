@@ -0,0 +1,72 @@
+""" Import time budget of the CSACS startup path.
+
+    Usage: python -m csacs.import_budget [--scale X] [--repeat N]
+
+    Imports each module of the path from the program's start to the first sensor
+    sample in a fresh interpreter and checks how long the import takes against
+    its budget, and that it does not pull in modules it must not load: the
+    plotting and data analysis libraries (they are imported once the sensor is
+    streaming), and for the offline modules the binding library.  The time is the
+    fastest of --repeat runs, so it does not count writing the .pyc files.
+    Exits with status 1 if a check fails.
+
+    The budgets are for a desktop PC; --scale multiplies them (about 10 for a
+    BeagleBone Black). """
+
+import argparse
+import subprocess
+import sys
+
+GUI_MODULES = ('pandas', 'pandas_datareader', 'matplotlib', 'tkinter')
+
+# (module, budget in seconds, modules it must not import).  The budgets are about
+# twice the slowest of several --repeat 5 runs: vnpy 1 ms, vnpy.bulk 125 ms,
+# vnpy.core 114 ms (loading the extension module, which varies with the disk
+# cache), csacs.telemetry 112 ms and csacs.acquisition 186 ms.
+BUDGETS = (
+    ('vnpy', 0.01, ('vnpy.libvncxx',) + GUI_MODULES),
+    ('vnpy.bulk', 0.25, ('vnpy.libvncxx',) + GUI_MODULES),
+    ('vnpy.core', 0.25, GUI_MODULES),
+    ('csacs.telemetry', 0.25, ('vnpy.libvncxx',) + GUI_MODULES),
+    ('csacs.acquisition', 0.35, GUI_MODULES),
+)
+
+PROBE = ('import sys, time\n'
+         'start = time.perf_counter()\n'
+         'import %s\n'
+         'print(time.perf_counter() - start)\n'
+         'print(" ".join(sys.modules))\n')
+
+
+def measure(module, repeat=3):
+    """ Returns (seconds, names of the modules loaded) of importing module in a
+        fresh interpreter, the fastest of repeat runs. """
+    best = None
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', PROBE % module], universal_newlines=True)
+        seconds, modules = output.splitlines()[-2:]
+        if best is None or float(seconds) < best[0]:
+            best = float(seconds), set(modules.split())
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0].strip())
+    parser.add_argument('--scale', type=float, default=1.0, help='multiply the budgets by this')
+    parser.add_argument('--repeat', type=int, default=3, help='imports per module')
+    args = parser.parse_args()
+    failed = False
+    for module, budget, forbidden in BUDGETS:
+        seconds, loaded = measure(module, args.repeat)
+        budget *= args.scale
+        problems = ['imports ' + name for name in forbidden if name in loaded]
+        if seconds > budget:
+            problems.append('over budget')
+        failed = failed or bool(problems)
+        print('%-20s %7.1f ms of %7.1f ms  %s' % (module, seconds * 1e3, budget * 1e3,
+                                                   ', '.join(problems) if problems else 'ok'))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
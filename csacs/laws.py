@@ -0,0 +1,109 @@
+""" Balancing control laws.
+
+    A control law turns the measured attitude of the air bearing into relative
+    moves for the balance mass actuators.  All laws work on both axes at once:
+    angle and rate are NumPy arrays ordered (pitch, roll), in degrees and degrees
+    per second, and the result is an integer array of steps (in 1/8 microsteps,
+    the unit of the motor commands) for the (pitch, roll) actuators.  A positive
+    angle is corrected with positive steps.  Extra trailing dimensions are allowed,
+    e.g. (2, n) arrays to evaluate n independent runs in one call.
+
+    The laws are interchangeable; the controller only calls command() and reset(). """
+
+import numpy as np
+
+
+class ControlLaw(object):
+
+    """ Base class.  Subclasses implement _command() and, if they keep state, reset(). """
+
+    def __init__(self, max_steps=None):
+        self.max_steps = max_steps  # Saturation, in steps per command
+
+    def command(self, angle, rate, dt):
+        """ Returns the (pitch, roll) steps for one command.  dt is the time since
+            the previous command in seconds. """
+        steps = self._command(np.asarray(angle, dtype=np.float64), np.asarray(rate, dtype=np.float64), dt)
+        if self.max_steps is not None:
+            steps = np.clip(steps, -self.max_steps, self.max_steps)
+        return np.rint(steps).astype(np.int64)
+
+    def reset(self):
+        pass
+
+    def _command(self, angle, rate, dt):
+        raise NotImplementedError
+
+
+class LadderLaw(ControlLaw):
+
+    """ Fixed step counts by angle band, as the original threshold ladder.
+
+        rungs is a sequence of (threshold in degrees, steps), largest threshold
+        first; an axis whose |angle| is at least a threshold gets that many steps
+        (with the sign of the angle).  Below the last threshold nothing is sent. """
+
+    def __init__(self, rungs=((10, 500000), (5, 250000), (2, 100000), (1, 50000)), max_steps=None):
+        ControlLaw.__init__(self, max_steps)
+        # Ascending order so np.searchsorted can find the band of every axis at once
+        self.thresholds = np.array([t for t, s in rungs][::-1], dtype=np.float64)
+        self.steps = np.array([0] + [s for t, s in rungs][::-1], dtype=np.float64)
+
+    def _command(self, angle, rate, dt):
+        band = np.searchsorted(self.thresholds, np.abs(angle), side='right')
+        return np.sign(angle) * self.steps[band]
+
+
+class CubicLaw(ControlLaw):
+
+    """ steps = gain * angle**3, the law used by CSACS_v4.1.py. """
+
+    def __init__(self, gain=500.0, max_steps=None):
+        ControlLaw.__init__(self, max_steps)
+        self.gain = gain
+
+    def _command(self, angle, rate, dt):
+        return self.gain * angle ** 3
+
+
+class PIDLaw(ControlLaw):
+
+    """ PID law with gain scheduling, saturation and integrator anti-windup.
+
+        steps = s * (kp * angle + ki * integral(angle) + kd * rate)
+
+        The derivative term uses the measured angular rate, so it is not disturbed by
+        the steps in angle a move causes.  schedule optionally scales all three gains
+        with the size of the error: a pair (breakpoints, scales) of increasing |angle|
+        values in degrees and the gain factor s at each, linearly interpolated (and
+        held constant outside the breakpoints).  |angle| below deadband gives no move
+        and freezes the integrator.  The integrator is clamped so that its term alone
+        never exceeds max_steps.  With ki = 0 this is a PD law. """
+
+    def __init__(self, kp, ki=0.0, kd=0.0, schedule=None, max_steps=None, deadband=0.0):
+        ControlLaw.__init__(self, max_steps)
+        self.kp = kp
+        self.ki = ki
+        self.kd = kd
+        self.schedule = schedule
+        self.deadband = deadband
+        self.integral = 0.0
+
+    def reset(self):
+        self.integral = 0.0
+
+    def gain_scale(self, angle):
+        if self.schedule is None:
+            return np.ones_like(angle)
+        breakpoints, scales = self.schedule
+        return np.interp(np.abs(angle), breakpoints, scales)
+
+    def _command(self, angle, rate, dt):
+        active = np.abs(angle) >= self.deadband
+        if self.ki:
+            self.integral = self.integral + np.where(active, angle * dt, 0.0)
+            if self.max_steps is not None:
+                limit = self.max_steps / abs(self.ki)
+                self.integral = np.clip(self.integral, -limit, limit)
+        steps = self.gain_scale(angle) * (self.kp * angle + self.ki * self.integral + self.kd * rate)
+        return np.where(active, steps, 0.0)
@@ -0,0 +1,356 @@
+""" Non-blocking command channels for the Haydon-Kerk motor controllers.
+
+    Each controller sits on its own serial port.  A MotorChannel owns the port and
+    a writer thread, so callers (the balancing controller, the GUI) only queue
+    commands and never wait on the serial line.  Pitch and roll each have their own
+    channel and therefore move concurrently. """
+
+import collections
+import re
+import threading
+import time
+
+from csacs import clock
+from csacs.control import ControlLoop
+
+
+class MotorProfile(object):
+
+    """ Motion parameters of an index move, 'I<steps>,<tail>\r'.
+
+        The tail (everything after the step count) is the same for every move with a
+        profile, so it is formatted once here into a command template and a move only
+        formats its step count into that template: one formatting operation and one
+        encode per move, and per batch of moves with encode_batch(). """
+
+    FIELDS = ('run_speed', 'start_speed', 'end_speed', 'accel', 'decel', 'run_current',
+              'hold_current', 'accel_current', 'decel_current', 'delay', 'step_mode')
+
+    def __init__(self, name, run_speed=25600, start_speed=9600, end_speed=16000, accel=320000,
+                 decel=800000, run_current=490, hold_current=122, accel_current=490,
+                 decel_current=490, delay=50, step_mode=8):
+        self.name = name
+        self.run_speed = run_speed
+        self.start_speed = start_speed
+        self.end_speed = end_speed
+        self.accel = accel
+        self.decel = decel
+        self.run_current = run_current
+        self.hold_current = hold_current
+        self.accel_current = accel_current
+        self.decel_current = decel_current
+        self.delay = delay
+        self.step_mode = step_mode
+        tail = ''.join(',%d' % getattr(self, field) for field in self.FIELDS) + '\r'
+        self._template = 'I%d' + tail.replace('%', '%%')
+
+    def __repr__(self):
+        return 'MotorProfile(%r)' % self.name
+
+    def duration(self, steps):
+        """ Predicted time in seconds for a move of steps, from the trapezoidal
+            speed profile: accelerate from start_speed to run_speed, cruise, and
+            decelerate to end_speed (or a triangular profile if the move is too
+            short to reach run_speed).
+
+            The speeds and accelerations are taken to be in full steps per second
+            (per second), and steps in 1/step_mode microsteps; with that reading the
+            largest ladder move (500000 steps at 1/8) takes 2.5 s, well inside the 5 s
+            the balancing code used to wait for it. """
+        d = abs(float(steps)) / self.step_mode
+        if d == 0:
+            return 0.0
+        v0, v1, vr = float(self.start_speed), float(self.end_speed), float(self.run_speed)
+        a, b = float(self.accel), float(self.decel)
+        ramp_up = (vr * vr - v0 * v0) / (2 * a)
+        ramp_down = (vr * vr - v1 * v1) / (2 * b)
+        if ramp_up + ramp_down <= d:
+            return (vr - v0) / a + (vr - v1) / b + (d - ramp_up - ramp_down) / vr
+        # Triangular profile: the peak speed is reached halfway through the ramps
+        peak = ((2 * d + v0 * v0 / a + v1 * v1 / b) / (1 / a + 1 / b)) ** 0.5
+        if peak <= max(v0, v1):
+            return d / max(v0, v1)
+        return (peak - v0) / a + (peak - v1) / b
+
+    def encode(self, steps):
+        """ Returns the move command for steps as bytes. """
+        return (self._template % steps).encode('ascii')
+
+    def encode_batch(self, steps):
+        """ Encodes a sequence of moves into one bytes object, ready for a single write. """
+        template = self._template
+        return ''.join([template % n for n in steps]).encode('ascii')
+
+
+# The two profiles the balancing code has always used: 1/8 microsteps for coarse
+# moves and 1/64 for fine adjustment.
+PROFILES = dict((profile.name, profile) for profile in (MotorProfile('coarse', step_mode=8),
+                                                         MotorProfile('fine', step_mode=64)))
+DEFAULT_PROFILE = PROFILES['coarse']
+
+
+def profile(name):
+    """ Returns the named entry of PROFILES. """
+    return PROFILES[name]
+
+
+class MotorCommand(object):
+
+    """ Handle for a queued command.
+
+        sent is set once the command has been written to the port, done once it has
+        completed (its reply was read, or straight after the write when neither the
+        command nor the channel expects a reply).  reply holds the bytes read back, error the
+        exception if writing failed or the channel was stopped before the command was
+        written.  Moves that were coalesced share one handle. """
+
+    def __init__(self, steps=None, profile=DEFAULT_PROFILE, data=None, expects_reply=False):
+        self.steps = steps
+        self.profile = profile
+        self.data = data
+        self.expects_reply = expects_reply
+        self.queued = clock.monotonic()
+        self.sent_at = None
+        self.finish_at = None   # Predicted end of a move, in csacs.clock time
+        self.reply = None
+        self.error = None
+        self.sent = threading.Event()
+        self.done = threading.Event()
+
+    @property
+    def is_move(self):
+        return self.steps is not None
+
+    def wait(self, timeout=None):
+        """ Waits until the command has completed; returns False on timeout. """
+        return self.done.wait(timeout)
+
+
+class MotorChannel(object):
+
+    """ Command queue and writer thread for one motor controller.
+
+        port is an open serial.Serial (or anything with write() and read_until()).
+        move() queues a relative move; a move queued while the previous move has not
+        been sent yet is merged into it (relative moves add up), so a controller
+        running faster than the port never builds up a backlog of stale corrections.
+        send() queues raw bytes that are never merged, query() raw bytes whose reply
+        is read back.
+
+        Every move written gets a predicted finish_at from its profile (see
+        MotorProfile.duration()), and settled() tells whether the actuator should be
+        at rest.  commanded is the position (in full steps, relative to where the
+        actuator was when the channel was opened) that the moves written so far add
+        up to.
+
+        If expect_ack is set, the writer reads a reply up to ack_terminator after
+        every command and keeps it in MotorCommand.reply; the command only counts as
+        done after that.  sent, acked and coalesced count commands for diagnostics. """
+
+    def __init__(self, port, name='motor', expect_ack=False, ack_terminator=b'\r'):
+        self.port = port
+        self.name = name
+        self.expect_ack = expect_ack
+        self.ack_terminator = ack_terminator
+        self.sent = 0
+        self.acked = 0
+        self.coalesced = 0
+        self.commanded = 0.0
+        self.finish_at = 0.0        # Predicted end of the last move written
+        self.last = None            # Last command written to the port
+        self._queue = collections.deque()
+        self._cv = threading.Condition()
+        self._in_flight = None
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=self.name + '-writer')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """ Stops the writer after the command in flight; queued commands are dropped,
+            completing with a RuntimeError in their error. """
+        with self._cv:
+            self._running = False
+            while self._queue:
+                command = self._queue.popleft()
+                command.error = RuntimeError(self.name + ' channel stopped')
+                command.sent.set()
+                command.done.set()
+            self._cv.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def move(self, steps, profile=DEFAULT_PROFILE):
+        """ Queues a relative move with a MotorProfile and returns its MotorCommand. """
+        with self._cv:
+            if self._queue and self._queue[-1].is_move and self._queue[-1].profile is profile:
+                pending = self._queue[-1]
+                pending.steps += steps
+                self.coalesced += 1
+                return pending
+            return self._put(MotorCommand(steps, profile))
+
+    def send(self, data):
+        """ Queues raw bytes and returns their MotorCommand. """
+        with self._cv:
+            return self._put(MotorCommand(data=data))
+
+    def query(self, data):
+        """ Queues raw bytes and reads back the reply; wait on the returned
+            MotorCommand and look at its reply. """
+        with self._cv:
+            return self._put(MotorCommand(data=data, expects_reply=True))
+
+    def settled(self, now=None):
+        """ True when nothing is queued and the last move should have finished. """
+        if now is None:
+            now = clock.monotonic()
+        return not self.busy and now >= self.finish_at
+
+    @property
+    def busy(self):
+        """ True while commands are queued or being written. """
+        with self._cv:
+            return bool(self._queue) or self._in_flight is not None
+
+    def wait_idle(self, timeout=None):
+        """ Waits until every queued command has completed; returns False on timeout. """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cv:
+            while self._queue or self._in_flight is not None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cv.wait(remaining)
+        return True
+
+    def _put(self, command):
+        self._queue.append(command)
+        self._cv.notify_all()
+        return command
+
+    def _run(self):
+        while True:
+            with self._cv:
+                while self._running and not self._queue:
+                    self._cv.wait()
+                if not self._running:
+                    return
+                command = self._in_flight = self._queue.popleft()
+
+            try:
+                if command.is_move and command.steps == 0:
+                    pass    # Moves that cancelled out while queued
+                else:
+                    data = command.profile.encode(command.steps) if command.is_move else command.data
+                    self.port.write(data)
+                    if command.is_move:
+                        self.commanded += float(command.steps) / command.profile.step_mode
+                    command.sent_at = clock.monotonic()
+                    self.sent += 1
+                    if command.is_move:
+                        # The move starts once the command is through the UART (10 bits a
+                        # byte), or after the previous move if that is still running
+                        start = max(command.sent_at + 10.0 * len(data) / getattr(self.port, 'baudrate', 57600),
+                                    self.finish_at)
+                        command.finish_at = self.finish_at = start + command.profile.duration(command.steps)
+                command.sent.set()
+                if (self.expect_ack or command.expects_reply) and command.sent_at is not None:
+                    command.reply = self.port.read_until(self.ack_terminator)
+                    if command.reply.endswith(self.ack_terminator):
+                        self.acked += 1
+            except Exception as e:
+                command.error = e
+                command.sent.set()
+
+            with self._cv:
+                self.last = command
+                self._in_flight = None
+                command.done.set()
+                self._cv.notify_all()
+
+
+def parse_position(reply):
+    """ Returns the first (signed) integer in a controller reply, or None. """
+    match = re.search(br'-?\d+', reply or b'')
+    return int(match.group()) if match else None
+
+
+class ActuatorMonitor(object):
+
+    """ Keeps the actuator positions in a telemetry.TelemetryStore up to date.
+
+        channels maps store fields (HELD_FIELDS) to MotorChannels.  Every period
+        seconds each controller is sent query, and parse(reply) * scale is held in
+        the store (see TelemetryStore.hold()), so every following sensor sample carries
+        the actuator position measured just before it.  Queries go through the
+        channel's queue and so never interleave with a move being written.  A reply
+        that is missing after timeout seconds or cannot be parsed counts in errors
+        and leaves the old value; a controller is not queried again until it has
+        answered, so unanswered queries do not pile up ahead of the moves.
+
+        Without a query the commanded position of each channel (the sum of the moves
+        written so far) is recorded instead.
+
+        With a query, stopped() tells from the readback whether an actuator has come
+        to rest, which is more reliable than the predicted MotorChannel.finish_at. """
+
+    def __init__(self, store, channels, query=None, parse=parse_position, scale=1.0,
+                 period=0.2, timeout=0.5):
+        self.store = store
+        self.channels = channels
+        self.query = query
+        self.parse = parse
+        self.scale = scale
+        self.timeout = timeout
+        self.errors = 0
+        self.positions = dict((field, float('nan')) for field in channels)
+        self._readings = dict((field, collections.deque(maxlen=2)) for field in channels)
+        self._pending = {}      # Unanswered query (MotorCommand) of each field
+        self.loop = ControlLoop(self._poll, period, name='actuator-monitor')
+
+    def start(self):
+        self.loop.start()
+
+    def stopped(self, field, since):
+        """ True if the last two position readings of field were both taken after
+            since (a csacs.clock time) and are equal. """
+        readings = self._readings[field]
+        return (len(readings) == 2 and readings[0][0] > since and
+                readings[0][1] == readings[1][1])
+
+    def stop(self):
+        self.loop.stop()
+
+    def _poll(self, now):
+        if self.query is None:
+            for field, channel in self.channels.items():
+                self._record(field, channel.commanded)
+            return
+
+        # Query every controller first so that they answer concurrently
+        for field, channel in self.channels.items():
+            if field not in self._pending:
+                self._pending[field] = channel.query(self.query)
+        for field, command in list(self._pending.items()):
+            if not command.wait(self.timeout):
+                self.errors += 1
+                continue
+            del self._pending[field]
+            position = self.parse(command.reply)
+            if position is None:
+                self.errors += 1
+            else:
+                self._readings[field].append((command.sent_at, position))
+                self._record(field, position * self.scale)
+
+    def _record(self, field, position):
+        self.positions[field] = position
+        self.store.hold(field, position)
@@ -0,0 +1,121 @@
+""" Live plotting of telemetry with matplotlib blitting.
+
+    Redrawing a whole figure (axes, ticks, labels, titles) is by far the most
+    expensive thing the GUI does, so LivePlot creates every Line2D once and on each
+    frame only restores the cached axes background and redraws the lines.  The full
+    figure is redrawn only when the time axis has to scroll, which happens once
+    every scroll * window seconds rather than every frame. """
+
+import time
+
+import numpy as np
+
+from csacs.decimate import minmax
+
+
+class LivePlot(object):
+
+    """ Plots the newest window seconds of a telemetry.TelemetryStore against elapsed time.
+
+        Call add_panel() for each axes, then start().  Frames are drawn from a canvas
+        timer at fps frames per second, independently of the sensor rate (rate_hz is
+        only used to know how many samples cover the window).  When the newest sample
+        reaches the right edge the x axis jumps ahead by scroll * window.
+
+        Each line is passed through decimate (see csacs.decimate) down to two points
+        per pixel column of its axes, so the cost of a frame is bounded by the canvas
+        width rather than by window * rate_hz; long windows stay responsive.  Pass
+        decimate=None to plot every sample. """
+
+    def __init__(self, fig, store, rate_hz, window=50.0, fps=20, scroll=0.25, decimate=minmax):
+        self.fig = fig
+        self.store = store
+        self.rate_hz = rate_hz
+        self.window = window
+        self.fps = fps
+        self.scroll = scroll
+        self.decimate = decimate
+        self.frames = 0
+        self.frame_time = 0.0   # Seconds spent in the last frame
+        self._panels = []
+        self._fields = ['elapsed']
+        self._backgrounds = None
+        self._timer = None
+        self._cid = None
+
+    def add_panel(self, ax, fields, labels, ylim, title='', ylabel='', xlabel=''):
+        """ Sets up ax once (title, labels, limits) and adds one line per store field. """
+        ax.set_title(title)
+        ax.set_ylabel(ylabel)
+        ax.set_xlabel(xlabel)
+        ax.set_ylim(ylim)
+        ax.set_xlim(0, self.window)
+        ax.get_yaxis().get_major_formatter().set_useOffset(False)
+        ax.tick_params(axis='x', labelrotation=45) # Rotates time labels by 45 Deg
+        lines = []
+        for field, label in zip(fields, labels):
+            line, = ax.plot([], [], label=label, animated=True)
+            if field not in self._fields:
+                self._fields.append(field)
+            lines.append((self._fields.index(field), line))
+        self._panels.append((ax, lines))
+
+    def start(self):
+        canvas = self.fig.canvas
+        self._cid = canvas.mpl_connect('draw_event', self._on_draw)
+        self._timer = canvas.new_timer(interval=int(1000.0 / self.fps))
+        self._timer.add_callback(self.update)
+        self._timer.start()
+
+    def stop(self):
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        if self._cid is not None:
+            self.fig.canvas.mpl_disconnect(self._cid)
+            self._cid = None
+
+    def update(self):
+        """ Draws one frame. """
+        started = time.monotonic()
+        columns = self.store.columns(self._fields, int(np.ceil(self.window * self.rate_hz)))
+        elapsed = columns[0]
+        if len(elapsed) == 0:
+            return
+
+        for ax, lines in self._panels:
+            n_out = 2 * max(int(ax.bbox.width), 1)
+            for index, line in lines:
+                if self.decimate is not None:
+                    line.set_data(*self.decimate(elapsed, columns[index], n_out))
+                else:
+                    line.set_data(elapsed, columns[index])
+
+        xmin, xmax = self._panels[0][0].get_xlim()
+        if self._backgrounds is None or elapsed[-1] > xmax:
+            if elapsed[-1] > xmax:
+                xmax = elapsed[-1] + self.scroll * self.window
+                for ax, lines in self._panels:
+                    ax.set_xlim(xmax - self.window, xmax)
+            # Full redraw; _on_draw caches the new backgrounds and draws the lines
+            self.fig.canvas.draw()
+        else:
+            self._blit()
+
+        self.frames += 1
+        self.frame_time = time.monotonic() - started
+
+    def _on_draw(self, event):
+        canvas = self.fig.canvas
+        self._backgrounds = [canvas.copy_from_bbox(ax.bbox) for ax, lines in self._panels]
+        for ax, lines in self._panels:
+            for index, line in lines:
+                ax.draw_artist(line)
+
+    def _blit(self):
+        canvas = self.fig.canvas
+        for (ax, lines), background in zip(self._panels, self._backgrounds):
+            canvas.restore_region(background)
+            for index, line in lines:
+                ax.draw_artist(line)
+            canvas.blit(ax.bbox)
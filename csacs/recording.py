@@ -0,0 +1,280 @@
+""" Recording and replay of the raw byte stream of a VN-100.
+
+    RawRecorder writes every chunk of bytes a VnSensor reads from its port, before
+    it is parsed, to a log together with the time it arrived.  Replayer feeds such
+    a log back through a vnpy.MemoryPort to a VnSensor, whose packet finder and
+    parsers then see exactly the bytes of the original session.  Everything
+    downstream (EzAsyncData, AsyncAcquisition, the controller, the GUI) runs as it
+    did on the hardware, in real time, N times faster or as fast as it can.
+
+    Log format (little endian): a header of magic 'CSACSRAW', version (uint16)
+    and the wall clock time the recording started (float64, time.time()), then one
+    record per chunk: the time since the start in seconds (float64, csacs.clock
+    time), the length (uint32) and the bytes.
+
+        python -m csacs.recording record session.raw [--port ...] [--duration S]
+        python -m csacs.recording replay session.raw [--speed N | --max] [--spill out.bin]
+        python -m csacs.recording decode session.raw [--output columns.npz]
+
+    CSACS_v4.0.py takes --record PATH and --replay PATH as well. """
+
+import argparse
+import re
+import struct
+import threading
+import time
+
+from vnpy import VnSensor, EzAsyncData, MemoryPort
+
+from csacs import clock
+from csacs.simulation import ascii_packet
+
+MAGIC = b'CSACSRAW'
+VERSION = 1
+HEADER = struct.Struct('<8sHd')
+RECORD = struct.Struct('<dI')
+
+
+class RawRecorder(object):
+
+    """ Logs the raw bytes received by sensor (a connected vnpy.VnSensor) to path.
+
+        The bytes are written on the thread that reads the port, through a buffered
+        file, so recording costs one small write per read.  bytes and chunks count
+        what has been written. """
+
+    def __init__(self, sensor, path):
+        self.sensor = sensor
+        self.path = path
+        self.bytes = 0
+        self.chunks = 0
+        self._file = None
+        self._origin = 0.0
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._file is not None:
+                return
+            self._file = open(self.path, 'wb')
+            self._file.write(HEADER.pack(MAGIC, VERSION, time.time()))
+            self._origin = clock.monotonic()
+        self.sensor.register_raw_data_received_handler(self._on_data)
+
+    def stop(self):
+        if self._file is None:
+            return
+        self.sensor.unregister_raw_data_received_handler()
+        with self._lock:
+            self._file.close()
+            self._file = None
+
+    def _on_data(self, data, running_index):
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(RECORD.pack(clock.monotonic() - self._origin, len(data)))
+            self._file.write(data)
+            self.bytes += len(data)
+            self.chunks += 1
+
+
+def read_recording(path):
+    """ Returns (start, chunks) of a log: the wall clock time the recording started
+        and a list of (time, bytes) in the order they were received. """
+    with open(path, 'rb') as f:
+        content = f.read()
+    magic, version, start = HEADER.unpack_from(content)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('%s is not a raw sensor recording' % path)
+    chunks = []
+    offset = HEADER.size
+    while offset + RECORD.size <= len(content):
+        t, length = RECORD.unpack_from(content, offset)
+        offset += RECORD.size
+        chunks.append((t, content[offset:offset + length]))
+        offset += length
+    return start, chunks
+
+
+class Replayer(object):
+
+    """ Plays a recording back into a vnpy.MemoryPort on a background thread.
+
+        Every chunk is delivered when speed times the csacs.clock time since start()
+        has reached its recorded time, so the clock speed and speed together set the
+        replay speed.  With speed None the chunks are delivered as fast as the
+        receiving side takes them, in batches of up to batch_size bytes; enable the
+        EzAsyncData queue with OVERFLOW_BLOCK to receive every packet then.
+
+        Commands the sensor writes (e.g. from AsyncAcquisition.configure()) are
+        acknowledged so they succeed, but do not change the recorded stream.
+        done is set once the whole recording has been delivered. """
+
+    def __init__(self, path, speed=1.0, batch_size=65536):
+        self.path = path
+        self.speed = speed
+        self.batch_size = batch_size
+        self.start_time, self.chunks = read_recording(path)
+        self.duration = self.chunks[-1][0] if self.chunks else 0.0
+        self.delivered = 0      # Chunks delivered so far
+        self.port = MemoryPort()
+        self.port.register_data_written_handler(self._on_written)
+        self.done = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def connect(self):
+        """ Returns an EzAsyncData connected to the replayed sensor. """
+        sensor = VnSensor()
+        sensor.connect(self.port)
+        return EzAsyncData(sensor)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='replay')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        if self.speed is None:
+            self._run_unpaced()
+        else:
+            self._run_paced()
+        self.done.set()
+
+    def _run_paced(self):
+        origin = clock.monotonic()
+        chunks = self.chunks
+        n = len(chunks)
+        while self.delivered < n and not self._stop.is_set():
+            now = (clock.monotonic() - origin) * self.speed
+            end = self.delivered
+            while end < n and chunks[end][0] <= now:
+                end += 1
+            if end > self.delivered:
+                self.port.send_data_back_door(b''.join([data for _, data in chunks[self.delivered:end]]))
+                self.delivered = end
+            if end < n:
+                clock.wait(self._stop, min((chunks[end][0] - now) / self.speed, 0.01))
+
+    def _run_unpaced(self):
+        batch = []
+        size = 0
+        for _, data in self.chunks:
+            if self._stop.is_set():
+                return
+            batch.append(data)
+            size += len(data)
+            if size >= self.batch_size:
+                self.port.send_data_back_door(b''.join(batch))
+                self.delivered += len(batch)
+                batch, size = [], 0
+        if batch:
+            self.port.send_data_back_door(b''.join(batch))
+            self.delivered += len(batch)
+
+    def _on_written(self, data):
+        for name, arguments in re.findall(br'\$(VN[A-Z]{3})([^*\r\n]*)', data):
+            self.port.send_data_back_door(ascii_packet((name + arguments).decode('ascii')))
+
+
+def record(args):
+    ez = EzAsyncData.connect(args.port, args.baudrate)
+    recorder = RawRecorder(ez.sensor, args.path)
+    recorder.start()
+    try:
+        if args.duration:
+            time.sleep(args.duration)
+        else:
+            print('Recording to %s, press Ctrl-C to stop' % args.path)
+            while True:
+                time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    recorder.stop()
+    ez.disconnect()
+    print('%d bytes in %d chunks' % (recorder.bytes, recorder.chunks))
+
+
+def replay(args):
+    from csacs.acquisition import AsyncAcquisition
+    from csacs.telemetry import TelemetryStore
+
+    speed = None if args.max else 1.0
+    if not args.max:
+        clock.set_speed(args.speed)
+    replayer = Replayer(args.path, speed=speed)
+    ez = replayer.connect()
+    store = TelemetryStore(capacity=args.capacity, spill_path=args.spill)
+    acquisition = AsyncAcquisition(ez, store, overflow_policy=EzAsyncData.OVERFLOW_BLOCK)
+    acquisition.start()
+    started = time.monotonic()
+    replayer.start()
+    replayer.done.wait()
+    # Wait for the acquisition thread to drain what is still queued
+    received = -1
+    while received != acquisition.received:
+        received = acquisition.received
+        time.sleep(0.1)
+    elapsed = time.monotonic() - started
+    acquisition.stop()
+    replayer.stop()
+    store.close()
+    print('%.1f s of recording replayed in %.2f s (%.1fx), %d samples (%.0f/s), %d dropped' %
+          (replayer.duration, elapsed, replayer.duration / elapsed, acquisition.received,
+           acquisition.received / elapsed, acquisition.dropped))
+
+
+def decode(args):
+    import numpy as np
+    from vnpy import bulk
+    from csacs.acquisition import OUTPUT_FIELDS
+
+    started = time.monotonic()
+    _, chunks = read_recording(args.path)
+    columns = bulk.decode(b''.join([data for _, data in chunks]), bulk.BinaryLayout(common=OUTPUT_FIELDS))
+    elapsed = time.monotonic() - started
+    print('%d packets decoded in %.2f s' % (len(columns['time_startup']), elapsed))
+    if args.output:
+        np.savez(args.output, **columns)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0].strip())
+    commands = parser.add_subparsers(dest='command')
+    p = commands.add_parser('record', help='record the raw stream of a sensor')
+    p.add_argument('path')
+    p.add_argument('--port', default='/dev/ttyUSB1')
+    p.add_argument('--baudrate', type=int, default=115200)
+    p.add_argument('--duration', type=float, help='seconds (default: until Ctrl-C)')
+    p = commands.add_parser('replay', help='replay a recording into a telemetry store')
+    p.add_argument('path')
+    p.add_argument('--speed', type=float, default=1.0, help='times real time')
+    p.add_argument('--max', action='store_true', help='as fast as possible')
+    p.add_argument('--spill', help='keep the samples in this spill file (see TelemetryStore)')
+    p.add_argument('--capacity', type=int, default=200 * 60 * 5)
+    p = commands.add_parser('decode', help='decode the binary packets of a recording into NumPy columns')
+    p.add_argument('path')
+    p.add_argument('--output', help='save the columns to this .npz file')
+    args = parser.parse_args()
+    if args.command == 'record':
+        record(args)
+    elif args.command == 'replay':
+        replay(args)
+    elif args.command == 'decode':
+        decode(args)
+    else:
+        parser.print_help()
+
+
+if __name__ == '__main__':
+    main()
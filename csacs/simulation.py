@@ -0,0 +1,571 @@
+""" Hardware-free simulation of the air bearing, the VN-100 and the motor controllers.
+
+    AirBearing integrates the rigid-body attitude dynamics of the platform: gravity
+    acting on the centre of gravity, which the two balance mass actuators shift.
+    SimulatedSensor stands in for the VN-100 behind a vnpy.MemoryPort: it answers the
+    register reads and writes a VnSensor sends and streams ASCII or binary output
+    packets computed from the model.  SimulatedMotorPort stands in for the serial
+    port of a motor controller: it takes the index move commands that MotorChannel
+    writes and moves its actuator over the time the move profile takes.
+
+    Simulation ties them together and runs the model on its own thread at the IMU
+    rate, in step with csacs.clock.  Set the clock speed (csacs.clock.set_speed()) to
+    run the whole stack, controller and GUI included, faster than real time:
+
+        simulation = Simulation()
+        ez = simulation.connect()                   # instead of EzAsyncData.connect()
+        pitch_port = simulation.motor_ports['pitch']  # instead of serial.Serial()
+        simulation.start()
+
+    CSACS_v4.0.py --simulate runs the GUI this way, and
+
+        python -m csacs.simulation [--speed X] [--duration S] ...
+
+    runs the acquisition, controller and motor channels headless and reports how
+    long the platform took to balance. """
+
+import argparse
+import collections
+import math
+import random
+import re
+import struct
+import threading
+import time
+
+import numpy as np
+
+from vnpy import VnSensor, EzAsyncData, MemoryPort
+
+from csacs import clock
+from csacs.motors import MotorProfile
+
+IMU_RATE_HZ = 800   # Internal rate of the VN-100, and the rate the model is integrated at
+GRAVITY = 9.80665
+MAGNETIC_FIELD = (0.21, -0.02, 0.43)    # Local field in north, east, down axes, in Gauss
+
+
+class AirBearing(object):
+
+    """ Attitude dynamics of the platform on its spherical air bearing.
+
+        The body axes are x forward (pitch actuator), y right and z down, attitude is
+        a body-to-NED quaternion and angular rates are in rad/s.  mass is the total
+        mass in kg and inertia the principal moments of inertia (Ixx, Iyy, Izz) in
+        kg m^2 about the centre of rotation.  cg is the offset of the centre of
+        gravity from the centre of rotation in metres, with both actuators at zero.
+
+        Moving an actuator by one full step moves its mass of actuator_mass kg by
+        step_length metres along pitch_axis or roll_axis, shifting the centre of
+        gravity by actuator_mass / mass times that.  The axes are chosen so that
+        positive steps correct a positive angle, as the control laws expect.
+        damping is a viscous torque per rad/s standing in for the air drag.
+
+        The defaults give a platform whose attitude moves by about 1.6e-4 degrees
+        per full step, close to the model used by csacs.benchmark_laws. """
+
+    def __init__(self, mass=13.6, inertia=(0.5, 0.5, 0.8), cg=(0.0005, -0.0003, 0.042),
+                 actuator_mass=0.5, step_length=3.175e-6, pitch_axis=(1.0, 0.0, 0.0),
+                 roll_axis=(0.0, -1.0, 0.0), damping=0.3, ypr=(0.0, 0.0, 0.0)):
+        self.mass = float(mass)
+        self.inertia = tuple(float(i) for i in inertia)
+        self.cg = tuple(float(c) for c in cg)
+        self.actuator_mass = float(actuator_mass)
+        self.step_length = float(step_length)
+        self.pitch_axis = pitch_axis
+        self.roll_axis = roll_axis
+        self.damping = float(damping)
+        self.positions = (0.0, 0.0)     # Pitch and roll actuator positions in full steps
+        self.rates = (0.0, 0.0, 0.0)
+        self.set_attitude(*ypr)
+
+    def set_mass_properties(self, mass=None, inertia=None):
+        """ Changes the mass and/or the moments of inertia, e.g. from the GUI. """
+        if mass is not None:
+            self.mass = float(mass)
+        if inertia is not None:
+            self.inertia = tuple(float(i) for i in inertia)
+
+    def set_attitude(self, yaw, pitch, roll):
+        """ Sets the attitude from yaw, pitch and roll in degrees. """
+        cy, sy = math.cos(math.radians(yaw) / 2), math.sin(math.radians(yaw) / 2)
+        cp, sp = math.cos(math.radians(pitch) / 2), math.sin(math.radians(pitch) / 2)
+        cr, sr = math.cos(math.radians(roll) / 2), math.sin(math.radians(roll) / 2)
+        self.quaternion = (cy * cp * cr + sy * sp * sr,
+                           cy * cp * sr - sy * sp * cr,
+                           cy * sp * cr + sy * cp * sr,
+                           sy * cp * cr - cy * sp * sr)
+
+    def ypr(self):
+        """ Yaw, pitch and roll in degrees. """
+        w, x, y, z = self.quaternion
+        yaw = math.atan2(2 * (x * y + w * z), 1 - 2 * (y * y + z * z))
+        pitch = math.asin(max(-1.0, min(1.0, -2 * (x * z - w * y))))
+        roll = math.atan2(2 * (y * z + w * x), 1 - 2 * (x * x + y * y))
+        return math.degrees(yaw), math.degrees(pitch), math.degrees(roll)
+
+    def to_body(self, v):
+        """ Rotates a vector from NED into body axes. """
+        w, x, y, z = self.quaternion
+        n, e, d = v
+        return ((1 - 2 * (y * y + z * z)) * n + 2 * (x * y + w * z) * e + 2 * (x * z - w * y) * d,
+                2 * (x * y - w * z) * n + (1 - 2 * (x * x + z * z)) * e + 2 * (y * z + w * x) * d,
+                2 * (x * z + w * y) * n + 2 * (y * z - w * x) * e + (1 - 2 * (x * x + y * y)) * d)
+
+    def centre_of_gravity(self):
+        """ Offset of the centre of gravity from the centre of rotation, body axes, metres. """
+        shift = self.actuator_mass / self.mass * self.step_length
+        p, r = self.positions
+        return tuple(c + shift * (p * a + r * b) for c, a, b in zip(self.cg, self.pitch_axis, self.roll_axis))
+
+    def step(self, dt):
+        """ Advances the model by dt seconds (semi-implicit Euler). """
+        gx, gy, gz = self.to_body((0.0, 0.0, GRAVITY))
+        rx, ry, rz = self.centre_of_gravity()
+        m = self.mass
+        # Gravity torque r x (m g) about the centre of rotation
+        tx = m * (ry * gz - rz * gy)
+        ty = m * (rz * gx - rx * gz)
+        tz = m * (rx * gy - ry * gx)
+
+        # Euler's equations: I dw/dt = torque - w x (I w) - damping w
+        ix, iy, iz = self.inertia
+        p, q, r = self.rates
+        c = self.damping
+        p, q, r = (p + dt * (tx - (iz - iy) * q * r - c * p) / ix,
+                   q + dt * (ty - (ix - iz) * r * p - c * q) / iy,
+                   r + dt * (tz - (iy - ix) * p * q - c * r) / iz)
+        self.rates = (p, q, r)
+
+        w, x, y, z = self.quaternion
+        h = 0.5 * dt
+        w, x, y, z = (w - h * (x * p + y * q + z * r),
+                      x + h * (w * p + y * r - z * q),
+                      y + h * (w * q - x * r + z * p),
+                      z + h * (w * r + x * q - y * p))
+        norm = math.sqrt(w * w + x * x + y * y + z * z)
+        self.quaternion = (w / norm, x / norm, y / norm, z / norm)
+
+
+def checksum8(data):
+    """ 8-bit XOR checksum of an ASCII packet body, as bytes. """
+    value = 0
+    for b in bytearray(data):
+        value ^= b
+    return value
+
+
+def crc16(data):
+    """ CRC-16-CCITT of a binary packet, as computed by the VN-100. """
+    crc = 0
+    for b in bytearray(data):
+        crc = ((crc >> 8) | (crc << 8)) & 0xFFFF
+        crc ^= b
+        crc ^= (crc & 0xFF) >> 4
+        crc ^= (crc << 12) & 0xFFFF
+        crc ^= ((crc & 0xFF) << 5) & 0xFFFF
+    return crc
+
+
+def ascii_packet(body):
+    """ Frames an ASCII packet body (e.g. 'VNYPR,...') with '$', checksum and CRLF. """
+    body = body.encode('ascii')
+    return b'$' + body + ('*%02X\r\n' % checksum8(body)).encode('ascii')
+
+
+# Common group fields of the binary output in bit order: struct format and a function
+# of the measurement (see SimulatedSensor._measure()).  Fields the model has nothing
+# for are sent as zeros.
+_ZERO = lambda n: (lambda m: (0,) * n)
+COMMON_FIELDS = (
+    ('<Q', lambda m: (m['time_ns'],)),                              # TimeStartup
+    ('<Q', _ZERO(1)),                                               # TimeGps
+    ('<Q', _ZERO(1)),                                               # TimeSyncIn
+    ('<3f', lambda m: m['ypr']),                                    # YawPitchRoll
+    ('<4f', lambda m: m['quaternion']),                             # Quaternion
+    ('<3f', lambda m: m['rate']),                                   # AngularRate
+    ('<3d', _ZERO(3)),                                              # Position
+    ('<3f', _ZERO(3)),                                              # Velocity
+    ('<3f', lambda m: m['accel']),                                  # Accel
+    ('<6f', lambda m: m['accel'] + m['rate']),                      # Imu
+    ('<5f', lambda m: m['mag'] + (25.0, 101.325)),                  # MagPres
+    ('<7f', _ZERO(7)),                                              # DeltaTheta
+    ('<H', _ZERO(1)),                                               # InsStatus
+    ('<I', _ZERO(1)),                                               # SyncInCnt
+    ('<Q', _ZERO(1)),                                               # TimeGpsPps
+)
+
+ASYNC_OUTPUT_TYPES = {0: None, 1: 'VNYPR', 2: 'VNQTN', 14: 'VNYMR'}
+ASYNC_OUTPUT_FREQUENCIES = (1, 2, 4, 5, 10, 20, 25, 40, 50, 100, 200)
+
+# VN-100 error codes used in $VNERR replies
+ERROR_INVALID_COMMAND = 4
+ERROR_INVALID_PARAMETER = 7
+ERROR_INVALID_REGISTER = 8
+
+
+class SimulatedSensor(object):
+
+    """ VN-100 behind a vnpy.MemoryPort, measuring an AirBearing.
+
+        Commands written by the VnSensor connected to port are answered at once.
+        Register 6 (async data output type: off, VNYPR, VNQTN or VNYMR), 7 (async
+        data output frequency) and 75 (binary output 1, common group only) configure
+        the output; writes to other registers are acknowledged and ignored.  Reset
+        and restore factory settings go back to VNYMR at 40 Hz with binary output off.
+
+        sample() is called once per IMU tick and returns the output packets due.
+        noise is the standard deviation of the white noise added to the measured
+        angles (degrees) and rates (degrees per second). """
+
+    MODEL = 'VN-100T-SIM'
+
+    def __init__(self, port, model, noise=(0.005, 0.02), seed=None):
+        self.port = port
+        self.model = model
+        self.angle_noise, self.rate_noise = noise
+        self.commands = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tick = 0
+        self.reset()
+        port.register_data_written_handler(self._on_written)
+
+    def reset(self):
+        with self._lock:
+            self.async_type = 14
+            self.async_frequency = 40
+            self.binary = (0, 1, 0, 0)  # Async mode, rate divisor, output groups, common fields
+            self._binary_fields = ()
+
+    def sample(self, t):
+        """ Returns the packets (bytes) output at time t seconds since startup. """
+        with self._lock:
+            self._tick += 1
+            mode, divisor, groups, fields = self.binary
+            binary = mode and self._tick % divisor == 0
+            ascii = (ASYNC_OUTPUT_TYPES[self.async_type] is not None and
+                     self._tick % (IMU_RATE_HZ // self.async_frequency) == 0)
+            if not binary and not ascii:
+                return b''
+            m = self._measure(t)
+            out = []
+            if binary:
+                payload = b''.join([s.pack(*value(m)) for s, value in self._binary_fields])
+                body = struct.pack('<BH', 0x01, fields) + payload
+                out.append(b'\xfa' + body + struct.pack('>H', crc16(body)))
+            if ascii:
+                out.append(self._ascii_output(m))
+            return b''.join(out)
+
+    def _measure(self, t):
+        model = self.model
+        gauss = self._random.gauss
+        yaw, pitch, roll = model.ypr()
+        yaw = (yaw + gauss(0.0, self.angle_noise) + 180.0) % 360.0 - 180.0
+        noise = math.radians(self.rate_noise)
+        w, x, y, z = model.quaternion
+        return {'time_ns': int(round(t * 1e9)),
+                'ypr': (yaw, pitch + gauss(0.0, self.angle_noise), roll + gauss(0.0, self.angle_noise)),
+                'quaternion': (x, y, z, w),
+                'rate': tuple(r + gauss(0.0, noise) for r in model.rates),
+                'accel': tuple(-g for g in model.to_body((0.0, 0.0, GRAVITY))),
+                'mag': model.to_body(MAGNETIC_FIELD)}
+
+    def _ascii_output(self, m):
+        kind = ASYNC_OUTPUT_TYPES[self.async_type]
+        values = ['%+08.3f' % v for v in m['ypr']]
+        if kind == 'VNQTN':
+            values = ['%+09.6f' % v for v in m['quaternion']]
+        elif kind == 'VNYMR':
+            values += (['%+07.4f' % v for v in m['mag']] + ['%+07.3f' % v for v in m['accel']] +
+                       ['%+09.6f' % v for v in m['rate']])
+        return ascii_packet(kind + ',' + ','.join(values))
+
+    def _on_written(self, data):
+        # Called on the thread that writes, in the middle of the VnSensor transaction,
+        # which is already waiting for the reply.
+        for command in re.findall(br'\$(VN[A-Z]{3})([^*\r\n]*)', data):
+            self.commands += 1
+            self.port.send_data_back_door(ascii_packet(self._reply(*[c.decode('ascii') for c in command])))
+
+    def _reply(self, name, arguments):
+        args = arguments.lstrip(',').split(',') if arguments else []
+        if name in ('VNRST', 'VNRFS'):
+            self.reset()
+            return name
+        if name in ('VNWNV', 'VNTAR', 'VNKMD', 'VNKAD', 'VNSPS', 'VNSPO'):
+            return name
+        if name not in ('VNRRG', 'VNWRG') or not args:
+            return 'VNERR,%02d' % ERROR_INVALID_COMMAND
+        try:
+            register = int(args[0])
+            values = [int(a, 16) if register == 75 and i >= 2 else int(a) for i, a in enumerate(args[1:])]
+        except ValueError:
+            return 'VNERR,%02d' % ERROR_INVALID_PARAMETER
+        with self._lock:
+            if name == 'VNWRG':
+                error = self._write_register(register, values)
+                if error:
+                    return 'VNERR,%02d' % error
+                return 'VNWRG,' + ','.join(args)
+            value = self._read_register(register)
+            if value is None:
+                return 'VNERR,%02d' % ERROR_INVALID_REGISTER
+            return 'VNRRG,%02d,%s' % (register, value)
+
+    def _write_register(self, register, values):
+        if register == 6:
+            if len(values) != 1 or values[0] not in ASYNC_OUTPUT_TYPES:
+                return ERROR_INVALID_PARAMETER
+            self.async_type = values[0]
+        elif register == 7:
+            if len(values) != 1 or values[0] not in ASYNC_OUTPUT_FREQUENCIES:
+                return ERROR_INVALID_PARAMETER
+            self.async_frequency = values[0]
+        elif register == 75:
+            # async mode, rate divisor, output groups, then one field mask per group
+            if len(values) < 3 or values[1] < 1 or values[2] & ~0x01:
+                return ERROR_INVALID_PARAMETER
+            fields = values[3] if values[2] else 0
+            self.binary = (values[0] if fields else 0, values[1], values[2], fields)
+            self._binary_fields = tuple((struct.Struct(fmt), value)
+                                        for bit, (fmt, value) in enumerate(COMMON_FIELDS)
+                                        if fields & (1 << bit))
+        return None
+
+    def _read_register(self, register):
+        if register == 1:
+            return self.MODEL
+        if register == 6:
+            return '%d' % self.async_type
+        if register == 7:
+            return '%d' % self.async_frequency
+        if register == 75:
+            mode, divisor, groups, fields = self.binary
+            return '%d,%d,%X' % (mode, divisor, groups) + (',%X' % fields if groups else '')
+        return None
+
+
+class SimulatedMotorPort(object):
+
+    """ Serial port of a simulated Haydon-Kerk motor controller.
+
+        Has the parts of serial.Serial that MotorChannel uses: write(), read_until(),
+        baudrate and timeout.  Every index move written ('I<steps>,<profile>\\r', see
+        MotorProfile) starts when the previous one has finished and takes the time
+        its profile predicts; position() is the actuator position in full steps at a
+        csacs.clock time, moving linearly during a move.  query, if set, is a command
+        the controller answers with '<position>\\r' (see ActuatorMonitor); other
+        commands are ignored. """
+
+    def __init__(self, name='motor', query=None, baudrate=57600, timeout=2):
+        self.name = name
+        self.query = query
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.moves = 0
+        self._base = 0.0
+        self._moves = collections.deque()  # (start, end, steps) of moves not yet folded into _base
+        self._input = b''
+        self._output = b''
+        self._cv = threading.Condition()
+
+    def position(self, t=None):
+        if t is None:
+            t = clock.monotonic()
+        with self._cv:
+            return self._position(t)
+
+    def write(self, data):
+        now = clock.monotonic()
+        with self._cv:
+            self._input += data
+            *commands, self._input = self._input.split(b'\r')
+            for command in commands:
+                self._command(command, now)
+            self._cv.notify_all()
+        return len(data)
+
+    def read_until(self, terminator=b'\n', size=None):
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        with self._cv:
+            while terminator not in self._output:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._cv.wait(remaining)
+            end = self._output.find(terminator)
+            end = len(self._output) if end < 0 else end + len(terminator)
+            data, self._output = self._output[:end], self._output[end:]
+            return data
+
+    def close(self):
+        pass
+
+    def _command(self, command, now):
+        if command.startswith(b'I'):
+            try:
+                values = [int(v) for v in command[1:].split(b',')]
+                profile = MotorProfile(self.name, **dict(zip(MotorProfile.FIELDS, values[1:])))
+            except (ValueError, TypeError):
+                return
+            start = max(now, self._moves[-1][1]) if self._moves else now
+            duration = profile.duration(values[0])
+            if duration > 0:
+                self._moves.append((start, start + duration, float(values[0]) / profile.step_mode))
+                self.moves += 1
+        elif self.query is not None and command + b'\r' == self.query:
+            self._output += ('%d\r' % round(self._position(now))).encode('ascii')
+
+    def _position(self, t):
+        while self._moves and self._moves[0][1] <= t:
+            self._base += self._moves.popleft()[2]
+        position = self._base
+        for start, end, steps in self._moves:
+            if t > start:
+                position += steps * (t - start) / (end - start)
+        return position
+
+
+class Simulation(object):
+
+    """ Runs an AirBearing with a SimulatedSensor and pitch and roll
+        SimulatedMotorPorts on a background thread.
+
+        The model is advanced at the IMU rate to the current csacs.clock time in
+        batches, and the output packets of each batch are delivered to the sensor in
+        one MemoryPort write.  lag is how far (in clock seconds) the model is behind
+        the clock, which grows if the clock speed is more than the computer can keep
+        up with. """
+
+    MAX_BATCH = IMU_RATE_HZ // 10   # Ticks per delivery, so packets arrive at least every 0.1 s
+
+    def __init__(self, model=None, noise=(0.005, 0.02), query=None, seed=None):
+        self.model = model if model is not None else AirBearing()
+        self.port = MemoryPort()
+        self.sensor = SimulatedSensor(self.port, self.model, noise, seed)
+        self.motor_ports = {'pitch': SimulatedMotorPort('pitch', query),
+                            'roll': SimulatedMotorPort('roll', query)}
+        self.time = 0.0     # Model time, seconds since start()
+        self.lag = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def connect(self):
+        """ Returns an EzAsyncData connected to the simulated sensor. """
+        sensor = VnSensor()
+        sensor.connect(self.port)
+        return EzAsyncData(sensor)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='simulation')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        dt = 1.0 / IMU_RATE_HZ
+        model = self.model
+        pitch, roll = self.motor_ports['pitch'], self.motor_ports['roll']
+        origin = clock.monotonic() - self.time
+        while not self._stop.is_set():
+            now = clock.monotonic() - origin
+            out = []
+            ticks = 0
+            while self.time + dt <= now and ticks < self.MAX_BATCH:
+                self.time += dt
+                ticks += 1
+                model.positions = (pitch.position(origin + self.time), roll.position(origin + self.time))
+                model.step(dt)
+                out.append(self.sensor.sample(self.time))
+            data = b''.join(out)
+            if data:
+                self.port.send_data_back_door(data)
+            self.lag = now - self.time
+            if ticks < self.MAX_BATCH:
+                self._stop.wait(0.002)
+
+
+def main():
+    from csacs.acquisition import AsyncAcquisition
+    from csacs.benchmark_laws import convergence_times
+    from csacs.control import ControlLoop
+    from csacs.laws import LadderLaw, CubicLaw, PIDLaw
+    from csacs.motors import MotorChannel
+    from csacs.telemetry import TelemetryStore
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0].strip())
+    parser.add_argument('--speed', type=float, default=10.0, help='clock speed, times real time')
+    parser.add_argument('--duration', type=float, default=300.0, help='simulated seconds')
+    parser.add_argument('--rate', type=int, default=200, help='sensor output rate in Hz')
+    parser.add_argument('--law', choices=('p', 'cubic', 'ladder'), default='p')
+    parser.add_argument('--period', type=float, default=0.05, help='controller period in seconds')
+    parser.add_argument('--settle', type=float, default=0.1,
+                        help='seconds to wait after a move has finished before the next one '
+                             '(SETTLE_MARGIN of CSACS_v4.0.py)')
+    parser.add_argument('--cg', type=float, nargs=3, default=(0.5, -0.3, 42.0), metavar=('X', 'Y', 'Z'),
+                        help='centre of gravity offset in mm')
+    parser.add_argument('--tolerance', type=float, default=0.05)
+    args = parser.parse_args()
+
+    clock.set_speed(args.speed)
+    simulation = Simulation(AirBearing(cg=[c * 1e-3 for c in args.cg]), seed=0)
+    ez = simulation.connect()
+    store = TelemetryStore(capacity=int(args.rate * args.duration * 1.1))
+    acquisition = AsyncAcquisition(ez, store, rate_hz=args.rate)
+    acquisition.configure()
+    motors = [MotorChannel(simulation.motor_ports[axis], name=axis + '-motor') for axis in ('pitch', 'roll')]
+    law = {'p': PIDLaw(kp=1500, max_steps=500000),
+           'cubic': CubicLaw(500),
+           'ladder': LadderLaw()}[args.law]
+
+    def balance(now):
+        sample = store.latest()
+        ready = [motor.settled(now - args.settle) for motor in motors]
+        if sample is None or not any(ready):
+            return
+        steps = law.command(sample[[2, 3]], np.degrees(sample[[5, 6]]), args.period)
+        for motor, n, go in zip(motors, steps, ready):
+            if n and go:
+                motor.move(int(n))
+
+    controller = ControlLoop(balance, period=args.period, name='dynamic-balance')
+    simulation.start()
+    acquisition.start()
+    for motor in motors:
+        motor.start()
+    started = time.monotonic()
+    controller.start()
+    time.sleep(args.duration / args.speed)
+    controller.stop()
+    elapsed = time.monotonic() - started
+    for motor in motors:
+        motor.stop()
+    acquisition.stop()
+    simulation.stop()
+
+    pitch, roll = store.columns(('pitch', 'roll'))
+    history = np.vstack((pitch, roll)).T[:, :, None].astype(np.float64)
+    settled = convergence_times(history, args.tolerance, dt=1.0 / args.rate)[0]
+    print('%.0f s simulated in %.1f s (%.1fx real time), model lag %.3f s' %
+          (simulation.time, elapsed, simulation.time / elapsed, simulation.lag))
+    print('%d samples, %d dropped; %d controller iterations, %d missed, longest %.1f ms' %
+          (acquisition.received, acquisition.dropped, controller.iterations, controller.missed,
+           1e3 * controller.max_duration))
+    print('%d + %d moves, actuators at %.0f / %.0f full steps' %
+          (motors[0].sent, motors[1].sent, motors[0].commanded, motors[1].commanded))
+    print('final pitch %.3f, roll %.3f deg; within %.3f deg after %s' %
+          (pitch[-1], roll[-1], args.tolerance, '%.1f s' % settled if np.isfinite(settled) else 'never'))
+
+
+if __name__ == '__main__':
+    main()
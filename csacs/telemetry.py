@@ -0,0 +1,208 @@
+""" Shared storage for sensor samples.
+
+    Samples are written by the acquisition thread and read by the GUI, the
+    balancing controller and the logger, so everything here is thread safe. """
+
+import threading
+
+import numpy as np
+
+
+# Fields of each VN-100 sample, as written by the acquisition thread
+SENSOR_FIELDS = ('time', 'yaw', 'pitch', 'roll', 'yaw_rate', 'pitch_rate', 'roll_rate')
+
+# Fields that are measured separately (and more slowly) than the sensor; see hold()
+HELD_FIELDS = ('pitch_position', 'roll_position')
+
+FIELDS = SENSOR_FIELDS + HELD_FIELDS
+
+# Time needs double precision to keep sub-millisecond resolution over long runs,
+# the attitude values come off the sensor as single precision anyway.
+DTYPES = dict((name, np.float64 if name == 'time' else np.float32) for name in FIELDS)
+
+# On-disk layout of spilled samples: one packed record per sample, oldest first
+SPILL_DTYPE = np.dtype([(name, '<f8' if DTYPES[name] is np.float64 else '<f4') for name in FIELDS])
+
+
+class TelemetryStore(object):
+
+    """ Fixed-capacity, columnar ring buffer of sensor samples.
+
+        Each field in FIELDS is kept in its own NumPy column.  Once the store is
+        full the oldest samples are overwritten, so memory use never grows with the
+        length of a run.  If spill_path is given, samples are appended to that file
+        (as SPILL_DTYPE records, see load_spill()) just before they are overwritten,
+        and close() writes out whatever is still in memory.
+
+        Every appended sample gets a sequence number (0, 1, 2, ...) which lets
+        several consumers each keep their own read cursor with since().  Row based
+        reads return (n, len(FIELDS)) float64 arrays laid out as FIELDS; column()
+        and columns() return single fields without copying the others.
+
+        HELD_FIELDS (the actuator positions) are not part of the sensor samples.  Their
+        newest values are set with hold() and copied into every sample appended after
+        that, which lines them up with the sensor data sample by sample.
+
+        Besides FIELDS the store keeps an 'elapsed' column: seconds since the first
+        sample, worked out once per sample as it is appended so that readers never
+        have to rescan the history.  It stays monotonic if the sensor clock restarts
+        (e.g. after a sensor reset). """
+
+    FIELDS = FIELDS
+
+    def __init__(self, capacity=12000, spill_path=None):
+        self.capacity = capacity
+        self._columns = dict((name, np.full(capacity, np.nan, dtype=DTYPES[name])) for name in FIELDS)
+        self._columns['elapsed'] = np.full(capacity, np.nan)
+        self._held = np.full(len(HELD_FIELDS), np.nan)
+        self._epoch = None      # Time that elapsed is measured from
+        self._elapsed = 0.0     # Newest elapsed value
+        self._count = 0     # Total number of samples ever appended
+        self._lock = threading.Lock()
+        self.spill_path = spill_path
+        self._spill = open(spill_path, 'ab') if spill_path else None
+        self.spilled = 0
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    @property
+    def count(self):
+        """ Sequence number that the next appended sample will get. """
+        return self._count
+
+    def append(self, row):
+        self.extend(np.asarray(row, dtype=np.float64).reshape(1, -1))
+
+    def extend(self, rows):
+        """ Appends an (n, len(SENSOR_FIELDS)) array of samples in one go.  Rows that
+            already have all len(FIELDS) columns are stored as they are. """
+        total = len(rows)
+        if total == 0:
+            return
+        with self._lock:
+            if rows.shape[1] != len(FIELDS):
+                full = np.empty((total, len(FIELDS)))
+                full[:, :len(SENSOR_FIELDS)] = rows
+                full[:, len(SENSOR_FIELDS):] = self._held
+                rows = full
+            skipped = max(total - self.capacity, 0)
+            if self._spill is not None:
+                self._spill_rows(self._count - len(self), min(self._count, self._count + total - self.capacity))
+                if skipped:
+                    self._write_spill(rows[:skipped])
+            # Rows that would be overwritten straight away are skipped but still counted
+            rows = rows[skipped:]
+            n = len(rows)
+            i = (self._count + skipped) % self.capacity
+            first = min(n, self.capacity - i)
+            elapsed = self._advance(rows[:, 0])
+            for k, name in enumerate(FIELDS):
+                column = self._columns[name]
+                column[i:i + first] = rows[:first, k]
+                column[:n - first] = rows[first:, k]
+            column = self._columns['elapsed']
+            column[i:i + first] = elapsed[:first]
+            column[:n - first] = elapsed[first:]
+            self._count += total
+
+    def hold(self, field, value):
+        """ Sets the value of a HELD_FIELDS field for the samples appended from now on. """
+        with self._lock:
+            self._held[HELD_FIELDS.index(field)] = value
+
+    def latest(self):
+        """ Returns a copy of the newest sample, or None if nothing was received yet. """
+        with self._lock:
+            if self._count == 0:
+                return None
+            return self._rows(self._count - 1, self._count)[0]
+
+    def last(self, n):
+        """ Returns the newest n samples (oldest first) as an (n, len(FIELDS)) array. """
+        with self._lock:
+            return self._rows(max(self._count - n, 0), self._count)
+
+    def since(self, seq):
+        """ Returns (rows, next_seq) with every sample appended since sequence number
+            seq.  Samples that were already overwritten are skipped. """
+        with self._lock:
+            return self._rows(seq, self._count), self._count
+
+    def column(self, name, n=None):
+        """ Returns a copy of the newest n values (all stored values if n is None) of
+            one field, oldest first. """
+        with self._lock:
+            start = 0 if n is None else max(self._count - n, 0)
+            return self._slice(self._columns[name], start, self._count)
+
+    def columns(self, names, n=None):
+        """ Like column() for several fields at once, all taken from the same samples. """
+        with self._lock:
+            start = 0 if n is None else max(self._count - n, 0)
+            return tuple(self._slice(self._columns[name], start, self._count) for name in names)
+
+    def close(self):
+        """ Writes the samples still held in memory to the spill file and closes it. """
+        with self._lock:
+            if self._spill is None:
+                return
+            self._spill_rows(self._count - len(self), self._count)
+            self._spill.close()
+            self._spill = None
+
+    def _rows(self, start, stop):
+        start = max(start, stop - self.capacity, 0)
+        rows = np.empty((max(stop - start, 0), len(FIELDS)))
+        for k, name in enumerate(FIELDS):
+            rows[:, k] = self._slice(self._columns[name], start, stop)
+        return rows
+
+    def _slice(self, column, start, stop):
+        start = max(start, stop - self.capacity, 0)
+        if start >= stop:
+            return column[:0].copy()
+        i, j = start % self.capacity, stop % self.capacity
+        if i < j:
+            return column[i:j].copy()
+        return np.concatenate((column[i:], column[:j]))
+
+    def _advance(self, times):
+        # Elapsed time for a batch of new timestamps, continuing from the last batch
+        elapsed = np.array(times, dtype=np.float64)
+        if self._epoch is None:
+            self._epoch = elapsed[0]
+        # The sensor clock starts over after a reset; carry on from where it left off
+        steps = np.diff(elapsed, prepend=self._epoch + self._elapsed)
+        restarts = steps < 0
+        if restarts.any():
+            steps[restarts] = 0.0
+            elapsed = self._elapsed + np.cumsum(steps)
+            self._epoch = times[-1] - elapsed[-1]
+        else:
+            elapsed -= self._epoch
+        self._elapsed = elapsed[-1]
+        return elapsed
+
+    def _spill_rows(self, start, stop):
+        # Writes stored samples [start, stop) that have not been spilled yet
+        start = max(start, self.spilled)
+        if start >= stop:
+            return
+        records = np.empty(stop - start, dtype=SPILL_DTYPE)
+        for name in FIELDS:
+            records[name] = self._slice(self._columns[name], start, stop)
+        records.tofile(self._spill)
+        self.spilled = stop
+
+    def _write_spill(self, rows):
+        records = np.empty(len(rows), dtype=SPILL_DTYPE)
+        for k, name in enumerate(FIELDS):
+            records[name] = rows[:, k]
+        records.tofile(self._spill)
+        self.spilled += len(rows)
+
+
+def load_spill(path):
+    """ Reads a TelemetryStore spill file back as a structured SPILL_DTYPE array. """
+    return np.fromfile(path, dtype=SPILL_DTYPE)
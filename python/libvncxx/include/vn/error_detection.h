@@ -26,6 +26,23 @@ public:
 	/// \return The computed checksum.
 	static uint8_t compute(const char data[], size_t length);
 
+	/// \brief Computes the 8-bit checksum one byte at a time.
+	///
+	/// This is the straightforward reference for compute(), which works on
+	/// eight bytes at a time.
+	///
+	/// \param[in] data The data array to compute the 8-bit checksum for.
+	/// \param[in] length The length of data bytes from the array to compute
+	///     the checksum over.
+	/// \return The computed checksum.
+	static uint8_t computeBytewise(const char data[], size_t length);
+
+	/// \brief Checks compute() against computeBytewise() for every length and
+	///     alignment up to a few words.
+	///
+	/// \return <c>true</c> if both agree.
+	static bool selfTest();
+
 };
 
 /// \brief Helpful class for working with 16-bit CRCs.
@@ -44,6 +61,23 @@ public:
 	/// \return The computed CRC.
 	static uint16_t compute(const char data[], size_t length);
 
+	/// \brief Computes the 16-bit CRC one bit at a time, without tables.
+	///
+	/// This is the reference for compute(), which uses the slicing-by-8
+	/// method with lookup tables built when the library is loaded.
+	///
+	/// \param[in] data The data array to compute the 16-bit CRC for.
+	/// \param[in] length The length of data bytes from the array to compute
+	///     the CRC over.
+	/// \return The computed CRC.
+	static uint16_t computeBitwise(const char data[], size_t length);
+
+	/// \brief Checks compute() against computeBitwise() for every length and
+	///     alignment up to a few words.
+	///
+	/// \return <c>true</c> if both agree.
+	static bool selfTest();
+
 };
 
 }
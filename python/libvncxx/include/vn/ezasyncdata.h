@@ -2,6 +2,8 @@
 #define _VNSENSORS_EZASYNCDATA_H_
 
 #include <string>
+#include <deque>
+#include <vector>
 
 #include "vn/int.h"
 #include "vn/nocopy.h"
@@ -14,14 +16,34 @@
 namespace vn {
 namespace sensors {
 
+/// \brief Flat, fixed-layout copy of the commonly used fields of a
+/// \ref CompositeData, suitable for filling arrays in bulk.
+///
+/// Fields that were not present in the received packet are set to NaN. The
+/// layout (72 bytes, no padding) matches the NumPy dtype
+/// <c>vnpy.records.COMPOSITE_RECORD_DTYPE</c>.
+struct CompositeDataRecord
+{
+	double time;		///< Time since startup in seconds.
+	float ypr[3];		///< Yaw, pitch, roll in degrees.
+	float rate[3];		///< Angular rate in rad/s.
+	float accel[3];		///< Acceleration in m/s^2.
+	float mag[3];		///< Magnetic field in Gauss.
+	float quat[4];		///< Attitude quaternion.
+};
+
 /// \brief Provides easy and reliable access to asynchronous data from a
 /// VectorNav sensor at the cost of a slight performance hit.
 class vn_proglib_DLLEXPORT EzAsyncData : private util::NoCopy
 {
-private:
+public:
+	/// \brief Wraps a sensor that is already connected, e.g. to a
+	///     \ref vn::util::MemoryPort. The new object takes ownership of the
+	///     sensor.
+	///
+	/// \param[in] sensor The connected sensor.
 	explicit EzAsyncData(VnSensor* sensor);
 
-public:
 	/// \brief DTOR
 	~EzAsyncData();
 
@@ -60,14 +82,96 @@ public:
 	/// \exception timeout Did not receive new data by the timeout.
 	CompositeData getNextData(int timeoutMs);
 
+	/// \brief Available policies for what to do with a newly received packet
+	/// when the queue is full.
+	enum OverflowPolicy
+	{
+		OVERFLOW_BLOCK,			///< Wait for the consumer to make room in the queue.
+		OVERFLOW_DROP_OLDEST,	///< Discard the oldest queued packet.
+		OVERFLOW_DROP_NEWEST	///< Discard the newly received packet.
+	};
+
+	/// \brief Switches on queue mode. Instead of only keeping the latest
+	/// packet, every received packet is stored in a bounded queue which can be
+	/// drained with \ref getNextBatch.
+	///
+	/// \param[in] capacity The maximum number of packets kept in the queue.
+	/// \param[in] policy What to do when a packet arrives and the queue is full.
+	void enableQueue(size_t capacity, OverflowPolicy policy = OVERFLOW_DROP_OLDEST);
+
+	/// \brief Switches off queue mode and discards any queued packets.
+	void disableQueue();
+
+	/// \brief Indicates if queue mode is enabled.
+	///
+	/// \return <c>true</c> if queue mode is enabled; otherwise <c>false</c>.
+	bool queueEnabled();
+
+	/// \brief Returns the number of packets currently waiting in the queue.
+	///
+	/// \return The number of queued packets.
+	size_t queueSize();
+
+	/// \brief Removes up to maxItems packets from the queue, waiting up to
+	/// timeoutMs for at least one to be available.
+	///
+	/// \param[in] maxItems The maximum number of packets to return.
+	/// \param[in] timeoutMs The number of milliseconds to wait for data, 0 to
+	/// return straight away.
+	/// \return The queued packets, oldest first. Empty if the wait timed out.
+	/// \exception invalid_argument timeoutMs is negative.
+	/// \exception invalid_operation Queue mode is not enabled.
+	std::vector<CompositeData> getNextBatch(size_t maxItems, int timeoutMs);
+
+	/// \brief Removes up to maxRecords packets from the queue and writes them
+	/// into records, waiting up to timeoutMs for at least one to be available.
+	///
+	/// Unlike \ref getNextBatch, no CompositeData objects are handed back, so
+	/// this can be used to fill a preallocated array without any per-packet
+	/// allocations.
+	///
+	/// \param[out] records The array to fill.
+	/// \param[in] maxRecords The number of elements available in records.
+	/// \param[in] timeoutMs The number of milliseconds to wait for data, 0 to
+	/// return straight away.
+	/// \return The number of records written.
+	/// \exception invalid_argument timeoutMs is negative.
+	/// \exception invalid_operation Queue mode is not enabled.
+	size_t drainInto(CompositeDataRecord records[], size_t maxRecords, int timeoutMs);
+
+	/// \brief Returns the number of packets discarded because the queue was
+	/// full.
+	///
+	/// \return The number of dropped packets.
+	uint64_t droppedCount();
+
+	/// \brief Returns the number of times a packet arrived while the queue was
+	/// full, regardless of the overflow policy.
+	///
+	/// \return The number of overflows.
+	uint64_t overflowCount();
+
 private:
 	static void asyncPacketReceivedHandler(void* userData, protocol::uart::Packet& p, size_t index);
 
+	void enqueue(CompositeData& cd);
+
+	// Waits until the queue has data, is disabled or timeoutMs has elapsed.
+	// Must be called with _queueCS entered.
+	void waitForQueuedData(int timeoutMs);
+
+	static void toRecord(CompositeData& cd, CompositeDataRecord& record);
+
 private:
 	VnSensor* _sensor;
-	xplat::CriticalSection _mainCS, _copyCS;
+	xplat::CriticalSection _mainCS, _copyCS, _queueCS;
 	CompositeData _persistentData, _nextData;
-	xplat::Event _newDataEvent;
+	xplat::Event _newDataEvent, _queueNotEmptyEvent, _queueNotFullEvent;
+	bool _queueEnabled;
+	size_t _queueCapacity;
+	OverflowPolicy _overflowPolicy;
+	std::deque<CompositeData> _queue;
+	uint64_t _droppedCount, _overflowCount;
 };
 
 }
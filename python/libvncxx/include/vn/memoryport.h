@@ -71,6 +71,10 @@ public:
 	/// \brief Sends data to the \ref MemoryPort which can then be read by
 	///     \ref read.
 	///
+	/// The data received handler is called until all of the data has been
+	/// read, so the data may be larger than the reader's buffer. Calls from
+	/// several threads are serialized.
+	///
 	/// \param[in] data Data buffer containing the data.
 	/// \param[in] length The number of data bytes.
 	void SendDataBackDoor(const uint8_t data[], size_t length);
@@ -317,6 +317,9 @@ public:
 	#endif
 
 	/// \brief Unregisters the registered callback method.
+	///
+	/// Waits for a call of the handler in progress on the reader thread to return,
+	/// so it must not be called from within the handler.
 	void unregisterRawDataReceivedHandler();
 
 	/// \brief Registers a callback method for notification when a new possible
@@ -7,10 +7,70 @@
 #include <stdio.h>
 #include <iostream>
 
+#include "hayai.hpp"
 #include "hayai_main.hpp"
 
+#include "vn/error_detection.h"
+
+using namespace vn::data::integrity;
+
+namespace {
+
+// A binary packet with the common group TimeStartup, YawPitchRoll and
+// AngularRate fields (the CRC covers everything after the sync byte) and a
+// typical ASCII async output packet (the checksum covers what is between '$'
+// and '*').
+const char BinaryPacket[] =
+	"\x01\x29\x00\x40\x4B\x4C\x00\x00\x00\x00\x00\x9A\x99\x19\x3E"
+	"\xCD\xCC\x4C\xBD\x00\x00\x80\x3F\x0A\xD7\x23\x3C\x6F\x12\x83\xBA"
+	"\x17\xB7\xD1\x38\x00\x00";
+const char AsciiPacket[] =
+	"VNYMR,+004.123,-000.554,+001.030,+00.2155,+00.0155,+00.9891,"
+	"-00.074,+00.109,-09.767,-00.000431,+00.001284,-00.000129";
+
+volatile uint16_t sink;
+
+}
+
+BENCHMARK(Crc16, ComputeBinaryPacket, 10, 100000)
+{
+	sink = Crc16::compute(BinaryPacket, sizeof(BinaryPacket) - 1);
+}
+
+BENCHMARK(Crc16, ComputeBitwiseBinaryPacket, 10, 100000)
+{
+	sink = Crc16::computeBitwise(BinaryPacket, sizeof(BinaryPacket) - 1);
+}
+
+BENCHMARK(Crc16, ComputeAsciiPacket, 10, 100000)
+{
+	sink = Crc16::compute(AsciiPacket, sizeof(AsciiPacket) - 1);
+}
+
+BENCHMARK(Crc16, ComputeBitwiseAsciiPacket, 10, 100000)
+{
+	sink = Crc16::computeBitwise(AsciiPacket, sizeof(AsciiPacket) - 1);
+}
+
+BENCHMARK(Checksum8, ComputeAsciiPacket, 10, 100000)
+{
+	sink = Checksum8::compute(AsciiPacket, sizeof(AsciiPacket) - 1);
+}
+
+BENCHMARK(Checksum8, ComputeBytewiseAsciiPacket, 10, 100000)
+{
+	sink = Checksum8::computeBytewise(AsciiPacket, sizeof(AsciiPacket) - 1);
+}
+
 int main(int argc, char* argv[])
 {
+	// Timings of wrong results are no use.
+	if (!Crc16::selfTest() || !Checksum8::selfTest())
+	{
+		std::cerr << "error detection self test failed" << std::endl;
+		return 1;
+	}
+
 	// Set up the main runner.
 	::hayai::MainRunner runner;
 
@@ -1,17 +1,83 @@
 #include "vn/error_detection.h"
 
-#include <iostream>
-using namespace std;
+#include <cstring>
 
 namespace vn {
 namespace data {
 namespace integrity {
 
+namespace {
+
+// Lookup tables for the slicing-by-8 CRC. Entry v of table k is the CRC of the
+// byte v followed by k zero bytes, so eight bytes of data are folded into the
+// CRC with eight independent lookups instead of 64 shift-and-xor steps.
+struct Crc16Tables
+{
+	uint16_t t[8][256];
+
+	Crc16Tables()
+	{
+		for (int v = 0; v < 256; v++)
+		{
+			char byte = static_cast<char>(v);
+
+			t[0][v] = Crc16::computeBitwise(&byte, 1);
+		}
+
+		for (int k = 1; k < 8; k++)
+		{
+			for (int v = 0; v < 256; v++)
+				t[k][v] = static_cast<uint16_t>((t[k - 1][v] << 8) ^ t[0][t[k - 1][v] >> 8]);
+		}
+	}
+};
+
+const Crc16Tables tables;
+
+// Test data for the self checks: every byte value, including ones with the top
+// bit set (char is signed on most platforms).
+struct TestData
+{
+	char data[256 + 8];
+
+	TestData()
+	{
+		for (size_t i = 0; i < sizeof(data); i++)
+			data[i] = static_cast<char>(i * 167 + 13);
+	}
+};
+
+}
+
 uint8_t Checksum8::compute(char const data[], size_t length)
 {
-	if (length > 1000)
-		cout << "HAPPENING!" << endl;
+	uint64_t xorWord = 0;
+	size_t i = 0;
+
+	// XOR is independent of byte order and position, so whole words can be
+	// combined and folded into one byte at the end.
+	for (; i + 8 <= length; i += 8)
+	{
+		uint64_t word;
+
+		std::memcpy(&word, data + i, sizeof(word));
+		xorWord ^= word;
+	}
+
+	xorWord ^= xorWord >> 32;
+	xorWord ^= xorWord >> 16;
+	xorWord ^= xorWord >> 8;
+
+	uint8_t xorVal = static_cast<uint8_t>(xorWord);
+
+	for (; i < length; i++)
+		xorVal ^= data[i];
+
+	return xorVal;
+}
 
+uint8_t Checksum8::computeBytewise(char const data[], size_t length)
+{
 	uint8_t xorVal = 0;
 
 	for (size_t i = 0; i < length; i++)
@@ -22,7 +88,48 @@ uint8_t Checksum8::compute(char const data[], size_t length)
 	return xorVal;
 }
 
+bool Checksum8::selfTest()
+{
+	TestData test;
+
+	for (size_t offset = 0; offset < 8; offset++)
+	{
+		for (size_t length = 0; offset + length <= sizeof(test.data); length++)
+		{
+			if (compute(test.data + offset, length) != computeBytewise(test.data + offset, length))
+				return false;
+		}
+	}
+
+	return true;
+}
+
 uint16_t Crc16::compute(char const data[], size_t length)
+{
+	const uint8_t* d = reinterpret_cast<const uint8_t*>(data);
+	uint16_t crc = 0;
+	size_t i = 0;
+
+	for (; i + 8 <= length; i += 8, d += 8)
+	{
+		crc = static_cast<uint16_t>(
+			tables.t[7][d[0] ^ (crc >> 8)] ^
+			tables.t[6][d[1] ^ (crc & 0xFF)] ^
+			tables.t[5][d[2]] ^
+			tables.t[4][d[3]] ^
+			tables.t[3][d[4]] ^
+			tables.t[2][d[5]] ^
+			tables.t[1][d[6]] ^
+			tables.t[0][d[7]]);
+	}
+
+	for (; i < length; i++, d++)
+		crc = static_cast<uint16_t>((crc << 8) ^ tables.t[0][(crc >> 8) ^ *d]);
+
+	return crc;
+}
+
+uint16_t Crc16::computeBitwise(char const data[], size_t length)
 {
 	uint32_t i;
 	uint16_t crc = 0;
@@ -40,6 +147,22 @@ uint16_t Crc16::compute(char const data[], size_t length)
 	return crc;
 }
 
+bool Crc16::selfTest()
+{
+	TestData test;
+
+	for (size_t offset = 0; offset < 8; offset++)
+	{
+		for (size_t length = 0; offset + length <= sizeof(test.data); length++)
+		{
+			if (compute(test.data + offset, length) != computeBitwise(test.data + offset, length))
+				return false;
+		}
+	}
+
+	return true;
+}
+
 }
 }
 }
@@ -99,13 +99,20 @@ void Event::wait()
 
 	pthread_mutex_lock(&_pi->Mutex);
 
-	int errorCode = pthread_cond_wait(
-		&_pi->Condition,
-		&_pi->Mutex);
+	// A signal that came before the wait is not lost, as with the auto-reset
+	// event on Windows.
+	int errorCode = 0;
+	while (!_pi->IsTriggered && errorCode == 0)
+		errorCode = pthread_cond_wait(
+			&_pi->Condition,
+			&_pi->Mutex);
+
+	bool signaled = _pi->IsTriggered;
+	_pi->IsTriggered = false;
 
 	pthread_mutex_unlock(&_pi->Mutex);
 
-	if (errorCode == 0)
+	if (signaled)
 		return;
 
 	#else
@@ -146,20 +153,25 @@ Event::WaitResult Event::waitUs(uint32_t timeoutInMicroSec)
 	now.tv_sec += numOfSecs;
 	now.tv_nsec += numOfNanoseconds;
 
-	if (now.tv_nsec > 1000000000)
+	if (now.tv_nsec >= 1000000000)
 	{
 		now.tv_nsec %= 1000000000;
 		now.tv_sec++;
 	}
 
-	int errorCode = pthread_cond_timedwait(
-		&_pi->Condition,
-		&_pi->Mutex,
-		&now);
+	int errorCode = 0;
+	while (!_pi->IsTriggered && errorCode == 0)
+		errorCode = pthread_cond_timedwait(
+			&_pi->Condition,
+			&_pi->Mutex,
+			&now);
+
+	bool signaled = _pi->IsTriggered;
+	_pi->IsTriggered = false;
 
 	pthread_mutex_unlock(&_pi->Mutex);
 
-	if (errorCode == 0)
+	if (signaled)
 		return WAIT_SIGNALED;
 
 	if (errorCode == ETIMEDOUT)
@@ -185,20 +197,25 @@ Event::WaitResult Event::waitUs(uint32_t timeoutInMicroSec)
 	now.tv_sec += numOfSecs;
 	now.tv_nsec += numOfNanoseconds;
 
-	if (now.tv_nsec > 1000000000)
+	if (now.tv_nsec >= 1000000000)
 	{
 		now.tv_nsec %= 1000000000;
 		now.tv_sec++;
 	}
 
-	int errorCode = pthread_cond_timedwait(
-		&_pi->Condition,
-		&_pi->Mutex,
-		&now);
+	int errorCode = 0;
+	while (!_pi->IsTriggered && errorCode == 0)
+		errorCode = pthread_cond_timedwait(
+			&_pi->Condition,
+			&_pi->Mutex,
+			&now);
+
+	bool signaled = _pi->IsTriggered;
+	_pi->IsTriggered = false;
 
 	pthread_mutex_unlock(&_pi->Mutex);
 
-	if (errorCode == 0)
+	if (signaled)
 		return WAIT_SIGNALED;
 
 	if (errorCode == ETIMEDOUT)
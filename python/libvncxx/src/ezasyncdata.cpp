@@ -1,4 +1,9 @@
 #include "vn/ezasyncdata.h"
+#include "vn/exceptions.h"
+#include "vn/vntime.h"
+
+#include <cmath>
+#include <limits>
 
 using namespace std;
 
@@ -34,6 +39,8 @@ void EzAsyncData::asyncPacketReceivedHandler(void* userData, protocol::uart::Pac
 	ez->_nextData = nd;
 	ez->_copyCS.leave();
 
+	ez->enqueue(nd);
+
 	ez->_newDataEvent.signal();
 }
 
@@ -42,7 +49,12 @@ void EzAsyncData::asyncPacketReceivedHandler(void* userData, protocol::uart::Pac
 #endif
 
 EzAsyncData::EzAsyncData(VnSensor* sensor) :
-	_sensor(sensor)
+	_sensor(sensor),
+	_queueEnabled(false),
+	_queueCapacity(0),
+	_overflowPolicy(OVERFLOW_DROP_OLDEST),
+	_droppedCount(0),
+	_overflowCount(0)
 {
 	_sensor->registerAsyncPacketReceivedHandler(this, &EzAsyncData::asyncPacketReceivedHandler);
 }
@@ -109,6 +121,229 @@ CompositeData EzAsyncData::getNextData(int timeoutMs)
 	return cd;
 }
 
+void EzAsyncData::enqueue(CompositeData& cd)
+{
+	_queueCS.enter();
+
+	if (!_queueEnabled)
+	{
+		_queueCS.leave();
+		return;
+	}
+
+	if (_queue.size() >= _queueCapacity)
+	{
+		_overflowCount++;
+
+		if (_overflowPolicy == OVERFLOW_BLOCK)
+		{
+			while (_queueEnabled && _queue.size() >= _queueCapacity)
+			{
+				_queueCS.leave();
+				_queueNotFullEvent.wait();
+				_queueCS.enter();
+			}
+
+			if (!_queueEnabled)
+			{
+				_queueCS.leave();
+				return;
+			}
+		}
+		else if (_overflowPolicy == OVERFLOW_DROP_OLDEST)
+		{
+			_queue.pop_front();
+			_droppedCount++;
+		}
+		else
+		{
+			_droppedCount++;
+			_queueCS.leave();
+			return;
+		}
+	}
+
+	_queue.push_back(cd);
+
+	_queueCS.leave();
+
+	_queueNotEmptyEvent.signal();
+}
+
+void EzAsyncData::enableQueue(size_t capacity, OverflowPolicy policy)
+{
+	if (capacity == 0)
+		throw invalid_argument("capacity");
+
+	_queueCS.enter();
+	_queueCapacity = capacity;
+	_overflowPolicy = policy;
+	_droppedCount = 0;
+	_overflowCount = 0;
+	_queueEnabled = true;
+	_queueCS.leave();
+}
+
+void EzAsyncData::disableQueue()
+{
+	_queueCS.enter();
+	_queueEnabled = false;
+	_queue.clear();
+	_queueCS.leave();
+
+	// Wake up anybody waiting on the queue so they see it is disabled.
+	_queueNotFullEvent.signal();
+	_queueNotEmptyEvent.signal();
+}
+
+bool EzAsyncData::queueEnabled()
+{
+	xplat::ScopeLock lock(_queueCS);
+
+	return _queueEnabled;
+}
+
+size_t EzAsyncData::queueSize()
+{
+	xplat::ScopeLock lock(_queueCS);
+
+	return _queue.size();
+}
+
+vector<CompositeData> EzAsyncData::getNextBatch(size_t maxItems, int timeoutMs)
+{
+	if (timeoutMs < 0)
+		throw invalid_argument("timeoutMs");
+
+	vector<CompositeData> batch;
+
+	_queueCS.enter();
+
+	if (!_queueEnabled)
+	{
+		_queueCS.leave();
+		throw invalid_operation();
+	}
+
+	waitForQueuedData(timeoutMs);
+
+	size_t count = _queue.size() < maxItems ? _queue.size() : maxItems;
+	batch.reserve(count);
+
+	for (size_t i = 0; i < count; i++)
+	{
+		batch.push_back(_queue.front());
+		_queue.pop_front();
+	}
+
+	// Pass the signal on to other readers when packets are left.
+	bool more = !_queue.empty();
+
+	_queueCS.leave();
+
+	if (count > 0)
+		_queueNotFullEvent.signal();
+
+	if (more)
+		_queueNotEmptyEvent.signal();
+
+	return batch;
+}
+
+size_t EzAsyncData::drainInto(CompositeDataRecord records[], size_t maxRecords, int timeoutMs)
+{
+	if (timeoutMs < 0)
+		throw invalid_argument("timeoutMs");
+
+	_queueCS.enter();
+
+	if (!_queueEnabled)
+	{
+		_queueCS.leave();
+		throw invalid_operation();
+	}
+
+	waitForQueuedData(timeoutMs);
+
+	size_t count = _queue.size() < maxRecords ? _queue.size() : maxRecords;
+
+	for (size_t i = 0; i < count; i++)
+	{
+		toRecord(_queue.front(), records[i]);
+		_queue.pop_front();
+	}
+
+	// Pass the signal on to other readers when packets are left.
+	bool more = !_queue.empty();
+
+	_queueCS.leave();
+
+	if (count > 0)
+		_queueNotFullEvent.signal();
+
+	if (more)
+		_queueNotEmptyEvent.signal();
+
+	return count;
+}
+
+void EzAsyncData::waitForQueuedData(int timeoutMs)
+{
+	xplat::Stopwatch stopwatch;
+
+	while (_queue.empty() && _queueEnabled)
+	{
+		float remainingMs = timeoutMs - stopwatch.elapsedMs();
+
+		if (remainingMs <= 0)
+			break;
+
+		// The event may still hold a signal from packets taken already, so the
+		// queue is checked again after every wake up.
+		_queueCS.leave();
+		_queueNotEmptyEvent.waitMs(static_cast<uint32_t>(ceil(remainingMs)));
+		_queueCS.enter();
+	}
+}
+
+void EzAsyncData::toRecord(CompositeData& cd, CompositeDataRecord& record)
+{
+	const float nan = numeric_limits<float>::quiet_NaN();
+
+	record.time = cd.hasTimeStartup() ? cd.timeStartup() * 1e-9 : numeric_limits<double>::quiet_NaN();
+
+	math::vec3f ypr = cd.hasYawPitchRoll() ? cd.yawPitchRoll() : math::vec3f(nan);
+	math::vec3f rate = cd.hasAngularRate() ? cd.angularRate() : math::vec3f(nan);
+	math::vec3f accel = cd.hasAcceleration() ? cd.acceleration() : math::vec3f(nan);
+	math::vec3f mag = cd.hasMagnetic() ? cd.magnetic() : math::vec3f(nan);
+	math::vec4f quat = cd.hasQuaternion() ? cd.quaternion() : math::vec4f(nan);
+
+	for (size_t i = 0; i < 3; i++)
+	{
+		record.ypr[i] = ypr.c[i];
+		record.rate[i] = rate.c[i];
+		record.accel[i] = accel.c[i];
+		record.mag[i] = mag.c[i];
+	}
+
+	for (size_t i = 0; i < 4; i++)
+		record.quat[i] = quat.c[i];
+}
+
+uint64_t EzAsyncData::droppedCount()
+{
+	xplat::ScopeLock lock(_queueCS);
+
+	return _droppedCount;
+}
+
+uint64_t EzAsyncData::overflowCount()
+{
+	xplat::ScopeLock lock(_queueCS);
+
+	return _overflowCount;
+}
+
 EzAsyncData::~EzAsyncData()
 {
 	if (NULL != _sensor)
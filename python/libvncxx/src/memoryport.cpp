@@ -2,6 +2,7 @@
 #include "vn/criticalsection.h"
 #include "vn/exceptions.h"
 
+#include <algorithm>
 #include <list>
 
 using namespace std;
@@ -41,16 +42,27 @@ struct MemoryPort::Impl
 		BackReference(backReference)
 	{ }
 
-	void OnDataReceived()
+	// Offers data to the observer until it has all been read. Must be called
+	// with ObserversCriticalSection entered, which also keeps data injected
+	// from several threads from being interleaved.
+	void OnDataReceived(const uint8_t data[], size_t length)
 	{
-		if (_dataReceivedHandler == NULL)
-			return;
+		DataAvailableForRead = data;
+		DataAvailableForReadLength = length;
 
-		ObserversCriticalSection.enter();
+		while (_dataReceivedHandler != NULL && DataAvailableForReadLength > 0)
+		{
+			size_t before = DataAvailableForReadLength;
 
-		_dataReceivedHandler(_dataReceivedUserData);
+			_dataReceivedHandler(_dataReceivedUserData);
 
-		ObserversCriticalSection.leave();
+			// Stop if the observer did not read anything.
+			if (DataAvailableForReadLength == before)
+				break;
+		}
+
+		DataAvailableForRead = NULL;
+		DataAvailableForReadLength = 0;
 	}
 };
 
@@ -108,13 +120,14 @@ void MemoryPort::read(char dataBuffer[], size_t numOfBytesToRead, size_t &numOfB
 	if (!_pi->IsOpen)
 		throw invalid_operation();
 
-	if (numOfBytesToRead < _pi->DataAvailableForReadLength)
-		// Don't support less than full read for now.
-		throw not_implemented();
+	// Reads smaller than the data sent get the rest on the next read.
+	numOfBytesActuallyRead = min(numOfBytesToRead, _pi->DataAvailableForReadLength);
 
-	copy(_pi->DataAvailableForRead, _pi->DataAvailableForRead + _pi->DataAvailableForReadLength, dataBuffer);
+	if (numOfBytesActuallyRead > 0)
+		copy(_pi->DataAvailableForRead, _pi->DataAvailableForRead + numOfBytesActuallyRead, dataBuffer);
 
-	numOfBytesActuallyRead = _pi->DataAvailableForReadLength;
+	_pi->DataAvailableForRead += numOfBytesActuallyRead;
+	_pi->DataAvailableForReadLength -= numOfBytesActuallyRead;
 }
 
 void MemoryPort::registerDataReceivedHandler(void* userData, DataReceivedHandler handler)
@@ -163,10 +176,11 @@ void MemoryPort::unregisterDataWrittenHandler()
 
 void MemoryPort::SendDataBackDoor(const uint8_t data[], size_t length)
 {
-	_pi->DataAvailableForRead = data;
-	_pi->DataAvailableForReadLength = length;
+	_pi->ObserversCriticalSection.enter();
 
-	_pi->OnDataReceived();
+	_pi->OnDataReceived(data, length);
+
+	_pi->ObserversCriticalSection.leave();
 }
 
 void MemoryPort::SendDataBackDoor(
@@ -49,6 +49,9 @@ struct VnSensor::Impl
 	bool DidWeOpenSimplePort;
 	RawDataReceivedHandler _rawDataReceivedHandler;
 	void* _rawDataReceivedUserData;
+	// Held while the raw data received handler is called, so that unregistering it
+	// waits for a call in progress and userData can be released afterwards.
+	CriticalSection _rawDataReceivedCS;
 	PossiblePacketFoundHandler _possiblePacketFoundHandler;
 	void* _possiblePacketFoundUserData;
 	PacketFinder _packetFinder;
@@ -234,8 +237,13 @@ struct VnSensor::Impl
 			return;
 		}
 
-		if (possiblePacket.isResponse() && pThis->_waitingForResponse)
+		if (possiblePacket.type() == Packet::TYPE_ASCII && possiblePacket.isResponse())
 		{
+			// A response nobody is waiting for (e.g. to a retransmitted command, or
+			// in a replayed recording) is dropped; it is not asynchronous data.
+			if (!pThis->_waitingForResponse)
+				return;
+
 			pThis->_transactionCS.enter();
 			pThis->_receivedResponses.push(possiblePacket);
 			pThis->_newResponsesEvent.signal();
@@ -268,8 +276,10 @@ struct VnSensor::Impl
 
 		TimeStamp t = TimeStamp::get();
 
+		pi->_rawDataReceivedCS.enter();
 		if (pi->_rawDataReceivedHandler != NULL)
 			pi->_rawDataReceivedHandler(pi->_rawDataReceivedUserData, reinterpret_cast<char*>(readBuffer), numOfBytesRead, pi->_dataRunningIndex);
+		pi->_rawDataReceivedCS.leave();
 
 		#if PYTHON
 		if (pi->_rawDataReceivedHandlerPython != NULL)
@@ -883,11 +893,18 @@ string VnSensor::send(string toSend, bool waitForReply, ErrorDetectionMode error
 
 void VnSensor::registerRawDataReceivedHandler(void* userData, RawDataReceivedHandler handler)
 {
+	_pi->_rawDataReceivedCS.enter();
+
 	if (_pi->_rawDataReceivedHandler != NULL)
+	{
+		_pi->_rawDataReceivedCS.leave();
 		throw invalid_operation();
+	}
 
 	_pi->_rawDataReceivedHandler = handler;
 	_pi->_rawDataReceivedUserData = userData;
+
+	_pi->_rawDataReceivedCS.leave();
 }
 
 #if PL150
@@ -908,11 +925,18 @@ PyObject* VnSensor::registerRawDataReceivedHandler(PyObject* callable)
 
 void VnSensor::unregisterRawDataReceivedHandler()
 {
+	_pi->_rawDataReceivedCS.enter();
+
 	if (_pi->_rawDataReceivedHandler == NULL)
+	{
+		_pi->_rawDataReceivedCS.leave();
 		throw invalid_operation();
+	}
 
 	_pi->_rawDataReceivedHandler = NULL;
 	_pi->_rawDataReceivedUserData = NULL;
+
+	_pi->_rawDataReceivedCS.leave();
 }
 
 void VnSensor::registerPossiblePacketFoundHandler(void* userData, PossiblePacketFoundHandler handler)
@@ -22,6 +22,7 @@ module_raw = Extension(
         'libvncxx/src/error_detection.cpp',
         'libvncxx/src/event.cpp',
         'libvncxx/src/ezasyncdata.cpp',
+        'libvncxx/src/memoryport.cpp',
         'libvncxx/src/packet.cpp',
         'libvncxx/src/packetfinder.cpp',
         'libvncxx/src/port.cpp',
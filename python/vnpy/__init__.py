@@ -1,50 +1,44 @@
-from .libvncxx import (VnSensor, EzAsyncData, CompositeData, Attitude, Position, vec3f, vec3d, vec4f, Packet,
-                       BinaryOutputRegister, QuaternionMagneticAccelerationAndAngularRatesRegister,
-                       MagneticAccelerationAndAngularRatesRegister, MagneticAndGravityReferenceVectorsRegister,
-                       FilterMeasurementsVarianceParametersRegister, MagnetometerCompensationRegister,
-                       FilterActiveTuningParametersRegister, AccelerationCompensationRegister,
-                       YawPitchRollMagneticAccelerationAndAngularRatesRegister, CommunicationProtocolControlRegister,
-                       SynchronizationControlRegister, SynchronizationStatusRegister, FilterBasicControlRegister,
-                       VpeBasicControlRegister, VpeMagnetometerBasicTuningRegister, VpeMagnetometerAdvancedTuningRegister,
-                       VpeAccelerometerBasicTuningRegister, VpeAccelerometerAdvancedTuningRegister,
-                       VpeGyroBasicTuningRegister, MagnetometerCalibrationControlRegister,
-                       CalculatedMagnetometerCalibrationRegister, VelocityCompensationControlRegister,
-                       VelocityCompensationStatusRegister, ImuMeasurementsRegister, GpsConfigurationRegister,
-                       GpsSolutionLlaRegister, GpsSolutionEcefRegister, InsSolutionLlaRegister, InsSolutionEcefRegister,
-                       InsBasicConfigurationRegisterVn200, InsBasicConfigurationRegisterVn300,
-                       InsAdvancedConfigurationRegister, InsStateLlaRegister, InsStateEcefRegister,
-                       StartupFilterBiasEstimateRegister, DeltaThetaAndDeltaVelocityRegister,
-                       DeltaThetaAndDeltaVelocityConfigurationRegister, ReferenceVectorConfigurationRegister,
-                       GyroCompensationRegister, ImuFilteringConfigurationRegister, GpsCompassBaselineRegister,
-                       GpsCompassEstimatedBaselineRegister, ImuRateConfigurationRegister,
-                       YawPitchRollTrueBodyAccelerationAndAngularRatesRegister, YawPitchRollTrueInertialAccelerationAndAngularRatesRegister,
-                       TimeUtc, mat3f, vec3d, vec3f, vec4f,
-                       CHECKSUMMODE_CHECKSUM, CHECKSUMMODE_CRC, CHECKSUMMODE_OFF, COMPENSATIONMODE_BIAS,
-                       COMPENSATIONMODE_NONE, COUNTMODE_GPSPPS, COUNTMODE_NONE, COUNTMODE_SYNCINCOUNT,
-                       COUNTMODE_SYNCINTIME, COUNTMODE_SYNCOUTCOUNTER, ERRORDETECTIONMODE_CHECKSUM,
-                       ERRORDETECTIONMODE_CRC, ERRORDETECTIONMODE_NONE, ERRORMODE_IGNORE, ERRORMODE_SEND,
-                       ERRORMODE_SENDANDOFF, EXTERNALSENSORMODE_EXTERNAL200HZ, EXTERNALSENSORMODE_EXTERNALONUPDATE,
-                       EXTERNALSENSORMODE_INTERNAL, FILTERMODE_BOTH, FILTERMODE_NOFILTERING, FILTERMODE_ONLYCOMPENSATED,
-                       FILTERMODE_ONLYRAW, FOAMINIT_FOAMINITHEADINGPITCHROLL, FOAMINIT_FOAMINITHEADINGPITCHROLLCOVARIANCE,
-                       FOAMINIT_FOAMINITPITCHROLL, FOAMINIT_FOAMINITPITCHROLLCOVARIANCE, FOAMINIT_NOFOAMINIT,
-                       GPSFIX_2D, GPSFIX_3D, GPSFIX_NOFIX, GPSFIX_TIMEONLY, GPSMODE_EXTERNALGPS, GPSMODE_EXTERNALVN200GPS,
-                       GPSMODE_ONBOARDGPS, HEADINGMODE_ABSOLUTE, HEADINGMODE_INDOOR, HEADINGMODE_RELATIVE,
-                       HSIMODE_OFF, HSIMODE_RESET, HSIMODE_RUN, HSIOUTPUT_NOONBOARD, HSIOUTPUT_USEONBOARD,
-                       INSSTATUS_GPS_ERROR, INSSTATUS_GPS_FIX, INSSTATUS_IMU_ERROR, INSSTATUS_MAG_PRES_ERROR,
-                       INSSTATUS_NOT_TRACKING, INSSTATUS_SUFFICIENT_DYNAMIC_MOTION, INSSTATUS_TIME_ERROR,
-                       INSSTATUS_TRACKING, INTEGRATIONFRAME_BODY, INTEGRATIONFRAME_NED, MAGNETICMODE_2D,
-                       MAGNETICMODE_3D, PPSSOURCE_GPSPPSFALLING, PPSSOURCE_GPSPPSRISING, PPSSOURCE_SYNCINFALLING,
-                       PPSSOURCE_SYNCINRISING, SCENARIO_AHRS, SCENARIO_GPSMOVINGBASELINEDYNAMIC, SCENARIO_GPSMOVINGBASELINESTATIC,
-                       SCENARIO_INSWITHOUTPRESSURE, SCENARIO_INSWITHPRESSURE, SENSSAT_ACCX, SENSSAT_ACCY,
-                       SENSSAT_ACCZ, SENSSAT_GYROX, SENSSAT_GYROY, SENSSAT_GYROZ, SENSSAT_MAGX, SENSSAT_MAGY,
-                       SENSSAT_MAGZ, SENSSAT_PRES, STATUSMODE_INSSTATUS, STATUSMODE_OFF, STATUSMODE_VPESTATUS,
-                       SYNCINEDGE_FALLING, SYNCINEDGE_RISING, SYNCINMODE_ASYNC, SYNCINMODE_COUNT,
-                       SYNCINMODE_IMU, SYNCOUTMODE_GPSPPS, SYNCOUTMODE_IMUREADY, SYNCOUTMODE_INS,
-                       SYNCOUTMODE_ITEMSTART, SYNCOUTMODE_NONE, SYNCOUTPOLARITY_NEGATIVE,
-                       SYNCOUTPOLARITY_POSITIVE, VELOCITYCOMPENSATIONMODE_BODYMEASUREMENT,
-                       VELOCITYCOMPENSATIONMODE_DISABLED, VNACC, VNDTV, VNGPE, VNGPS, VNGYR, VNIMU, VNINE,
-                       VNINS, VNISE, VNISL, VNMAG, VNMAR, VNOFF, VNQMR, VNQTN, VNYBA, VNYIA, VNYMR, VNYPR,
-                       VPEENABLE_DISABLE, VPEENABLE_ENABLE, VPEMODE_MODE1, VPEMODE_OFF,
-                       celsius2fahren, celsius2kelvin, dcm2omega_phi_kappa_rads, dcm2quat, dcm2ypr_degs,
-                       dcm2ypr_rads, fahren2celsius, fahren2kelvin, kelvin2celsius, kelvin2fahren, parse,
-                       quat2dcm, quat2omega_phi_kappa_rads, quat2ypr_degs, quat2ypr_rads, to_string)
+""" Python interface to VectorNav sensors.
+
+    The names are defined in the submodules core (the sensor, its data and the
+    vector types), registers, packets and conv (conversions), and are loaded on
+    first use: importing vnpy does not load the binding library, so vnpy.bulk,
+    vnpy.records and a program's other imports do not wait for it.  On Python
+    before 3.7 (no module __getattr__) everything is imported up front. """
+
+import importlib
+import sys
+
+_SUBMODULES = ('core', 'registers', 'packets', 'conv')
+_MODULES = _SUBMODULES + ('bulk', 'libvncxx', 'records')
+
+
+def _submodule(name):
+    return importlib.import_module('.' + name, __name__)
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        return _submodule(name)
+    if name.startswith('__') and name != '__all__':
+        # Probes such as __wrapped__ or __path__ lookups must not load the library
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    if name == '__all__':
+        value = [n for submodule in _SUBMODULES for n in _submodule(submodule).__all__]
+    else:
+        for submodule in _SUBMODULES:
+            module = _submodule(submodule)
+            if name in module.__all__:
+                value = getattr(module, name)
+                break
+        else:
+            raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+if sys.version_info < (3, 7):
+    from .core import *
+    from .registers import *
+    from .packets import *
+    from .conv import *
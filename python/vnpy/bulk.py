@@ -0,0 +1,187 @@
+""" Vectorized decoding of captured VN-100 binary output.
+
+    Decodes every binary packet of a capture (bytes, bytearray, mmap, or a file)
+    in one call, without a Python object or SWIG call per packet: the packets are
+    located and their CRC16 checked over all candidates at once, and the payloads
+    are returned as NumPy columns.  The layout of the packets is that of the binary
+    output register the sensor was streaming with (a BinaryOutputRegister or a
+    BinaryLayout).
+
+        layout = BinaryLayout(common=0x0029)        # TimeStartup, YawPitchRoll, AngularRate
+        columns = decode_file('capture.bin', layout)
+        columns['ypr']                              # (n, 3) float32
+
+    Importing this module requires NumPy; the rest of vnpy does not. """
+
+import mmap
+
+import numpy as np
+
+SYNC = 0xFA
+
+_UTC = np.dtype([('year', 'i1'), ('month', 'u1'), ('day', 'u1'), ('hour', 'u1'),
+                 ('min', 'u1'), ('sec', 'u1'), ('ms', '<u2')])
+
+# Fields of each output group in bit order, as (name, dtype).  The sizes match
+# Packet::BinaryGroupLengths (libvncxx/src/packet.cpp); fields without a fixed
+# meaning on the VN-100 are returned as raw bytes.
+GROUPS = (
+    ('common', (('time_startup', '<u8'), ('time_gps', '<u8'), ('time_sync_in', '<u8'),
+                ('ypr', ('<f4', 3)), ('quaternion', ('<f4', 4)), ('angular_rate', ('<f4', 3)),
+                ('position', ('<f8', 3)), ('velocity', ('<f4', 3)), ('accel', ('<f4', 3)),
+                ('imu', ('<f4', 6)), ('mag_pres', ('<f4', 5)), ('delta_theta', ('<f4', 7)),
+                ('ins_status', '<u2'), ('sync_in_cnt', '<u4'), ('time_gps_pps', '<u8'))),
+    ('time', (('time_startup', '<u8'), ('time_gps', '<u8'), ('gps_tow', '<u8'),
+              ('gps_week', '<u2'), ('time_sync_in', '<u8'), ('time_gps_pps', '<u8'),
+              ('time_utc', _UTC), ('sync_in_cnt', '<u4'))),
+    ('imu', (('imu_status', '<u2'), ('uncomp_mag', ('<f4', 3)), ('uncomp_accel', ('<f4', 3)),
+             ('uncomp_gyro', ('<f4', 3)), ('temp', '<f4'), ('pres', '<f4'),
+             ('delta_theta', ('<f4', 4)), ('delta_vel', ('<f4', 3)), ('mag', ('<f4', 3)),
+             ('accel', ('<f4', 3)), ('angular_rate', ('<f4', 3)), ('sens_sat', '<u2'),
+             ('raw', ('u1', 40)))),
+    ('gps', (('utc', _UTC), ('tow', '<u8'), ('week', '<u2'), ('num_sats', 'u1'), ('fix', 'u1'),
+             ('pos_lla', ('<f8', 3)), ('pos_ecef', ('<f8', 3)), ('vel_ned', ('<f4', 3)),
+             ('vel_ecef', ('<f4', 3)), ('pos_u', ('<f4', 3)), ('vel_u', '<f4'), ('time_u', '<f4'),
+             ('raw', ('u1', 32)))),
+    ('attitude', (('vpe_status', '<u2'), ('ypr', ('<f4', 3)), ('quaternion', ('<f4', 4)),
+                  ('dcm', ('<f4', (3, 3))), ('mag_ned', ('<f4', 3)), ('accel_ned', ('<f4', 3)),
+                  ('linear_accel_body', ('<f4', 3)), ('linear_accel_ned', ('<f4', 3)),
+                  ('ypr_u', ('<f4', 3)), ('ypr_rate', ('<f4', 3)), ('state_ahrs', ('<f4', 7)),
+                  ('cov_ahrs', ('<f4', 6)))),
+    ('ins', (('ins_status', '<u2'), ('pos_lla', ('<f8', 3)), ('pos_ecef', ('<f8', 3)),
+             ('vel_body', ('<f4', 3)), ('vel_ned', ('<f4', 3)), ('vel_ecef', ('<f4', 3)),
+             ('mag_ecef', ('<f4', 3)), ('accel_ecef', ('<f4', 3)), ('linear_accel_ecef', ('<f4', 3)),
+             ('pos_u', '<f4'), ('vel_u', '<f4'), ('raw11', ('u1', 68)), ('raw12', ('u1', 64)))),
+)
+
+
+def _crc_table():
+    """ CRC-16-CCITT (polynomial 0x1021, the VN-100's CRC) of every byte value. """
+    crc = np.arange(256, dtype=np.uint32) << 8
+    for _ in range(8):
+        crc = np.where(crc & 0x8000, (crc << 1) ^ 0x1021, crc << 1) & 0xFFFF
+    return crc.astype(np.uint16)
+
+
+CRC_TABLE = _crc_table()
+
+
+class BinaryLayout(object):
+
+    """ Packet layout of one binary output configuration.
+
+        The arguments are the output field bit masks of the six groups, as in
+        BinaryOutputRegister.  header is the fixed start of every packet (sync byte,
+        groups byte and the group field masks), length the length of a whole packet
+        including its CRC, and dtype the structured dtype of the payload.  A field
+        name that occurs in two enabled groups is prefixed by its group name the
+        second time, e.g. 'attitude_ypr' next to 'ypr'. """
+
+    def __init__(self, common=0, time=0, imu=0, gps=0, attitude=0, ins=0):
+        self.fields = (common, time, imu, gps, attitude, ins)
+        groups = 0
+        header = bytearray([SYNC, 0])
+        names, formats, offsets = [], [], []
+        offset = 0
+        for index, mask in enumerate(self.fields):
+            if not mask:
+                continue
+            if mask & 0x8000:
+                raise ValueError('extended %s group fields are not supported' % GROUPS[index][0])
+            groups |= 1 << index
+            header += bytearray([mask & 0xFF, mask >> 8])
+            group_name, group_fields = GROUPS[index]
+            for bit, (name, format) in enumerate(group_fields):
+                if not mask & (1 << bit):
+                    continue
+                if name in names:
+                    name = '%s_%s' % (group_name, name)
+                names.append(name)
+                formats.append(format)
+                offsets.append(offset)
+                offset += np.dtype(format).itemsize
+        if not groups:
+            raise ValueError('no output fields enabled')
+        header[1] = groups
+        self.header = bytes(header)
+        self.dtype = np.dtype({'names': names, 'formats': formats, 'offsets': offsets,
+                               'itemsize': offset})
+        self.length = len(self.header) + offset + 2
+
+    @classmethod
+    def from_register(cls, register):
+        """ The layout of a vnpy.BinaryOutputRegister. """
+        return cls(int(register.common_field), int(register.time_field), int(register.imu_field),
+                   int(register.gps_field), int(register.attitude_field), int(register.ins_field))
+
+    def __repr__(self):
+        return 'BinaryLayout(%s)' % ', '.join('%s=0x%04X' % (GROUPS[i][0], mask)
+                                               for i, mask in enumerate(self.fields) if mask)
+
+
+def _as_layout(layout):
+    return layout if isinstance(layout, BinaryLayout) else BinaryLayout.from_register(layout)
+
+
+def crc16(data, offsets, length):
+    """ CRC16 of the length bytes at each of offsets in the uint8 array data, all
+        packets at once.  Zero for a packet (without its sync byte) and its CRC. """
+    crc = np.zeros(len(offsets), dtype=np.uint16)
+    for i in range(length):
+        crc = (crc << 8) ^ CRC_TABLE[(crc >> 8) ^ data[offsets + i]]
+    return crc
+
+
+def find_packets(data, layout):
+    """ Returns the offsets of the valid packets with layout in data (any buffer).
+
+        Candidates are the positions of the header; those with a bad CRC are
+        dropped, as are those that start inside a preceding valid packet. """
+    layout = _as_layout(layout)
+    data = np.frombuffer(data, dtype=np.uint8)
+    length = layout.length
+    if len(data) < length:
+        return np.zeros(0, dtype=np.intp)
+    offsets = np.flatnonzero(data[:len(data) - length + 1] == SYNC)
+    for i, value in enumerate(bytearray(layout.header)):
+        if i:
+            offsets = offsets[data[offsets + i] == value]
+    offsets = offsets[crc16(data, offsets + 1, length - 1) == 0]
+    while len(offsets) > 1:
+        close = np.diff(offsets) < length
+        if not close.any():
+            break
+        # Drop the second packet of the first overlapping pair of every run
+        first = close & ~np.concatenate(([False], close[:-1]))
+        offsets = np.delete(offsets, np.flatnonzero(first) + 1)
+    return offsets
+
+
+def decode_at(data, offsets, layout):
+    """ Decodes the packets with layout at offsets in data (any buffer) into a dict
+        of one contiguous array per field, in packet order. """
+    layout = _as_layout(layout)
+    data = np.frombuffer(data, dtype=np.uint8)
+    start = len(layout.header)
+    payload = data[np.asarray(offsets)[:, None] + np.arange(start, start + layout.dtype.itemsize)]
+    records = payload.view(layout.dtype).reshape(len(payload))
+    return dict((name, np.ascontiguousarray(records[name])) for name in layout.dtype.names)
+
+
+def decode(data, layout):
+    """ Finds and decodes every valid packet with layout in data (any buffer).
+        Returns a dict of one array per field. """
+    return decode_at(data, find_packets(data, layout), layout)
+
+
+def decode_file(path, layout):
+    """ decode() of a raw capture file, mapped into memory rather than read. """
+    with open(path, 'rb') as f:
+        if not f.seek(0, 2):
+            return decode(b'', layout)
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return decode(m, layout)
+    finally:
+        # The columns are copies, so nothing refers to the mapping any more
+        m.close()
@@ -1,29 +1,94 @@
-import vnpy
-from . import vncxxlib as lib
-from .vncxxlib import (celsius2fahren, fahren2celsius, celsius2kelvin, kelvin2celsius, fahren2kelvin, kelvin2fahren,
+from . import libvncxx as lib
+from .libvncxx import (vec3f, vec3d,
+                       celsius2fahren, fahren2celsius, celsius2kelvin, kelvin2celsius, fahren2kelvin, kelvin2fahren,
                        ypr_degs2quat, ypr_rads2quat, ypr_degs2dcm, ypr_rads2dcm, quat2ypr_degs, quat2ypr_rads,
                        quat2dcm, dcm2ypr_degs, dcm2ypr_rads, dcm2quat, velocity_ned_xy2course_over_ground,
                        velocity_ned_xy2speed_over_ground, quat2omega_phi_kappa_rads, dcm2omega_phi_kappa_rads,
                        ypr_degs2omega_phi_kappa_rads, ypr_rads2omega_phi_kappa_rads)
 
+__all__ = ['celsius2fahren', 'fahren2celsius', 'celsius2kelvin', 'kelvin2celsius', 'fahren2kelvin', 'kelvin2fahren',
+           'ypr_degs2quat', 'ypr_rads2quat', 'ypr_degs2dcm', 'ypr_rads2dcm', 'quat2ypr_degs', 'quat2ypr_rads',
+           'quat2dcm', 'dcm2ypr_degs', 'dcm2ypr_rads', 'dcm2quat', 'velocity_ned_xy2course_over_ground',
+           'velocity_ned_xy2speed_over_ground', 'quat2omega_phi_kappa_rads', 'dcm2omega_phi_kappa_rads',
+           'ypr_degs2omega_phi_kappa_rads', 'ypr_rads2omega_phi_kappa_rads', 'rad2deg', 'deg2rad',
+           'quat2ypr_degs_array', 'quat2ypr_rads_array', 'ypr_degs2quat_array', 'quat2dcm_array', 'dcm2quat_array',
+           'quat2omega_phi_kappa_rads_array']
+
 
 def rad2deg(val):
-    if type(val) is vnpy.vec3f:
+    """ Converts radians to degrees: a number, vec3f, vec3d or NumPy array (any
+        shape, converted elementwise into a new array). """
+    if type(val) is vec3f:
         return lib.__rad2deg_v3f(val)
-    elif type(val) is vnpy.vec3d:
+    elif type(val) is vec3d:
         return lib.__rad2deg_v3d(val)
-    elif type(val) is int or type(val) is float:
+    elif hasattr(val, '__array_interface__'):
+        import numpy as np
+        return np.degrees(val)
+    elif isinstance(val, (int, float)):
         return lib.__rad2deg_d(val)
 
     raise RuntimeError('unknown type')
 
 
 def deg2rad(val):
-    if type(val) is vnpy.vec3f:
+    """ Converts degrees to radians: a number, vec3f, vec3d or NumPy array (any
+        shape, converted elementwise into a new array). """
+    if type(val) is vec3f:
         return lib.__deg2rad_v3f(val)
-    elif type(val) is vnpy.vec3d:
+    elif type(val) is vec3d:
         return lib.__deg2rad_v3d(val)
-    elif type(val) is int or type(val) is float:
+    elif hasattr(val, '__array_interface__'):
+        import numpy as np
+        return np.radians(val)
+    elif isinstance(val, (int, float)):
         return lib.__deg2rad_d(val)
 
     raise RuntimeError('unknown type')
+
+
+# Batched versions of the conversions above.  Each takes an array of values
+# (anything NumPy can turn into an array; the last dimensions give one value) and
+# returns a float32 array of the results, converted by the library in one call
+# without holding the GIL.  The math is the library's float math, the same as
+# that of the single value functions.
+
+def _convert_array(convert, values, in_shape, out_shape):
+    import numpy as np
+    values = np.ascontiguousarray(values, dtype=np.float32)
+    if values.shape[values.ndim - len(in_shape):] != in_shape:
+        raise ValueError('expected an array of shape (..., %s)' % ', '.join(str(n) for n in in_shape))
+    batch = values.shape[:values.ndim - len(in_shape)]
+    result = np.empty(batch + out_shape, dtype=np.float32)
+    convert(values, result)
+    return result
+
+
+def quat2ypr_degs_array(quats):
+    """ (..., 4) quaternions to (..., 3) yaw, pitch, roll in degrees. """
+    return _convert_array(lib.__quat2ypr_degs_array, quats, (4,), (3,))
+
+
+def quat2ypr_rads_array(quats):
+    """ (..., 4) quaternions to (..., 3) yaw, pitch, roll in radians. """
+    return _convert_array(lib.__quat2ypr_rads_array, quats, (4,), (3,))
+
+
+def ypr_degs2quat_array(yprs):
+    """ (..., 3) yaw, pitch, roll in degrees to (..., 4) quaternions. """
+    return _convert_array(lib.__ypr_degs2quat_array, yprs, (3,), (4,))
+
+
+def quat2dcm_array(quats):
+    """ (..., 4) quaternions to (..., 3, 3) direction cosine matrices. """
+    return _convert_array(lib.__quat2dcm_array, quats, (4,), (3, 3))
+
+
+def dcm2quat_array(dcms):
+    """ (..., 3, 3) direction cosine matrices to (..., 4) quaternions. """
+    return _convert_array(lib.__dcm2quat_array, dcms, (3, 3), (4,))
+
+
+def quat2omega_phi_kappa_rads_array(quats):
+    """ (..., 4) quaternions to (..., 3) omega, phi, kappa in radians. """
+    return _convert_array(lib.__quat2omega_phi_kappa_rads_array, quats, (4,), (3,))
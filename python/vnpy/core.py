@@ -0,0 +1,7 @@
+""" The sensor, its data and the vector and matrix types: VnSensor, EzAsyncData,
+    MemoryPort, CompositeData and vec3f etc. """
+
+from .libvncxx import (VnSensor, SensorSnapshot, EzAsyncData, MemoryPort, CompositeData, Attitude, Position, TimeUtc,
+                       vec3f, vec3d, vec4f, mat3f, PlainVec3, PlainVec4, PlainMat3, as_plain_data, plain_record_type)
+
+__all__ = [name for name in dir() if not name.startswith('_')]
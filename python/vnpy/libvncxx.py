@@ -98,6 +98,21 @@ except __builtin__.Exception:
         pass
     _newclass = 0
 
+_swig_byteorder = '<' if __import__('sys').byteorder == 'little' else '>'
+
+
+def _swig_array_interface(self, typestr, shape, strides=None):
+    """The NumPy array interface of a vector or matrix: its own memory, not a copy."""
+    return {'version': 3, 'typestr': _swig_byteorder + typestr, 'shape': shape, 'strides': strides,
+            'data': (int(self.this), False)}
+
+
+def _swig_from_buffer(make, data):
+    result = make(data)
+    result.__dict__['_buffer'] = memoryview(data)
+    return result
+
+
 class vec3f(_object):
     """Proxy of C++ vn::math::vec<(3,float)> class."""
 
@@ -271,11 +286,27 @@ class vec3f(_object):
         """__str__(vec3f self) -> char *"""
         return _libvncxx.vec3f___str__(self)
 
+    __array_interface__ = property(lambda self: _swig_array_interface(self, 'f4', (3,)))
+
+    def from_buffer(data):
+        """from_buffer(buffer data) -> vec3f
+
+        A vec3f stored in data (3 contiguous, writable float32 values,
+        e.g. a NumPy array) instead of memory of its own, so that changing one
+        changes the other.  The vec3f keeps data alive."""
+        return _swig_from_buffer(_libvncxx.vec3f_from_buffer, data)
+
+    from_buffer = staticmethod(from_buffer)
+
     __swig_destroy__ = _libvncxx.delete_vec3f
     __del__ = lambda self: None
 vec3f_swigregister = _libvncxx.vec3f_swigregister
 vec3f_swigregister(vec3f)
 
+def vec3f_from_buffer(data):
+    """vec3f_from_buffer(buffer data) -> vec3f"""
+    return _swig_from_buffer(_libvncxx.vec3f_from_buffer, data)
+
 def vec3f_zero():
     """vec3f_zero() -> vec3f"""
     return _libvncxx.vec3f_zero()
@@ -469,11 +500,27 @@ class vec3d(_object):
         """__str__(vec3d self) -> char *"""
         return _libvncxx.vec3d___str__(self)
 
+    __array_interface__ = property(lambda self: _swig_array_interface(self, 'f8', (3,)))
+
+    def from_buffer(data):
+        """from_buffer(buffer data) -> vec3d
+
+        A vec3d stored in data (3 contiguous, writable float64 values,
+        e.g. a NumPy array) instead of memory of its own, so that changing one
+        changes the other.  The vec3d keeps data alive."""
+        return _swig_from_buffer(_libvncxx.vec3d_from_buffer, data)
+
+    from_buffer = staticmethod(from_buffer)
+
     __swig_destroy__ = _libvncxx.delete_vec3d
     __del__ = lambda self: None
 vec3d_swigregister = _libvncxx.vec3d_swigregister
 vec3d_swigregister(vec3d)
 
+def vec3d_from_buffer(data):
+    """vec3d_from_buffer(buffer data) -> vec3d"""
+    return _swig_from_buffer(_libvncxx.vec3d_from_buffer, data)
+
 def vec3d_zero():
     """vec3d_zero() -> vec3d"""
     return _libvncxx.vec3d_zero()
@@ -682,11 +729,27 @@ class vec4f(_object):
         """__str__(vec4f self) -> char *"""
         return _libvncxx.vec4f___str__(self)
 
+    __array_interface__ = property(lambda self: _swig_array_interface(self, 'f4', (4,)))
+
+    def from_buffer(data):
+        """from_buffer(buffer data) -> vec4f
+
+        A vec4f stored in data (4 contiguous, writable float32 values,
+        e.g. a NumPy array) instead of memory of its own, so that changing one
+        changes the other.  The vec4f keeps data alive."""
+        return _swig_from_buffer(_libvncxx.vec4f_from_buffer, data)
+
+    from_buffer = staticmethod(from_buffer)
+
     __swig_destroy__ = _libvncxx.delete_vec4f
     __del__ = lambda self: None
 vec4f_swigregister = _libvncxx.vec4f_swigregister
 vec4f_swigregister(vec4f)
 
+def vec4f_from_buffer(data):
+    """vec4f_from_buffer(buffer data) -> vec4f"""
+    return _swig_from_buffer(_libvncxx.vec4f_from_buffer, data)
+
 def vec4f_zero():
     """vec4f_zero() -> vec4f"""
     return _libvncxx.vec4f_zero()
@@ -917,11 +980,28 @@ class mat3f(_object):
     #def __repr__(self):
     #	return "<vnpy.mat3f>"
 
+    __array_interface__ = property(lambda self: _swig_array_interface(self, 'f4', (3, 3), (4, 12)))
+
+    def from_buffer(data):
+        """from_buffer(buffer data) -> mat3f
+
+        A mat3f stored in data (9 writable float32 values, stored column by column as in a
+        Fortran ordered (3, 3) array,
+        e.g. a NumPy array) instead of memory of its own, so that changing one
+        changes the other.  The mat3f keeps data alive."""
+        return _swig_from_buffer(_libvncxx.mat3f_from_buffer, data)
+
+    from_buffer = staticmethod(from_buffer)
+
     __swig_destroy__ = _libvncxx.delete_mat3f
     __del__ = lambda self: None
 mat3f_swigregister = _libvncxx.mat3f_swigregister
 mat3f_swigregister(mat3f)
 
+def mat3f_from_buffer(data):
+    """mat3f_from_buffer(buffer data) -> mat3f"""
+    return _swig_from_buffer(_libvncxx.mat3f_from_buffer, data)
+
 def mat3f_zero():
     """mat3f_zero() -> mat3f"""
     return _libvncxx.mat3f_zero()
@@ -1210,6 +1290,30 @@ def ypr_rads2omega_phi_kappa_rads(yprRads):
     """ypr_rads2omega_phi_kappa_rads(vec3f yprRads) -> vec3f"""
     return _libvncxx.ypr_rads2omega_phi_kappa_rads(yprRads)
 
+def __quat2ypr_degs_array(quats, yprs):
+    """__quat2ypr_degs_array(buffer quats, buffer yprs)"""
+    return _libvncxx.__quat2ypr_degs_array(quats, yprs)
+
+def __quat2ypr_rads_array(quats, yprs):
+    """__quat2ypr_rads_array(buffer quats, buffer yprs)"""
+    return _libvncxx.__quat2ypr_rads_array(quats, yprs)
+
+def __ypr_degs2quat_array(yprs, quats):
+    """__ypr_degs2quat_array(buffer yprs, buffer quats)"""
+    return _libvncxx.__ypr_degs2quat_array(yprs, quats)
+
+def __quat2dcm_array(quats, dcms):
+    """__quat2dcm_array(buffer quats, buffer dcms)"""
+    return _libvncxx.__quat2dcm_array(quats, dcms)
+
+def __dcm2quat_array(dcms, quats):
+    """__dcm2quat_array(buffer dcms, buffer quats)"""
+    return _libvncxx.__dcm2quat_array(dcms, quats)
+
+def __quat2omega_phi_kappa_rads_array(quats, angles):
+    """__quat2omega_phi_kappa_rads_array(buffer quats, buffer angles)"""
+    return _libvncxx.__quat2omega_phi_kappa_rads_array(quats, angles)
+
 def __rad2deg_v3f(anglesInRads):
     """__rad2deg_v3f(vec3f anglesInRads) -> vec3f"""
     return _libvncxx.__rad2deg_v3f(anglesInRads)
@@ -5369,6 +5473,60 @@ class SwigPyIterator(_object):
 SwigPyIterator_swigregister = _libvncxx.SwigPyIterator_swigregister
 SwigPyIterator_swigregister(SwigPyIterator)
 
+from collections import namedtuple as _namedtuple
+import time as _time
+import threading as _threading
+
+class SensorSnapshot(_namedtuple('SensorSnapshot', ['time', 'yaw_pitch_roll', 'mag', 'accel', 'gyro'])):
+	"""One coherent sample returned by VnSensor.read_snapshot().
+
+	time is the host time.monotonic() value (in seconds) at the midpoint of the
+	register transaction. The remaining fields are taken from a single
+	YawPitchRollMagneticAccelerationAndAngularRatesRegister reply, so they all
+	describe the same instant."""
+	__slots__ = ()
+
+PlainVec3 = _libvncxx.PlainVec3
+PlainVec4 = _libvncxx.PlainVec4
+PlainMat3 = _libvncxx.PlainMat3
+_plain_vector_types = (vec3f, vec3d, vec4f, mat3f)
+
+_plain_record_types = {}
+
+
+def plain_record_type(cls):
+    """plain_record_type(type cls) -> type
+
+    The named tuple type that as_plain_data() returns for instances of the SWIG
+    proxy class cls (a register), with the same fields."""
+    try:
+        return _plain_record_types[cls][0]
+    except KeyError:
+        pass
+    getters = list(cls.__swig_getmethods__.items())
+    record_type = _namedtuple(cls.__name__ + 'Record', [name for name, _ in getters])
+    record_type.__module__ = __name__
+    _plain_record_types[cls] = record_type, [getter for _, getter in getters]
+    return record_type
+
+
+def as_plain_data(value):
+    """as_plain_data(value) -> PlainVec3, PlainVec4, PlainMat3, record or value
+
+    value as plain data: a vec3f, vec3d, vec4f or mat3f as a PlainVec3, PlainVec4
+    or PlainMat3 (a tuple with named fields, built in C), a register as a
+    plain_record_type() record of its fields as plain data.  Anything else is
+    returned unchanged."""
+    cls = type(value)
+    if cls in _plain_vector_types:
+        return _libvncxx.plain_data(value)
+    if not hasattr(cls, '__swig_getmethods__'):
+        return value
+    if cls not in _plain_record_types:
+        plain_record_type(cls)
+    record_type, getters = _plain_record_types[cls]
+    return record_type(*[as_plain_data(getter(value)) for getter in getters])
+
 class VnSensor(_object):
     """Proxy of C++ vn::sensors::VnSensor class."""
 
@@ -5401,6 +5559,8 @@ class VnSensor(_object):
             self.this.append(this)
         except __builtin__.Exception:
             self.this = this
+        # A new C++ sensor may reuse the address of a deleted one
+        _sensor_states.pop(int(self.this), None)
     __swig_destroy__ = _libvncxx.delete_VnSensor
     __del__ = lambda self: None
 
@@ -5511,6 +5671,22 @@ class VnSensor(_object):
         return _libvncxx.VnSensor_unregisterRawDataReceivedHandler(self)
 
 
+    def register_raw_data_received_handler(self, handler):
+        """register_raw_data_received_handler(VnSensor self, callable handler)
+
+        handler(data, running_index) is called with the bytes of every read from
+        the port, before they are parsed, on the thread that reads the port.
+        running_index is the number of bytes received before data."""
+        _libvncxx.VnSensor_register_raw_data_received_handler(self, handler)
+
+
+    def unregister_raw_data_received_handler(self):
+        """unregister_raw_data_received_handler(VnSensor self)
+
+        Waits for a call of the handler in progress to return."""
+        _libvncxx.VnSensor_unregister_raw_data_received_handler(self)
+
+
     def registerPossiblePacketFoundHandler(self, userData, handler):
         """registerPossiblePacketFoundHandler(VnSensor self, void * userData, vn::sensors::VnSensor::PossiblePacketFoundHandler handler)"""
         return _libvncxx.VnSensor_registerPossiblePacketFoundHandler(self, userData, handler)
@@ -5834,6 +6010,16 @@ class VnSensor(_object):
         """read_yaw_pitch_roll_magnetic_acceleration_and_angular_rates(VnSensor self) -> YawPitchRollMagneticAccelerationAndAngularRatesRegister"""
         return _libvncxx.VnSensor_read_yaw_pitch_roll_magnetic_acceleration_and_angular_rates(self)
 
+    def read_snapshot(self):
+    	"""read_snapshot(VnSensor self) -> SensorSnapshot
+
+    	Reads attitude, magnetic, acceleration and angular rate in a single
+    	transaction with the sensor instead of one transaction per quantity."""
+    	start = _time.monotonic()
+    	reg = self.read_yaw_pitch_roll_magnetic_acceleration_and_angular_rates()
+    	stamp = (start + _time.monotonic()) / 2.0
+    	return SensorSnapshot(stamp, reg.yaw_pitch_roll, reg.mag, reg.accel, reg.gyro)
+
 
     def read_communication_protocol_control(self):
         """read_communication_protocol_control(VnSensor self) -> CommunicationProtocolControlRegister"""
@@ -6295,9 +6481,195 @@ class VnSensor(_object):
     def __repr__(self):
     	return "<vnpy.VnSensor>"
 
+    # Set to return plain data (see as_plain_data()) instead of SWIG proxies from
+    # the read_* methods of this sensor.  The setting belongs to the C++ sensor, so
+    # it applies to every proxy of it, e.g. each one EzAsyncData.sensor returns.
+    def __get_plain_data(self):
+        return _sensor_state(self).plain_data
+
+    def __set_plain_data(self, value):
+        _sensor_state(self).plain_data = bool(value)
+
+    __swig_setmethods__["plain_data"] = __set_plain_data
+    __swig_getmethods__["plain_data"] = __get_plain_data
+    if _newclass:
+        plain_data = _swig_property(__get_plain_data, __set_plain_data)
+
+    # Set to keep the values of the configuration registers (_CACHED_REGISTERS) read
+    # from this sensor and return them again without a transaction.  Writing a
+    # register through this object, reset(), restore_factory_settings() and
+    # transaction() drop the cached values they may change.  Like plain_data, the
+    # setting and the cached values are shared by every proxy of the C++ sensor.
+    def __get_cache_registers(self):
+        return _sensor_state(self).cache_registers
+
+    def __set_cache_registers(self, value):
+        _sensor_state(self).cache_registers = bool(value)
+
+    __swig_setmethods__["cache_registers"] = __set_cache_registers
+    __swig_getmethods__["cache_registers"] = __get_cache_registers
+    if _newclass:
+        cache_registers = _swig_property(__get_cache_registers, __set_cache_registers)
+
+    def refresh_registers(self, *registers):
+        """refresh_registers(VnSensor self, int registers...)
+
+        Drops the cached values of the given register IDs, or of all registers
+        without arguments, so that their next read goes to the sensor."""
+        _sensor_state(self).registers.invalidate(*registers)
+
 VnSensor_swigregister = _libvncxx.VnSensor_swigregister
 VnSensor_swigregister(VnSensor)
 
+
+class _SensorState(object):
+    """Python-side settings of one C++ VnSensor, shared by all its proxies."""
+
+    __slots__ = ('plain_data', 'cache_registers', 'registers')
+
+    def __init__(self):
+        self.plain_data = False
+        self.cache_registers = False
+        self.registers = _RegisterCache()
+
+
+# _SensorState by the address of the C++ VnSensor
+_sensor_states = {}
+
+
+def _sensor_state(sensor):
+    state = _sensor_states.get(int(sensor.this))
+    if state is None:
+        state = _sensor_states.setdefault(int(sensor.this), _SensorState())
+    return state
+
+
+# Register IDs of the configuration registers, by the name of their read_ and write_
+# methods.  Measurement and status registers are never cached.
+_CACHED_REGISTERS = {
+    'user_tag': 0, 'model_number': 1, 'hardware_revision': 2, 'serial_number': 3, 'firmware_version': 4,
+    'serial_baudrate': 5, 'async_data_output_type': 6, 'async_data_output_frequency': 7,
+    'magnetic_and_gravity_reference_vectors': 21, 'filter_measurements_variance_parameters': 22,
+    'magnetometer_compensation': 23, 'filter_active_tuning_parameters': 24, 'acceleration_compensation': 25,
+    'reference_frame_rotation': 26, 'communication_protocol_control': 30, 'synchronization_control': 32,
+    'filter_basic_control': 34, 'vpe_basic_control': 35, 'vpe_magnetometer_basic_tuning': 36,
+    'vpe_magnetometer_advanced_tuning': 37, 'vpe_accelerometer_basic_tuning': 38,
+    'vpe_accelerometer_advanced_tuning': 39, 'filter_startup_gyro_bias': 43,
+    'magnetometer_calibration_control': 44, 'indoor_heading_mode_control': 48,
+    'velocity_compensation_control': 51, 'gps_configuration': 55, 'gps_antenna_offset': 57,
+    'ins_basic_configuration_vn200': 67, 'ins_basic_configuration_vn300': 67, 'ins_advanced_configuration': 68,
+    'binary_output_1': 75, 'binary_output_2': 76, 'binary_output_3': 77,
+    'delta_theta_and_delta_velocity_configuration': 82, 'reference_vector_configuration': 83,
+    'gyro_compensation': 84, 'imu_filtering_configuration': 85, 'gps_compass_baseline': 93,
+    'imu_rate_configuration': 227,
+}
+
+
+class _RegisterCache(object):
+    """Cached register values of one VnSensor, by (register ID, read arguments).
+    generation counts invalidations, so that a read that overlapped one does not
+    store the value it got."""
+
+    __slots__ = ('values', 'generation', 'lock')
+
+    def __init__(self):
+        self.values = {}
+        self.generation = 0
+        self.lock = _threading.Lock()
+
+    def invalidate(self, *registers):
+        with self.lock:
+            self.generation += 1
+            if registers:
+                for key in [key for key in self.values if key[0] in registers]:
+                    del self.values[key]
+            else:
+                self.values.clear()
+
+
+_copy_vector = {
+    vec3f: lambda v: vec3f(v.x, v.y, v.z),
+    vec3d: lambda v: vec3d(v.x, v.y, v.z),
+    vec4f: lambda v: vec4f(v.x, v.y, v.z, v.w),
+    mat3f: lambda m: mat3f(m.e00, m.e01, m.e02, m.e10, m.e11, m.e12, m.e20, m.e21, m.e22),
+}
+
+
+def _copy_value(value):
+    # Proxies are mutable, so the cache hands out copies of them
+    cls = type(value)
+    if cls in _copy_vector:
+        return _copy_vector[cls](value)
+    if not hasattr(cls, '__swig_setmethods__'):
+        return value
+    result = cls()
+    for name, setter in cls.__swig_setmethods__.items():
+        setter(result, cls.__swig_getmethods__[name](value))
+    return result
+
+
+def _cached_read(read, register):
+    def cached_read(self, *args):
+        state = _sensor_state(self)
+        if not state.cache_registers:
+            return read(self, *args)
+        cache = state.registers
+        key = (register, args)
+        with cache.lock:
+            value = cache.values.get(key)
+            generation = cache.generation
+        if value is None:
+            value = read(self, *args)
+            with cache.lock:
+                if cache.generation == generation:
+                    cache.values[key] = _copy_value(value)
+            return value
+        return _copy_value(value)
+    cached_read.__name__ = read.__name__
+    cached_read.__doc__ = read.__doc__
+    return cached_read
+
+
+def _invalidating(method, *registers):
+    def invalidating(self, *args):
+        try:
+            return method(self, *args)
+        finally:
+            _sensor_state(self).registers.invalidate(*registers)
+    invalidating.__name__ = method.__name__
+    invalidating.__doc__ = method.__doc__
+    return invalidating
+
+for _name, _register in _CACHED_REGISTERS.items():
+    if 'read_' + _name in VnSensor.__dict__:
+        setattr(VnSensor, 'read_' + _name, _cached_read(VnSensor.__dict__['read_' + _name], _register))
+    if 'write_' + _name in VnSensor.__dict__:
+        setattr(VnSensor, 'write_' + _name, _invalidating(VnSensor.__dict__['write_' + _name], _register))
+for _name in ('connect', 'disconnect', 'transaction', 'reset', 'restore_factory_settings'):
+    setattr(VnSensor, _name, _invalidating(VnSensor.__dict__[_name]))
+# Setting the gyro bias may change the startup gyro bias the sensor keeps
+VnSensor.set_gyro_bias = _invalidating(VnSensor.__dict__['set_gyro_bias'], _CACHED_REGISTERS['filter_startup_gyro_bias'])
+# Methods that write a register but are not named after it
+VnSensor.change_baudrate = _invalidating(VnSensor.__dict__['change_baudrate'], _CACHED_REGISTERS['serial_baudrate'])
+VnSensor.writeDeltaThetaAndDeltaVelocityConfiguration = _invalidating(
+    VnSensor.__dict__['writeDeltaThetaAndDeltaVelocityConfiguration'],
+    _CACHED_REGISTERS['delta_theta_and_delta_velocity_configuration'])
+VnSensor.writeVpeGyroBasicTuning = _invalidating(VnSensor.__dict__['writeVpeGyroBasicTuning'], 40)
+del _name, _register
+
+
+def _plain_read(read):
+    def plain_read(self, *args):
+        value = read(self, *args)
+        return as_plain_data(value) if self.plain_data else value
+    plain_read.__name__ = read.__name__
+    plain_read.__doc__ = read.__doc__
+    return plain_read
+
+for _name in [name for name in VnSensor.__dict__ if name.startswith('read_') and name != 'read_snapshot']:
+    setattr(VnSensor, _name, _plain_read(VnSensor.__dict__[_name]))
+del _name
+
 def VnSensor___supported_baudrates():
     """VnSensor___supported_baudrates() -> UInt32Vector"""
     return _libvncxx.VnSensor___supported_baudrates()
@@ -7330,8 +7702,17 @@ class EzAsyncData(_object):
     __swig_getmethods__ = {}
     __getattr__ = lambda self, name: _swig_getattr(self, EzAsyncData, name)
 
-    def __init__(self, *args, **kwargs):
-        raise AttributeError("No constructor defined")
+    def __init__(self, sensor):
+        """__init__(vn::sensors::EzAsyncData self, VnSensor sensor) -> EzAsyncData
+
+        Wraps an already connected VnSensor, e.g. one connected to a MemoryPort.
+        The EzAsyncData takes ownership of the sensor."""
+        this = _libvncxx.new_EzAsyncData(sensor)
+        sensor.thisown = 0
+        try:
+            self.this.append(this)
+        except __builtin__.Exception:
+            self.this = this
     __repr__ = _swig_repr
     __swig_destroy__ = _libvncxx.delete_EzAsyncData
     __del__ = lambda self: None
@@ -7343,7 +7724,9 @@ class EzAsyncData(_object):
 
     def connect(portName, baudrate):
         """connect(std::string portName, uint32_t baudrate) -> EzAsyncData"""
-        return _libvncxx.EzAsyncData_connect(portName, baudrate)
+        ez = _libvncxx.EzAsyncData_connect(portName, baudrate)
+        _sensor_states.pop(int(ez.sensor.this), None)
+        return ez
 
     connect = staticmethod(connect)
 
@@ -7364,9 +7747,60 @@ class EzAsyncData(_object):
         """
         return _libvncxx.EzAsyncData_next_data(self, *args)
 
+    OVERFLOW_BLOCK = _libvncxx.EzAsyncData_OVERFLOW_BLOCK
+    OVERFLOW_DROP_OLDEST = _libvncxx.EzAsyncData_OVERFLOW_DROP_OLDEST
+    OVERFLOW_DROP_NEWEST = _libvncxx.EzAsyncData_OVERFLOW_DROP_NEWEST
+
+    def enable_queue(self, capacity, policy=_libvncxx.EzAsyncData_OVERFLOW_DROP_OLDEST):
+        """enable_queue(EzAsyncData self, size_t capacity, vn::sensors::EzAsyncData::OverflowPolicy policy=OVERFLOW_DROP_OLDEST)"""
+        return _libvncxx.EzAsyncData_enable_queue(self, capacity, policy)
+
+
+    def disable_queue(self):
+        """disable_queue(EzAsyncData self)"""
+        return _libvncxx.EzAsyncData_disable_queue(self)
+
+
+    def next_batch(self, max_items, timeout_ms):
+        """next_batch(EzAsyncData self, size_t maxItems, int timeoutMs) -> list of CompositeData"""
+        return _libvncxx.EzAsyncData_next_batch(self, max_items, timeout_ms)
+
+
+    def drain_into(self, records, timeout_ms=0):
+        """drain_into(EzAsyncData self, buffer records, int timeoutMs=0) -> size_t
+
+        Moves up to len(records) queued packets into records, a writable array
+        with the vnpy.records.COMPOSITE_RECORD_DTYPE layout, without creating
+        any CompositeData objects. Returns the number of records written."""
+        return _libvncxx.EzAsyncData_drain_into(self, records, timeout_ms)
+
+
+    def __queueEnabled(self):
+        """__queueEnabled(EzAsyncData self) -> bool"""
+        return _libvncxx.EzAsyncData___queueEnabled(self)
+
+
+    def __queueSize(self):
+        """__queueSize(EzAsyncData self) -> size_t"""
+        return _libvncxx.EzAsyncData___queueSize(self)
+
+
+    def __droppedCount(self):
+        """__droppedCount(EzAsyncData self) -> uint64_t"""
+        return _libvncxx.EzAsyncData___droppedCount(self)
+
+
+    def __overflowCount(self):
+        """__overflowCount(EzAsyncData self) -> uint64_t"""
+        return _libvncxx.EzAsyncData___overflowCount(self)
+
 
     current_data = property(__currentData)
     sensor = property(__sensor)
+    queue_enabled = property(__queueEnabled)
+    queue_size = property(__queueSize)
+    dropped_count = property(__droppedCount)
+    overflow_count = property(__overflowCount)
 
     def __repr__(self):
     	return "<vnpy.EzAsyncData>"
@@ -7376,7 +7810,101 @@ EzAsyncData_swigregister(EzAsyncData)
 
 def EzAsyncData_connect(portName, baudrate):
     """EzAsyncData_connect(std::string portName, uint32_t baudrate) -> EzAsyncData"""
-    return _libvncxx.EzAsyncData_connect(portName, baudrate)
+    return EzAsyncData.connect(portName, baudrate)
+
+class MemoryPort(_object):
+    """Proxy of C++ vn::util::MemoryPort class.
+
+    An in-memory port that a VnSensor can be connected to in place of a serial
+    port: bytes the sensor writes are passed to the data written handler, and
+    send_data_back_door() delivers bytes to the sensor as if it had received them."""
+
+    __swig_setmethods__ = {}
+    __setattr__ = lambda self, name, value: _swig_setattr(self, MemoryPort, name, value)
+    __swig_getmethods__ = {}
+    __getattr__ = lambda self, name: _swig_getattr(self, MemoryPort, name)
+    __repr__ = _swig_repr
+
+    def __init__(self):
+        """__init__(vn::util::MemoryPort self) -> MemoryPort"""
+        this = _libvncxx.new_MemoryPort()
+        try:
+            self.this.append(this)
+        except __builtin__.Exception:
+            self.this = this
+    __del__ = lambda self: None
+
+    def send_data_back_door(self, data):
+        """send_data_back_door(MemoryPort self, buffer data)
+
+        Delivers data (bytes or any other buffer) to the connected sensor. The
+        sensor parses it before this returns."""
+        return _libvncxx.MemoryPort_send_data_back_door(self, data)
+
+
+    def register_data_written_handler(self, handler):
+        """register_data_written_handler(MemoryPort self, callable handler)
+
+        handler(data) is called with the bytes of every write, on the thread
+        that writes."""
+        _libvncxx.MemoryPort_register_data_written_handler(self, handler)
+
+
+    def unregister_data_written_handler(self):
+        """unregister_data_written_handler(MemoryPort self)"""
+        _libvncxx.MemoryPort_unregister_data_written_handler(self)
+
+class PacketFinder(_object):
+    """Proxy of C++ vn::protocol::uart::PacketFinder class.
+
+    Finds ASCII and binary packets in a stream of bytes fed to it in chunks of
+    any size, as VnSensor does with the bytes it reads from its port."""
+
+    __swig_setmethods__ = {}
+    __setattr__ = lambda self, name, value: _swig_setattr(self, PacketFinder, name, value)
+    __swig_getmethods__ = {}
+    __getattr__ = lambda self, name: _swig_getattr(self, PacketFinder, name)
+    __repr__ = _swig_repr
+
+    def __init__(self, *args):
+        """
+        __init__(vn::protocol::uart::PacketFinder self) -> PacketFinder
+        __init__(vn::protocol::uart::PacketFinder self, size_t internalReceiveBufferSize) -> PacketFinder
+        """
+        this = _libvncxx.new_PacketFinder(*args)
+        try:
+            self.this.append(this)
+        except __builtin__.Exception:
+            self.this = this
+    __swig_destroy__ = _libvncxx.delete_PacketFinder
+    __del__ = lambda self: None
+
+    def process_received_data(self, data):
+        """process_received_data(PacketFinder self, buffer data)
+
+        Parses data (bytes, bytearray, memoryview, mmap or a contiguous numpy
+        uint8 array) in place, without copying it or holding the GIL.  The
+        possible packet found handler is called for every packet before this
+        returns."""
+        return _libvncxx.PacketFinder_process_received_data(self, data)
+
+
+    def register_possible_packet_found_handler(self, handler):
+        """register_possible_packet_found_handler(PacketFinder self, callable handler)
+
+        handler(packet, running_index) is called with a copy of every possible
+        packet and the index of its first byte in the stream; check
+        packet.is_valid before using it."""
+        _libvncxx.PacketFinder_register_possible_packet_found_handler(self, handler)
+
+
+    def unregister_possible_packet_found_handler(self):
+        """unregister_possible_packet_found_handler(PacketFinder self)"""
+        _libvncxx.PacketFinder_unregister_possible_packet_found_handler(self)
+
+PacketFinder_swigregister = _libvncxx.PacketFinder_swigregister
+PacketFinder_swigregister(PacketFinder)
+
 
 # This file is compatible with both classic and new-style classes.
 
@@ -14,6 +14,7 @@
 #endif
 
 #define SWIG_PYTHON_DIRECTOR_NO_VTABLE
+#define SWIG_PYTHON_THREADS
 
 
 #ifdef __cplusplus
@@ -3085,69 +3086,70 @@ SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
 #define SWIGTYPE_p_vn__protocol__uart__IntegrationFrame swig_types[75]
 #define SWIGTYPE_p_vn__protocol__uart__MagneticMode swig_types[76]
 #define SWIGTYPE_p_vn__protocol__uart__Packet swig_types[77]
-#define SWIGTYPE_p_vn__protocol__uart__PpsSource swig_types[78]
-#define SWIGTYPE_p_vn__protocol__uart__Scenario swig_types[79]
-#define SWIGTYPE_p_vn__protocol__uart__StatusMode swig_types[80]
-#define SWIGTYPE_p_vn__protocol__uart__SyncInEdge swig_types[81]
-#define SWIGTYPE_p_vn__protocol__uart__SyncInMode swig_types[82]
-#define SWIGTYPE_p_vn__protocol__uart__SyncOutMode swig_types[83]
-#define SWIGTYPE_p_vn__protocol__uart__SyncOutPolarity swig_types[84]
-#define SWIGTYPE_p_vn__protocol__uart__TimeUtc swig_types[85]
-#define SWIGTYPE_p_vn__protocol__uart__VelocityCompensationMode swig_types[86]
-#define SWIGTYPE_p_vn__protocol__uart__VpeEnable swig_types[87]
-#define SWIGTYPE_p_vn__protocol__uart__VpeMode swig_types[88]
-#define SWIGTYPE_p_vn__protocol__uart__VpeStatus swig_types[89]
-#define SWIGTYPE_p_vn__sensors__AccelerationCompensationRegister swig_types[90]
-#define SWIGTYPE_p_vn__sensors__BinaryOutputRegister swig_types[91]
-#define SWIGTYPE_p_vn__sensors__CalculatedMagnetometerCalibrationRegister swig_types[92]
-#define SWIGTYPE_p_vn__sensors__CommunicationProtocolControlRegister swig_types[93]
-#define SWIGTYPE_p_vn__sensors__CompositeData swig_types[94]
-#define SWIGTYPE_p_vn__sensors__DeltaThetaAndDeltaVelocityConfigurationRegister swig_types[95]
-#define SWIGTYPE_p_vn__sensors__DeltaThetaAndDeltaVelocityRegister swig_types[96]
-#define SWIGTYPE_p_vn__sensors__EzAsyncData swig_types[97]
-#define SWIGTYPE_p_vn__sensors__FilterActiveTuningParametersRegister swig_types[98]
-#define SWIGTYPE_p_vn__sensors__FilterBasicControlRegister swig_types[99]
-#define SWIGTYPE_p_vn__sensors__FilterMeasurementsVarianceParametersRegister swig_types[100]
-#define SWIGTYPE_p_vn__sensors__GpsCompassBaselineRegister swig_types[101]
-#define SWIGTYPE_p_vn__sensors__GpsCompassEstimatedBaselineRegister swig_types[102]
-#define SWIGTYPE_p_vn__sensors__GpsConfigurationRegister swig_types[103]
-#define SWIGTYPE_p_vn__sensors__GpsSolutionEcefRegister swig_types[104]
-#define SWIGTYPE_p_vn__sensors__GpsSolutionLlaRegister swig_types[105]
-#define SWIGTYPE_p_vn__sensors__GyroCompensationRegister swig_types[106]
-#define SWIGTYPE_p_vn__sensors__ImuFilteringConfigurationRegister swig_types[107]
-#define SWIGTYPE_p_vn__sensors__ImuMeasurementsRegister swig_types[108]
-#define SWIGTYPE_p_vn__sensors__ImuRateConfigurationRegister swig_types[109]
-#define SWIGTYPE_p_vn__sensors__InsAdvancedConfigurationRegister swig_types[110]
-#define SWIGTYPE_p_vn__sensors__InsBasicConfigurationRegisterVn200 swig_types[111]
-#define SWIGTYPE_p_vn__sensors__InsBasicConfigurationRegisterVn300 swig_types[112]
-#define SWIGTYPE_p_vn__sensors__InsSolutionEcefRegister swig_types[113]
-#define SWIGTYPE_p_vn__sensors__InsSolutionLlaRegister swig_types[114]
-#define SWIGTYPE_p_vn__sensors__InsStateEcefRegister swig_types[115]
-#define SWIGTYPE_p_vn__sensors__InsStateLlaRegister swig_types[116]
-#define SWIGTYPE_p_vn__sensors__MagneticAccelerationAndAngularRatesRegister swig_types[117]
-#define SWIGTYPE_p_vn__sensors__MagneticAndGravityReferenceVectorsRegister swig_types[118]
-#define SWIGTYPE_p_vn__sensors__MagnetometerCalibrationControlRegister swig_types[119]
-#define SWIGTYPE_p_vn__sensors__MagnetometerCompensationRegister swig_types[120]
-#define SWIGTYPE_p_vn__sensors__QuaternionMagneticAccelerationAndAngularRatesRegister swig_types[121]
-#define SWIGTYPE_p_vn__sensors__ReferenceVectorConfigurationRegister swig_types[122]
-#define SWIGTYPE_p_vn__sensors__StartupFilterBiasEstimateRegister swig_types[123]
-#define SWIGTYPE_p_vn__sensors__SynchronizationControlRegister swig_types[124]
-#define SWIGTYPE_p_vn__sensors__SynchronizationStatusRegister swig_types[125]
-#define SWIGTYPE_p_vn__sensors__VelocityCompensationControlRegister swig_types[126]
-#define SWIGTYPE_p_vn__sensors__VelocityCompensationStatusRegister swig_types[127]
-#define SWIGTYPE_p_vn__sensors__VnSensor swig_types[128]
-#define SWIGTYPE_p_vn__sensors__VpeAccelerometerAdvancedTuningRegister swig_types[129]
-#define SWIGTYPE_p_vn__sensors__VpeAccelerometerBasicTuningRegister swig_types[130]
-#define SWIGTYPE_p_vn__sensors__VpeBasicControlRegister swig_types[131]
-#define SWIGTYPE_p_vn__sensors__VpeGyroBasicTuningRegister swig_types[132]
-#define SWIGTYPE_p_vn__sensors__VpeMagnetometerAdvancedTuningRegister swig_types[133]
-#define SWIGTYPE_p_vn__sensors__VpeMagnetometerBasicTuningRegister swig_types[134]
-#define SWIGTYPE_p_vn__sensors__YawPitchRollMagneticAccelerationAndAngularRatesRegister swig_types[135]
-#define SWIGTYPE_p_vn__sensors__YawPitchRollTrueBodyAccelerationAndAngularRatesRegister swig_types[136]
-#define SWIGTYPE_p_vn__sensors__YawPitchRollTrueInertialAccelerationAndAngularRatesRegister swig_types[137]
-#define SWIGTYPE_p_vn__xplat__IPort swig_types[138]
-static swig_type_info *swig_types[140];
-static swig_module_info swig_module = {swig_types, 139, 0, 0, 0, 0};
+#define SWIGTYPE_p_vn__protocol__uart__PacketFinder swig_types[78]
+#define SWIGTYPE_p_vn__protocol__uart__PpsSource swig_types[79]
+#define SWIGTYPE_p_vn__protocol__uart__Scenario swig_types[80]
+#define SWIGTYPE_p_vn__protocol__uart__StatusMode swig_types[81]
+#define SWIGTYPE_p_vn__protocol__uart__SyncInEdge swig_types[82]
+#define SWIGTYPE_p_vn__protocol__uart__SyncInMode swig_types[83]
+#define SWIGTYPE_p_vn__protocol__uart__SyncOutMode swig_types[84]
+#define SWIGTYPE_p_vn__protocol__uart__SyncOutPolarity swig_types[85]
+#define SWIGTYPE_p_vn__protocol__uart__TimeUtc swig_types[86]
+#define SWIGTYPE_p_vn__protocol__uart__VelocityCompensationMode swig_types[87]
+#define SWIGTYPE_p_vn__protocol__uart__VpeEnable swig_types[88]
+#define SWIGTYPE_p_vn__protocol__uart__VpeMode swig_types[89]
+#define SWIGTYPE_p_vn__protocol__uart__VpeStatus swig_types[90]
+#define SWIGTYPE_p_vn__sensors__AccelerationCompensationRegister swig_types[91]
+#define SWIGTYPE_p_vn__sensors__BinaryOutputRegister swig_types[92]
+#define SWIGTYPE_p_vn__sensors__CalculatedMagnetometerCalibrationRegister swig_types[93]
+#define SWIGTYPE_p_vn__sensors__CommunicationProtocolControlRegister swig_types[94]
+#define SWIGTYPE_p_vn__sensors__CompositeData swig_types[95]
+#define SWIGTYPE_p_vn__sensors__DeltaThetaAndDeltaVelocityConfigurationRegister swig_types[96]
+#define SWIGTYPE_p_vn__sensors__DeltaThetaAndDeltaVelocityRegister swig_types[97]
+#define SWIGTYPE_p_vn__sensors__EzAsyncData swig_types[98]
+#define SWIGTYPE_p_vn__sensors__FilterActiveTuningParametersRegister swig_types[99]
+#define SWIGTYPE_p_vn__sensors__FilterBasicControlRegister swig_types[100]
+#define SWIGTYPE_p_vn__sensors__FilterMeasurementsVarianceParametersRegister swig_types[101]
+#define SWIGTYPE_p_vn__sensors__GpsCompassBaselineRegister swig_types[102]
+#define SWIGTYPE_p_vn__sensors__GpsCompassEstimatedBaselineRegister swig_types[103]
+#define SWIGTYPE_p_vn__sensors__GpsConfigurationRegister swig_types[104]
+#define SWIGTYPE_p_vn__sensors__GpsSolutionEcefRegister swig_types[105]
+#define SWIGTYPE_p_vn__sensors__GpsSolutionLlaRegister swig_types[106]
+#define SWIGTYPE_p_vn__sensors__GyroCompensationRegister swig_types[107]
+#define SWIGTYPE_p_vn__sensors__ImuFilteringConfigurationRegister swig_types[108]
+#define SWIGTYPE_p_vn__sensors__ImuMeasurementsRegister swig_types[109]
+#define SWIGTYPE_p_vn__sensors__ImuRateConfigurationRegister swig_types[110]
+#define SWIGTYPE_p_vn__sensors__InsAdvancedConfigurationRegister swig_types[111]
+#define SWIGTYPE_p_vn__sensors__InsBasicConfigurationRegisterVn200 swig_types[112]
+#define SWIGTYPE_p_vn__sensors__InsBasicConfigurationRegisterVn300 swig_types[113]
+#define SWIGTYPE_p_vn__sensors__InsSolutionEcefRegister swig_types[114]
+#define SWIGTYPE_p_vn__sensors__InsSolutionLlaRegister swig_types[115]
+#define SWIGTYPE_p_vn__sensors__InsStateEcefRegister swig_types[116]
+#define SWIGTYPE_p_vn__sensors__InsStateLlaRegister swig_types[117]
+#define SWIGTYPE_p_vn__sensors__MagneticAccelerationAndAngularRatesRegister swig_types[118]
+#define SWIGTYPE_p_vn__sensors__MagneticAndGravityReferenceVectorsRegister swig_types[119]
+#define SWIGTYPE_p_vn__sensors__MagnetometerCalibrationControlRegister swig_types[120]
+#define SWIGTYPE_p_vn__sensors__MagnetometerCompensationRegister swig_types[121]
+#define SWIGTYPE_p_vn__sensors__QuaternionMagneticAccelerationAndAngularRatesRegister swig_types[122]
+#define SWIGTYPE_p_vn__sensors__ReferenceVectorConfigurationRegister swig_types[123]
+#define SWIGTYPE_p_vn__sensors__StartupFilterBiasEstimateRegister swig_types[124]
+#define SWIGTYPE_p_vn__sensors__SynchronizationControlRegister swig_types[125]
+#define SWIGTYPE_p_vn__sensors__SynchronizationStatusRegister swig_types[126]
+#define SWIGTYPE_p_vn__sensors__VelocityCompensationControlRegister swig_types[127]
+#define SWIGTYPE_p_vn__sensors__VelocityCompensationStatusRegister swig_types[128]
+#define SWIGTYPE_p_vn__sensors__VnSensor swig_types[129]
+#define SWIGTYPE_p_vn__sensors__VpeAccelerometerAdvancedTuningRegister swig_types[130]
+#define SWIGTYPE_p_vn__sensors__VpeAccelerometerBasicTuningRegister swig_types[131]
+#define SWIGTYPE_p_vn__sensors__VpeBasicControlRegister swig_types[132]
+#define SWIGTYPE_p_vn__sensors__VpeGyroBasicTuningRegister swig_types[133]
+#define SWIGTYPE_p_vn__sensors__VpeMagnetometerAdvancedTuningRegister swig_types[134]
+#define SWIGTYPE_p_vn__sensors__VpeMagnetometerBasicTuningRegister swig_types[135]
+#define SWIGTYPE_p_vn__sensors__YawPitchRollMagneticAccelerationAndAngularRatesRegister swig_types[136]
+#define SWIGTYPE_p_vn__sensors__YawPitchRollTrueBodyAccelerationAndAngularRatesRegister swig_types[137]
+#define SWIGTYPE_p_vn__sensors__YawPitchRollTrueInertialAccelerationAndAngularRatesRegister swig_types[138]
+#define SWIGTYPE_p_vn__xplat__IPort swig_types[139]
+static swig_type_info *swig_types[141];
+static swig_module_info swig_module = {swig_types, 140, 0, 0, 0, 0};
 #define SWIG_TypeQuery(name) SWIG_TypeQueryModule(&swig_module, &swig_module, name)
 #define SWIG_MangledTypeQuery(name) SWIG_MangledTypeQueryModule(&swig_module, &swig_module, name)
 
@@ -3264,6 +3266,7 @@ namespace swig {
     #include "vn/ezasyncdata.h"
     #include "vn/int.h"
     #include "vn/matrix.h"
+    #include "vn/memoryport.h"
     #include "vn/packet.h"
     #include "vn/packetfinder.h"
     #include "vn/port.h"
@@ -3279,6 +3282,127 @@ namespace swig {
     #include "vn/vntime.h"
 
 
+/* Batched conversions over arrays of float32 values, for vnpy.conv.*_array().
+   Vectors are loaded and stored element by element and matrices in row-major
+   order, independent of how vec and mat are laid out in memory. */
+static void SWIG_BatchLoad(const float *p, vn::math::vec3f &v) { v = vn::math::vec3f(p[0], p[1], p[2]); }
+static void SWIG_BatchLoad(const float *p, vn::math::vec4f &v) { v = vn::math::vec4f(p[0], p[1], p[2], p[3]); }
+static void SWIG_BatchLoad(const float *p, vn::math::mat3f &m) { m = vn::math::mat3f(p[0], p[1], p[2], p[3], p[4], p[5], p[6], p[7], p[8]); }
+
+static void SWIG_BatchStore(float *p, const vn::math::vec3f &v) { p[0] = v.x; p[1] = v.y; p[2] = v.z; }
+static void SWIG_BatchStore(float *p, const vn::math::vec4f &v) { p[0] = v.x; p[1] = v.y; p[2] = v.z; p[3] = v.w; }
+static void SWIG_BatchStore(float *p, const vn::math::mat3f &m) {
+  for (size_t row = 0; row < 3; row++)
+    for (size_t col = 0; col < 3; col++)
+      p[row * 3 + col] = m(row, col);
+}
+
+template < typename In, typename Out, Out (*Convert)(In) >
+static PyObject *SWIG_BatchConvert(PyObject *args, const char *name) {
+  const Py_ssize_t inSize = sizeof(In) / sizeof(float), outSize = sizeof(Out) / sizeof(float);
+  PyObject *obj0 = 0, *obj1 = 0;
+  Py_buffer in, out;
+  
+  if (!PyArg_UnpackTuple(args, name, 2, 2, &obj0, &obj1)) return NULL;
+  if (PyObject_GetBuffer(obj0, &in, PyBUF_C_CONTIGUOUS) != 0) return NULL;
+  if (PyObject_GetBuffer(obj1, &out, PyBUF_C_CONTIGUOUS | PyBUF_WRITABLE) != 0) {
+    PyBuffer_Release(&in);
+    return NULL;
+  }
+  Py_ssize_t n = in.len / (Py_ssize_t) (inSize * sizeof(float));
+  if (in.itemsize != sizeof(float) || out.itemsize != sizeof(float) ||
+      in.len != n * inSize * (Py_ssize_t) sizeof(float) || out.len != n * outSize * (Py_ssize_t) sizeof(float)) {
+    PyBuffer_Release(&in);
+    PyBuffer_Release(&out);
+    PyErr_Format(PyExc_ValueError, "in method '%s', expected float32 arrays of %d and %d values per item", name, (int) inSize, (int) outSize);
+    return NULL;
+  }
+  {
+    PyThreadState *_save = PyEval_SaveThread();
+    const float *src = reinterpret_cast< const float * >(in.buf);
+    float *dst = reinterpret_cast< float * >(out.buf);
+    In value;
+    for (Py_ssize_t i = 0; i < n; i++, src += inSize, dst += outSize) {
+      SWIG_BatchLoad(src, value);
+      SWIG_BatchStore(dst, Convert(value));
+    }
+    PyEval_RestoreThread(_save);
+  }
+  PyBuffer_Release(&in);
+  PyBuffer_Release(&out);
+  return SWIG_Py_Void();
+}
+
+/* Plain data records for VnSensor.plain_data: struct sequences (tuples with
+   named fields) of Python floats, in place of proxies of C++ vectors and
+   matrices.  Matrices are in row-major order. */
+static PyStructSequence_Field SWIG_PlainVec3Fields[] = {
+  { (char *)"x", NULL }, { (char *)"y", NULL }, { (char *)"z", NULL }, { NULL, NULL }
+};
+static PyStructSequence_Field SWIG_PlainVec4Fields[] = {
+  { (char *)"x", NULL }, { (char *)"y", NULL }, { (char *)"z", NULL }, { (char *)"w", NULL }, { NULL, NULL }
+};
+static PyStructSequence_Field SWIG_PlainMat3Fields[] = {
+  { (char *)"e00", NULL }, { (char *)"e01", NULL }, { (char *)"e02", NULL },
+  { (char *)"e10", NULL }, { (char *)"e11", NULL }, { (char *)"e12", NULL },
+  { (char *)"e20", NULL }, { (char *)"e21", NULL }, { (char *)"e22", NULL }, { NULL, NULL }
+};
+static PyStructSequence_Desc SWIG_PlainVec3Desc = {
+  (char *)"vnpy.PlainVec3", (char *)"PlainVec3(x, y, z): a vec3f or vec3d as plain data", SWIG_PlainVec3Fields, 3
+};
+static PyStructSequence_Desc SWIG_PlainVec4Desc = {
+  (char *)"vnpy.PlainVec4", (char *)"PlainVec4(x, y, z, w): a vec4f as plain data", SWIG_PlainVec4Fields, 4
+};
+static PyStructSequence_Desc SWIG_PlainMat3Desc = {
+  (char *)"vnpy.PlainMat3", (char *)"PlainMat3(e00, e01, ..., e22): a mat3f as plain data, row by row", SWIG_PlainMat3Fields, 9
+};
+static PyTypeObject SWIG_PlainVec3Type, SWIG_PlainVec4Type, SWIG_PlainMat3Type;
+
+static PyObject *SWIG_PlainNew(PyTypeObject *type, const double *values, Py_ssize_t n) {
+  PyObject *result = PyStructSequence_New(type);
+  if (!result) return NULL;
+  for (Py_ssize_t i = 0; i < n; i++) {
+    PyObject *item = PyFloat_FromDouble(values[i]);
+    if (!item) {
+      Py_DECREF(result);
+      return NULL;
+    }
+    PyStructSequence_SET_ITEM(result, i, item);
+  }
+  return result;
+}
+
+
+/* The Python handlers registered with C++ objects, by the address of the object.
+   The table holds a reference to each handler until it is unregistered (or its
+   object deleted), so that the handler outlives a call the object may still be
+   making on another thread.  Only touched with the GIL held. */
+#include <map>
+
+static std::map< const void *, PyObject * > SWIG_RegisteredHandlers;
+
+static void SWIG_HoldHandler(const void *owner, PyObject *handler) {
+  std::map< const void *, PyObject * >::iterator it = SWIG_RegisteredHandlers.find(owner);
+  Py_INCREF(handler);
+  if (it != SWIG_RegisteredHandlers.end()) {
+    /* Left behind by a deleted object at the same address */
+    Py_DECREF(it->second);
+    it->second = handler;
+  } else {
+    SWIG_RegisteredHandlers[owner] = handler;
+  }
+}
+
+static void SWIG_ReleaseHandler(const void *owner) {
+  std::map< const void *, PyObject * >::iterator it = SWIG_RegisteredHandlers.find(owner);
+  if (it != SWIG_RegisteredHandlers.end()) {
+    PyObject *handler = it->second;
+    SWIG_RegisteredHandlers.erase(it);
+    Py_DECREF(handler);
+  }
+}
+
+
 #include <string>
 
 
@@ -11007,6 +11131,126 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap___quat2ypr_degs_array(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_BatchConvert< vn::math::vec4f, vn::math::vec3f, vn::math::quat2YprInDegs >(args, "__quat2ypr_degs_array");
+}
+
+
+SWIGINTERN PyObject *_wrap___quat2ypr_rads_array(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_BatchConvert< vn::math::vec4f, vn::math::vec3f, vn::math::quat2YprInRads >(args, "__quat2ypr_rads_array");
+}
+
+
+SWIGINTERN PyObject *_wrap___ypr_degs2quat_array(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_BatchConvert< vn::math::vec3f, vn::math::vec4f, vn::math::yprInDegs2Quat >(args, "__ypr_degs2quat_array");
+}
+
+
+SWIGINTERN PyObject *_wrap___quat2dcm_array(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_BatchConvert< vn::math::vec4f, vn::math::mat3f, vn::math::quat2dcm >(args, "__quat2dcm_array");
+}
+
+
+SWIGINTERN PyObject *_wrap___dcm2quat_array(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_BatchConvert< vn::math::mat3f, vn::math::vec4f, vn::math::dcm2quat >(args, "__dcm2quat_array");
+}
+
+
+SWIGINTERN PyObject *_wrap___quat2omega_phi_kappa_rads_array(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_BatchConvert< vn::math::vec4f, vn::math::vec3f, vn::math::quat2omegaPhiKappaInRads >(args, "__quat2omega_phi_kappa_rads_array");
+}
+
+
+/* Wraps the memory of a writable buffer as a vector or matrix without copying it,
+   for vec3f.from_buffer() etc.  The object does not own the memory; the Python
+   proxy keeps the buffer alive.  Matrices are stored column by column, so their
+   buffers have to be Fortran contiguous.  The buffer's items have to be native
+   floats or doubles, format 'f' or 'd' (struct module syntax) with an optional
+   byte order prefix that means the native order. */
+SWIGINTERN int SWIG_IsNativeFormat(const char *format, char code) {
+  static const int one = 1;
+  const int little = *(const char *) &one;
+
+  if (format == NULL) return 0;   /* Unsigned bytes */
+  if (*format == '@' || *format == '=' || (little && *format == '<') || (!little && (*format == '>' || *format == '!')))
+    format++;
+  return format[0] == code && format[1] == '\0';
+}
+
+SWIGINTERN PyObject *SWIG_ViewFromBuffer(PyObject *args, const char *name, swig_type_info *type, Py_ssize_t size, char code, Py_ssize_t itemsize, int contiguity) {
+  PyObject *obj0 = 0;
+  Py_buffer view;
+  void *buf;
+  
+  if (!PyArg_UnpackTuple(args, name, 1, 1, &obj0)) return NULL;
+  if (PyObject_GetBuffer(obj0, &view, contiguity | PyBUF_WRITABLE | PyBUF_FORMAT) != 0) return NULL;
+  buf = view.buf;
+  if (view.len != size || view.itemsize != itemsize || !SWIG_IsNativeFormat(view.format, code)) {
+    PyBuffer_Release(&view);
+    PyErr_Format(PyExc_ValueError, "in method '%s', expected %d values of type '%c'", name, (int) (size / itemsize), code);
+    return NULL;
+  }
+  PyBuffer_Release(&view);
+  return SWIG_NewPointerObj(buf, type, 0 |  0 );
+}
+
+
+SWIGINTERN PyObject *_wrap_vec3f_from_buffer(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_ViewFromBuffer(args, "vec3f_from_buffer", SWIGTYPE_p_vn__math__vecT_3_float_t, sizeof(vn::math::vec3f), 'f', sizeof(float), PyBUF_C_CONTIGUOUS);
+}
+
+
+SWIGINTERN PyObject *_wrap_vec3d_from_buffer(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_ViewFromBuffer(args, "vec3d_from_buffer", SWIGTYPE_p_vn__math__vecT_3_double_t, sizeof(vn::math::vec3d), 'd', sizeof(double), PyBUF_C_CONTIGUOUS);
+}
+
+
+SWIGINTERN PyObject *_wrap_vec4f_from_buffer(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_ViewFromBuffer(args, "vec4f_from_buffer", SWIGTYPE_p_vn__math__vecT_4_float_t, sizeof(vn::math::vec4f), 'f', sizeof(float), PyBUF_C_CONTIGUOUS);
+}
+
+
+SWIGINTERN PyObject *_wrap_mat3f_from_buffer(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_ViewFromBuffer(args, "mat3f_from_buffer", SWIGTYPE_p_vn__math__matT_3_3_float_t, sizeof(vn::math::mat3f), 'f', sizeof(float), PyBUF_F_CONTIGUOUS);
+}
+
+
+SWIGINTERN PyObject *_wrap_plain_data(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj0 = 0 ;
+  void *argp = 0 ;
+  
+  if (!PyArg_UnpackTuple(args, "plain_data", 1, 1, &obj0)) SWIG_fail;
+  if (obj0 != Py_None) {
+    if (SWIG_IsOK(SWIG_ConvertPtr(obj0, &argp, SWIGTYPE_p_vn__math__vecT_3_float_t, 0))) {
+      const vn::math::vec3f &v = *reinterpret_cast< vn::math::vec3f * >(argp);
+      double values[] = { v.x, v.y, v.z };
+      return SWIG_PlainNew(&SWIG_PlainVec3Type, values, 3);
+    }
+    if (SWIG_IsOK(SWIG_ConvertPtr(obj0, &argp, SWIGTYPE_p_vn__math__vecT_3_double_t, 0))) {
+      const vn::math::vec3d &v = *reinterpret_cast< vn::math::vec3d * >(argp);
+      double values[] = { v.x, v.y, v.z };
+      return SWIG_PlainNew(&SWIG_PlainVec3Type, values, 3);
+    }
+    if (SWIG_IsOK(SWIG_ConvertPtr(obj0, &argp, SWIGTYPE_p_vn__math__vecT_4_float_t, 0))) {
+      const vn::math::vec4f &v = *reinterpret_cast< vn::math::vec4f * >(argp);
+      double values[] = { v.x, v.y, v.z, v.w };
+      return SWIG_PlainNew(&SWIG_PlainVec4Type, values, 4);
+    }
+    if (SWIG_IsOK(SWIG_ConvertPtr(obj0, &argp, SWIGTYPE_p_vn__math__matT_3_3_float_t, 0))) {
+      const vn::math::mat3f &m = *reinterpret_cast< vn::math::mat3f * >(argp);
+      double values[9];
+      for (size_t row = 0; row < 3; row++)
+        for (size_t col = 0; col < 3; col++)
+          values[row * 3 + col] = m(row, col);
+      return SWIG_PlainNew(&SWIG_PlainMat3Type, values, 9);
+    }
+  }
+  SWIG_exception_fail(SWIG_TypeError, "in method 'plain_data', argument 1 of type 'vec3f, vec3d, vec4f or mat3f'");
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap___rad2deg_v3f(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   vn::math::vec< 3,float > arg1 ;
@@ -27932,8 +28176,8 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_async_mode_set(PyObject *SWIGUNU
   ASYNCMODE arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 ;
-  int res2 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   
@@ -27943,19 +28187,11 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_async_mode_set(PyObject *SWIGUNU
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "BinaryOutputRegister_async_mode_set" "', argument " "1"" of type '" "vn::sensors::BinaryOutputRegister *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp1);
-  {
-    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_ASYNCMODE,  0  | 0);
-    if (!SWIG_IsOK(res2)) {
-      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "BinaryOutputRegister_async_mode_set" "', argument " "2"" of type '" "ASYNCMODE""'"); 
-    }  
-    if (!argp2) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "BinaryOutputRegister_async_mode_set" "', argument " "2"" of type '" "ASYNCMODE""'");
-    } else {
-      ASYNCMODE * temp = reinterpret_cast< ASYNCMODE * >(argp2);
-      arg2 = *temp;
-      if (SWIG_IsNewObj(res2)) delete temp;
-    }
-  }
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "BinaryOutputRegister_async_mode_set" "', argument " "2"" of type '" "ASYNCMODE""'");
+  } 
+  arg2 = static_cast< ASYNCMODE >(val2);
   if (arg1) (arg1)->asyncMode = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -27979,7 +28215,7 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_async_mode_get(PyObject *SWIGUNU
   }
   arg1 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp1);
   result =  ((arg1)->asyncMode);
-  resultobj = SWIG_NewPointerObj((new ASYNCMODE(static_cast< const ASYNCMODE& >(result))), SWIGTYPE_p_ASYNCMODE, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_From_int(static_cast< int >(result));
   return resultobj;
 fail:
   return NULL;
@@ -28044,8 +28280,8 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_common_field_set(PyObject *SWIGU
   COMMONGROUP arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 ;
-  int res2 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   
@@ -28055,19 +28291,11 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_common_field_set(PyObject *SWIGU
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "BinaryOutputRegister_common_field_set" "', argument " "1"" of type '" "vn::sensors::BinaryOutputRegister *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp1);
-  {
-    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_COMMONGROUP,  0  | 0);
-    if (!SWIG_IsOK(res2)) {
-      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "BinaryOutputRegister_common_field_set" "', argument " "2"" of type '" "COMMONGROUP""'"); 
-    }  
-    if (!argp2) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "BinaryOutputRegister_common_field_set" "', argument " "2"" of type '" "COMMONGROUP""'");
-    } else {
-      COMMONGROUP * temp = reinterpret_cast< COMMONGROUP * >(argp2);
-      arg2 = *temp;
-      if (SWIG_IsNewObj(res2)) delete temp;
-    }
-  }
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "BinaryOutputRegister_common_field_set" "', argument " "2"" of type '" "COMMONGROUP""'");
+  } 
+  arg2 = static_cast< COMMONGROUP >(val2);
   if (arg1) (arg1)->commonField = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -28091,7 +28319,7 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_common_field_get(PyObject *SWIGU
   }
   arg1 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp1);
   result =  ((arg1)->commonField);
-  resultobj = SWIG_NewPointerObj((new COMMONGROUP(static_cast< const COMMONGROUP& >(result))), SWIGTYPE_p_COMMONGROUP, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_From_int(static_cast< int >(result));
   return resultobj;
 fail:
   return NULL;
@@ -28104,8 +28332,8 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_time_field_set(PyObject *SWIGUNU
   TIMEGROUP arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 ;
-  int res2 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   
@@ -28115,19 +28343,11 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_time_field_set(PyObject *SWIGUNU
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "BinaryOutputRegister_time_field_set" "', argument " "1"" of type '" "vn::sensors::BinaryOutputRegister *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp1);
-  {
-    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_TIMEGROUP,  0  | 0);
-    if (!SWIG_IsOK(res2)) {
-      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "BinaryOutputRegister_time_field_set" "', argument " "2"" of type '" "TIMEGROUP""'"); 
-    }  
-    if (!argp2) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "BinaryOutputRegister_time_field_set" "', argument " "2"" of type '" "TIMEGROUP""'");
-    } else {
-      TIMEGROUP * temp = reinterpret_cast< TIMEGROUP * >(argp2);
-      arg2 = *temp;
-      if (SWIG_IsNewObj(res2)) delete temp;
-    }
-  }
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "BinaryOutputRegister_time_field_set" "', argument " "2"" of type '" "TIMEGROUP""'");
+  } 
+  arg2 = static_cast< TIMEGROUP >(val2);
   if (arg1) (arg1)->timeField = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -28151,7 +28371,7 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_time_field_get(PyObject *SWIGUNU
   }
   arg1 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp1);
   result =  ((arg1)->timeField);
-  resultobj = SWIG_NewPointerObj((new TIMEGROUP(static_cast< const TIMEGROUP& >(result))), SWIGTYPE_p_TIMEGROUP, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_From_int(static_cast< int >(result));
   return resultobj;
 fail:
   return NULL;
@@ -28164,8 +28384,8 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_imu_field_set(PyObject *SWIGUNUS
   IMUGROUP arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 ;
-  int res2 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   
@@ -28175,19 +28395,11 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_imu_field_set(PyObject *SWIGUNUS
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "BinaryOutputRegister_imu_field_set" "', argument " "1"" of type '" "vn::sensors::BinaryOutputRegister *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp1);
-  {
-    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_IMUGROUP,  0  | 0);
-    if (!SWIG_IsOK(res2)) {
-      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "BinaryOutputRegister_imu_field_set" "', argument " "2"" of type '" "IMUGROUP""'"); 
-    }  
-    if (!argp2) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "BinaryOutputRegister_imu_field_set" "', argument " "2"" of type '" "IMUGROUP""'");
-    } else {
-      IMUGROUP * temp = reinterpret_cast< IMUGROUP * >(argp2);
-      arg2 = *temp;
-      if (SWIG_IsNewObj(res2)) delete temp;
-    }
-  }
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "BinaryOutputRegister_imu_field_set" "', argument " "2"" of type '" "IMUGROUP""'");
+  } 
+  arg2 = static_cast< IMUGROUP >(val2);
   if (arg1) (arg1)->imuField = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -28211,7 +28423,7 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_imu_field_get(PyObject *SWIGUNUS
   }
   arg1 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp1);
   result =  ((arg1)->imuField);
-  resultobj = SWIG_NewPointerObj((new IMUGROUP(static_cast< const IMUGROUP& >(result))), SWIGTYPE_p_IMUGROUP, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_From_int(static_cast< int >(result));
   return resultobj;
 fail:
   return NULL;
@@ -28224,8 +28436,8 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_gps_field_set(PyObject *SWIGUNUS
   GPSGROUP arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 ;
-  int res2 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   
@@ -28235,19 +28447,11 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_gps_field_set(PyObject *SWIGUNUS
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "BinaryOutputRegister_gps_field_set" "', argument " "1"" of type '" "vn::sensors::BinaryOutputRegister *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp1);
-  {
-    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_GPSGROUP,  0  | 0);
-    if (!SWIG_IsOK(res2)) {
-      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "BinaryOutputRegister_gps_field_set" "', argument " "2"" of type '" "GPSGROUP""'"); 
-    }  
-    if (!argp2) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "BinaryOutputRegister_gps_field_set" "', argument " "2"" of type '" "GPSGROUP""'");
-    } else {
-      GPSGROUP * temp = reinterpret_cast< GPSGROUP * >(argp2);
-      arg2 = *temp;
-      if (SWIG_IsNewObj(res2)) delete temp;
-    }
-  }
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "BinaryOutputRegister_gps_field_set" "', argument " "2"" of type '" "GPSGROUP""'");
+  } 
+  arg2 = static_cast< GPSGROUP >(val2);
   if (arg1) (arg1)->gpsField = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -28271,7 +28475,7 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_gps_field_get(PyObject *SWIGUNUS
   }
   arg1 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp1);
   result =  ((arg1)->gpsField);
-  resultobj = SWIG_NewPointerObj((new GPSGROUP(static_cast< const GPSGROUP& >(result))), SWIGTYPE_p_GPSGROUP, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_From_int(static_cast< int >(result));
   return resultobj;
 fail:
   return NULL;
@@ -28284,8 +28488,8 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_attitude_field_set(PyObject *SWI
   ATTITUDEGROUP arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 ;
-  int res2 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   
@@ -28295,19 +28499,11 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_attitude_field_set(PyObject *SWI
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "BinaryOutputRegister_attitude_field_set" "', argument " "1"" of type '" "vn::sensors::BinaryOutputRegister *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp1);
-  {
-    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_ATTITUDEGROUP,  0  | 0);
-    if (!SWIG_IsOK(res2)) {
-      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "BinaryOutputRegister_attitude_field_set" "', argument " "2"" of type '" "ATTITUDEGROUP""'"); 
-    }  
-    if (!argp2) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "BinaryOutputRegister_attitude_field_set" "', argument " "2"" of type '" "ATTITUDEGROUP""'");
-    } else {
-      ATTITUDEGROUP * temp = reinterpret_cast< ATTITUDEGROUP * >(argp2);
-      arg2 = *temp;
-      if (SWIG_IsNewObj(res2)) delete temp;
-    }
-  }
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "BinaryOutputRegister_attitude_field_set" "', argument " "2"" of type '" "ATTITUDEGROUP""'");
+  } 
+  arg2 = static_cast< ATTITUDEGROUP >(val2);
   if (arg1) (arg1)->attitudeField = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -28331,7 +28527,7 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_attitude_field_get(PyObject *SWI
   }
   arg1 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp1);
   result =  ((arg1)->attitudeField);
-  resultobj = SWIG_NewPointerObj((new ATTITUDEGROUP(static_cast< const ATTITUDEGROUP& >(result))), SWIGTYPE_p_ATTITUDEGROUP, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_From_int(static_cast< int >(result));
   return resultobj;
 fail:
   return NULL;
@@ -28344,8 +28540,8 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_ins_field_set(PyObject *SWIGUNUS
   INSGROUP arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 ;
-  int res2 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   
@@ -28355,19 +28551,11 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_ins_field_set(PyObject *SWIGUNUS
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "BinaryOutputRegister_ins_field_set" "', argument " "1"" of type '" "vn::sensors::BinaryOutputRegister *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp1);
-  {
-    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_INSGROUP,  0  | 0);
-    if (!SWIG_IsOK(res2)) {
-      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "BinaryOutputRegister_ins_field_set" "', argument " "2"" of type '" "INSGROUP""'"); 
-    }  
-    if (!argp2) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "BinaryOutputRegister_ins_field_set" "', argument " "2"" of type '" "INSGROUP""'");
-    } else {
-      INSGROUP * temp = reinterpret_cast< INSGROUP * >(argp2);
-      arg2 = *temp;
-      if (SWIG_IsNewObj(res2)) delete temp;
-    }
-  }
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "BinaryOutputRegister_ins_field_set" "', argument " "2"" of type '" "INSGROUP""'");
+  } 
+  arg2 = static_cast< INSGROUP >(val2);
   if (arg1) (arg1)->insField = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -28391,7 +28579,7 @@ SWIGINTERN PyObject *_wrap_BinaryOutputRegister_ins_field_get(PyObject *SWIGUNUS
   }
   arg1 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp1);
   result =  ((arg1)->insField);
-  resultobj = SWIG_NewPointerObj((new INSGROUP(static_cast< const INSGROUP& >(result))), SWIGTYPE_p_INSGROUP, SWIG_POINTER_OWN |  0 );
+  resultobj = SWIG_From_int(static_cast< int >(result));
   return resultobj;
 fail:
   return NULL;
@@ -52900,7 +53088,12 @@ SWIGINTERN PyObject *_wrap_delete_VnSensor(PyObject *SWIGUNUSEDPARM(self), PyObj
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_VnSensor" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  delete arg1;
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    delete arg1;
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  SWIG_ReleaseHandler(arg1);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -52922,7 +53115,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_verify_sensor_connectivity(PyObject *SWIGUNU
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_verify_sensor_connectivity" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (bool)(arg1)->verifySensorConnectivity();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (bool)(arg1)->verifySensorConnectivity();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_From_bool(static_cast< bool >(result));
   return resultobj;
 fail:
@@ -52966,7 +53163,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_connect__SWIG_0(PyObject *SWIGUNUSEDPARM(sel
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_connect" "', argument " "3"" of type '" "uint32_t""'");
   } 
   arg3 = static_cast< uint32_t >(val3);
-  (arg1)->connect((std::string const &)*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->connect((std::string const &)*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   if (SWIG_IsNewObj(res2)) delete arg2;
   return resultobj;
@@ -52998,7 +53199,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_connect__SWIG_1(PyObject *SWIGUNUSEDPARM(sel
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "VnSensor_connect" "', argument " "2"" of type '" "vn::xplat::IPort *""'"); 
   }
   arg2 = reinterpret_cast< vn::xplat::IPort * >(argp2);
-  (arg1)->connect(arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->connect(arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53074,7 +53279,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_disconnect(PyObject *SWIGUNUSEDPARM(self), P
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_disconnect" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  (arg1)->disconnect();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->disconnect();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53107,7 +53316,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_transaction(PyObject *SWIGUNUSEDPARM(self),
     arg2 = *ptr;
     if (SWIG_IsNewObj(res)) delete ptr;
   }
-  result = (arg1)->transaction(arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->transaction(arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_From_std_string(static_cast< std::string >(result));
   return resultobj;
 fail:
@@ -53137,7 +53350,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_tare__SWIG_0(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "VnSensor_tare" "', argument " "2"" of type '" "bool""'");
   } 
   arg2 = static_cast< bool >(val2);
-  (arg1)->tare(arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->tare(arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53158,7 +53375,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_tare__SWIG_1(PyObject *SWIGUNUSEDPARM(self),
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_tare" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  (arg1)->tare();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->tare();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53234,7 +53455,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_set_gyro_bias__SWIG_0(PyObject *SWIGUNUSEDPA
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "VnSensor_set_gyro_bias" "', argument " "2"" of type '" "bool""'");
   } 
   arg2 = static_cast< bool >(val2);
-  (arg1)->setGyroBias(arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->setGyroBias(arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53255,7 +53480,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_set_gyro_bias__SWIG_1(PyObject *SWIGUNUSEDPA
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_set_gyro_bias" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  (arg1)->setGyroBias();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->setGyroBias();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53340,7 +53569,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_magnetic_disturbance_present__SWIG_0(PyObjec
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_magnetic_disturbance_present" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->magneticDisturbancePresent(arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->magneticDisturbancePresent(arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53370,7 +53603,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_magnetic_disturbance_present__SWIG_1(PyObjec
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "VnSensor_magnetic_disturbance_present" "', argument " "2"" of type '" "bool""'");
   } 
   arg2 = static_cast< bool >(val2);
-  (arg1)->magneticDisturbancePresent(arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->magneticDisturbancePresent(arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53467,7 +53704,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_acceleration_disturbance_present__SWIG_0(PyO
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_acceleration_disturbance_present" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->accelerationDisturbancePresent(arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->accelerationDisturbancePresent(arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53497,7 +53738,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_acceleration_disturbance_present__SWIG_1(PyO
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "VnSensor_acceleration_disturbance_present" "', argument " "2"" of type '" "bool""'");
   } 
   arg2 = static_cast< bool >(val2);
-  (arg1)->accelerationDisturbancePresent(arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->accelerationDisturbancePresent(arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53585,7 +53830,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_settings__SWIG_0(PyObject *SWIGUNUSEDP
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "VnSensor_write_settings" "', argument " "2"" of type '" "bool""'");
   } 
   arg2 = static_cast< bool >(val2);
-  (arg1)->writeSettings(arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeSettings(arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53606,7 +53855,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_settings__SWIG_1(PyObject *SWIGUNUSEDP
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_write_settings" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  (arg1)->writeSettings();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeSettings();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53682,7 +53935,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_restore_factory_settings__SWIG_0(PyObject *S
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "VnSensor_restore_factory_settings" "', argument " "2"" of type '" "bool""'");
   } 
   arg2 = static_cast< bool >(val2);
-  (arg1)->restoreFactorySettings(arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->restoreFactorySettings(arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53703,7 +53960,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_restore_factory_settings__SWIG_1(PyObject *S
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_restore_factory_settings" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  (arg1)->restoreFactorySettings();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->restoreFactorySettings();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53779,7 +54040,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_reset__SWIG_0(PyObject *SWIGUNUSEDPARM(self)
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "VnSensor_reset" "', argument " "2"" of type '" "bool""'");
   } 
   arg2 = static_cast< bool >(val2);
-  (arg1)->reset(arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->reset(arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53800,7 +54065,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_reset__SWIG_1(PyObject *SWIGUNUSEDPARM(self)
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_reset" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  (arg1)->reset();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->reset();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53894,7 +54163,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_change_baudrate__SWIG_0(PyObject *SWIGUNUSED
     SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "VnSensor_change_baudrate" "', argument " "4"" of type '" "uint8_t""'");
   } 
   arg4 = static_cast< uint8_t >(val4);
-  (arg1)->changeBaudRate(arg2,arg3,arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->changeBaudRate(arg2,arg3,arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53933,7 +54206,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_change_baudrate__SWIG_1(PyObject *SWIGUNUSED
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_change_baudrate" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->changeBaudRate(arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->changeBaudRate(arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -53963,7 +54240,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_change_baudrate__SWIG_2(PyObject *SWIGUNUSED
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "VnSensor_change_baudrate" "', argument " "2"" of type '" "uint32_t""'");
   } 
   arg2 = static_cast< uint32_t >(val2);
-  (arg1)->changeBaudRate(arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->changeBaudRate(arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54071,7 +54352,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_determine_device_family__SWIG_0(PyObject *SW
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_determine_device_family" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (vn::sensors::VnSensor::Family)(arg1)->determineDeviceFamily();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (vn::sensors::VnSensor::Family)(arg1)->determineDeviceFamily();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_From_int(static_cast< int >(result));
   return resultobj;
 fail:
@@ -54170,7 +54455,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_registerRawDataReceivedHandler(PyObject *SWI
       SWIG_exception_fail(SWIG_ArgError(res), "in method '" "VnSensor_registerRawDataReceivedHandler" "', argument " "3"" of type '" "vn::sensors::VnSensor::RawDataReceivedHandler""'"); 
     }
   }
-  (arg1)->registerRawDataReceivedHandler(arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->registerRawDataReceivedHandler(arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54191,7 +54480,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_unregisterRawDataReceivedHandler(PyObject *S
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_unregisterRawDataReceivedHandler" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  (arg1)->unregisterRawDataReceivedHandler();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->unregisterRawDataReceivedHandler();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54227,7 +54520,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_registerPossiblePacketFoundHandler(PyObject
       SWIG_exception_fail(SWIG_ArgError(res), "in method '" "VnSensor_registerPossiblePacketFoundHandler" "', argument " "3"" of type '" "vn::sensors::VnSensor::PossiblePacketFoundHandler""'"); 
     }
   }
-  (arg1)->registerPossiblePacketFoundHandler(arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->registerPossiblePacketFoundHandler(arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54248,7 +54545,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_unregisterPossiblePacketFoundHandler(PyObjec
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_unregisterPossiblePacketFoundHandler" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  (arg1)->unregisterPossiblePacketFoundHandler();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->unregisterPossiblePacketFoundHandler();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54284,7 +54585,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_registerAsyncPacketReceivedHandler(PyObject
       SWIG_exception_fail(SWIG_ArgError(res), "in method '" "VnSensor_registerAsyncPacketReceivedHandler" "', argument " "3"" of type '" "vn::sensors::VnSensor::AsyncPacketReceivedHandler""'"); 
     }
   }
-  (arg1)->registerAsyncPacketReceivedHandler(arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->registerAsyncPacketReceivedHandler(arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54305,7 +54610,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_unregisterAsyncPacketReceivedHandler(PyObjec
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_unregisterAsyncPacketReceivedHandler" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  (arg1)->unregisterAsyncPacketReceivedHandler();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->unregisterAsyncPacketReceivedHandler();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54341,7 +54650,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_registerErrorPacketReceivedHandler(PyObject
       SWIG_exception_fail(SWIG_ArgError(res), "in method '" "VnSensor_registerErrorPacketReceivedHandler" "', argument " "3"" of type '" "vn::sensors::VnSensor::ErrorPacketReceivedHandler""'"); 
     }
   }
-  (arg1)->registerErrorPacketReceivedHandler(arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->registerErrorPacketReceivedHandler(arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54362,7 +54675,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_unregisterErrorPacketReceivedHandler(PyObjec
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_unregisterErrorPacketReceivedHandler" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  (arg1)->unregisterErrorPacketReceivedHandler();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->unregisterErrorPacketReceivedHandler();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54398,7 +54715,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_registerUsbCableUnpluggedNotificationHandler
       SWIG_exception_fail(SWIG_ArgError(res), "in method '" "VnSensor_registerUsbCableUnpluggedNotificationHandler" "', argument " "3"" of type '" "void (*)(void *)""'"); 
     }
   }
-  (arg1)->registerUsbCableUnpluggedNotificationHandler(arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->registerUsbCableUnpluggedNotificationHandler(arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54419,7 +54740,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_unregisterUsbCableUnpluggedNotificationHandl
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_unregisterUsbCableUnpluggedNotificationHandler" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  (arg1)->unregisterUsbCableUnpluggedNotificationHandler();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->unregisterUsbCableUnpluggedNotificationHandler();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54441,7 +54766,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_binary_output_1(PyObject *SWIGUNUSEDPAR
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_binary_output_1" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readBinaryOutput1();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readBinaryOutput1();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::BinaryOutputRegister(static_cast< const vn::sensors::BinaryOutputRegister& >(result))), SWIGTYPE_p_vn__sensors__BinaryOutputRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -54483,7 +54812,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_binary_output_1__SWIG_0(PyObject *SWIG
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_binary_output_1" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeBinaryOutput1(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeBinaryOutput1(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54516,7 +54849,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_binary_output_1__SWIG_1(PyObject *SWIG
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_binary_output_1" "', argument " "2"" of type '" "vn::sensors::BinaryOutputRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp2);
-  (arg1)->writeBinaryOutput1(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeBinaryOutput1(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54594,7 +54931,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_binary_output_2(PyObject *SWIGUNUSEDPAR
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_binary_output_2" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readBinaryOutput2();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readBinaryOutput2();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::BinaryOutputRegister(static_cast< const vn::sensors::BinaryOutputRegister& >(result))), SWIGTYPE_p_vn__sensors__BinaryOutputRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -54636,7 +54977,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_binary_output_2__SWIG_0(PyObject *SWIG
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_binary_output_2" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeBinaryOutput2(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeBinaryOutput2(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54669,7 +55014,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_binary_output_2__SWIG_1(PyObject *SWIG
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_binary_output_2" "', argument " "2"" of type '" "vn::sensors::BinaryOutputRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp2);
-  (arg1)->writeBinaryOutput2(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeBinaryOutput2(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54747,7 +55096,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_binary_output_3(PyObject *SWIGUNUSEDPAR
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_binary_output_3" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readBinaryOutput3();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readBinaryOutput3();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::BinaryOutputRegister(static_cast< const vn::sensors::BinaryOutputRegister& >(result))), SWIGTYPE_p_vn__sensors__BinaryOutputRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -54789,7 +55142,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_binary_output_3__SWIG_0(PyObject *SWIG
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_binary_output_3" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeBinaryOutput3(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeBinaryOutput3(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54822,7 +55179,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_binary_output_3__SWIG_1(PyObject *SWIG
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_binary_output_3" "', argument " "2"" of type '" "vn::sensors::BinaryOutputRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::BinaryOutputRegister * >(argp2);
-  (arg1)->writeBinaryOutput3(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeBinaryOutput3(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -54909,7 +55270,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_serial_baudrate__SWIG_0(PyObject *SWIGU
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "VnSensor_read_serial_baudrate" "', argument " "2"" of type '" "uint8_t""'");
   } 
   arg2 = static_cast< uint8_t >(val2);
-  result = (uint32_t)(arg1)->readSerialBaudRate(arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (uint32_t)(arg1)->readSerialBaudRate(arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
   return resultobj;
 fail:
@@ -54959,7 +55324,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_serial_baudrate__SWIG_0(PyObject *SWIG
     SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "VnSensor_write_serial_baudrate" "', argument " "4"" of type '" "bool""'");
   } 
   arg4 = static_cast< bool >(val4);
-  (arg1)->writeSerialBaudRate((uint32_t const &)*arg2,arg3,arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeSerialBaudRate((uint32_t const &)*arg2,arg3,arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -55000,7 +55369,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_serial_baudrate__SWIG_1(PyObject *SWIG
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_serial_baudrate" "', argument " "3"" of type '" "uint8_t""'");
   } 
   arg3 = static_cast< uint8_t >(val3);
-  (arg1)->writeSerialBaudRate((uint32_t const &)*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeSerialBaudRate((uint32_t const &)*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -55031,7 +55404,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_async_data_output_type__SWIG_0(PyObject
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "VnSensor_read_async_data_output_type" "', argument " "2"" of type '" "uint8_t""'");
   } 
   arg2 = static_cast< uint8_t >(val2);
-  result = (vn::protocol::uart::AsciiAsync)(arg1)->readAsyncDataOutputType(arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (vn::protocol::uart::AsciiAsync)(arg1)->readAsyncDataOutputType(arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_From_int(static_cast< int >(result));
   return resultobj;
 fail:
@@ -55079,7 +55456,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_async_data_output_type__SWIG_0(PyObjec
     SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "VnSensor_write_async_data_output_type" "', argument " "4"" of type '" "bool""'");
   } 
   arg4 = static_cast< bool >(val4);
-  (arg1)->writeAsyncDataOutputType(arg2,arg3,arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeAsyncDataOutputType(arg2,arg3,arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -55118,7 +55499,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_async_data_output_type__SWIG_1(PyObjec
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_async_data_output_type" "', argument " "3"" of type '" "uint8_t""'");
   } 
   arg3 = static_cast< uint8_t >(val3);
-  (arg1)->writeAsyncDataOutputType(arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeAsyncDataOutputType(arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -55149,7 +55534,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_async_data_output_frequency__SWIG_0(PyO
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "VnSensor_read_async_data_output_frequency" "', argument " "2"" of type '" "uint8_t""'");
   } 
   arg2 = static_cast< uint8_t >(val2);
-  result = (uint32_t)(arg1)->readAsyncDataOutputFrequency(arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (uint32_t)(arg1)->readAsyncDataOutputFrequency(arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
   return resultobj;
 fail:
@@ -55199,7 +55588,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_async_data_output_frequency__SWIG_0(Py
     SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "VnSensor_write_async_data_output_frequency" "', argument " "4"" of type '" "bool""'");
   } 
   arg4 = static_cast< bool >(val4);
-  (arg1)->writeAsyncDataOutputFrequency((uint32_t const &)*arg2,arg3,arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeAsyncDataOutputFrequency((uint32_t const &)*arg2,arg3,arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -55240,7 +55633,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_async_data_output_frequency__SWIG_1(Py
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_async_data_output_frequency" "', argument " "3"" of type '" "uint8_t""'");
   } 
   arg3 = static_cast< uint8_t >(val3);
-  (arg1)->writeAsyncDataOutputFrequency((uint32_t const &)*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeAsyncDataOutputFrequency((uint32_t const &)*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -55262,7 +55659,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_ins_basic_configuration_vn200(PyObject
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_ins_basic_configuration_vn200" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readInsBasicConfigurationVn200();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readInsBasicConfigurationVn200();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::InsBasicConfigurationRegisterVn200(static_cast< const vn::sensors::InsBasicConfigurationRegisterVn200& >(result))), SWIGTYPE_p_vn__sensors__InsBasicConfigurationRegisterVn200, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -55304,7 +55705,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_ins_basic_configuration_vn200__SWIG_0(
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_ins_basic_configuration_vn200" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeInsBasicConfigurationVn200(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeInsBasicConfigurationVn200(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -55337,7 +55742,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_ins_basic_configuration_vn200__SWIG_1(
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_ins_basic_configuration_vn200" "', argument " "2"" of type '" "vn::sensors::InsBasicConfigurationRegisterVn200 &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::InsBasicConfigurationRegisterVn200 * >(argp2);
-  (arg1)->writeInsBasicConfigurationVn200(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeInsBasicConfigurationVn200(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -55387,7 +55796,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_ins_basic_configuration_vn200__SWIG_2(
     SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "VnSensor_write_ins_basic_configuration_vn200" "', argument " "4"" of type '" "bool""'");
   } 
   arg4 = static_cast< bool >(val4);
-  (arg1)->writeInsBasicConfigurationVn200(arg2,(uint8_t const &)*arg3,arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeInsBasicConfigurationVn200(arg2,(uint8_t const &)*arg3,arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -55428,7 +55841,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_ins_basic_configuration_vn200__SWIG_3(
   } 
   temp3 = static_cast< uint8_t >(val3);
   arg3 = &temp3;
-  (arg1)->writeInsBasicConfigurationVn200(arg2,(uint8_t const &)*arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeInsBasicConfigurationVn200(arg2,(uint8_t const &)*arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -55556,7 +55973,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_ins_basic_configuration_vn300(PyObject
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_ins_basic_configuration_vn300" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readInsBasicConfigurationVn300();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readInsBasicConfigurationVn300();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::InsBasicConfigurationRegisterVn300(static_cast< const vn::sensors::InsBasicConfigurationRegisterVn300& >(result))), SWIGTYPE_p_vn__sensors__InsBasicConfigurationRegisterVn300, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -55598,7 +56019,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_ins_basic_configuration_vn300__SWIG_0(
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_ins_basic_configuration_vn300" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeInsBasicConfigurationVn300(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeInsBasicConfigurationVn300(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -55631,7 +56056,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_ins_basic_configuration_vn300__SWIG_1(
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_ins_basic_configuration_vn300" "', argument " "2"" of type '" "vn::sensors::InsBasicConfigurationRegisterVn300 &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::InsBasicConfigurationRegisterVn300 * >(argp2);
-  (arg1)->writeInsBasicConfigurationVn300(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeInsBasicConfigurationVn300(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -55692,7 +56121,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_ins_basic_configuration_vn300__SWIG_2(
     SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "VnSensor_write_ins_basic_configuration_vn300" "', argument " "5"" of type '" "bool""'");
   } 
   arg5 = static_cast< bool >(val5);
-  (arg1)->writeInsBasicConfigurationVn300(arg2,(uint8_t const &)*arg3,(uint8_t const &)*arg4,arg5);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeInsBasicConfigurationVn300(arg2,(uint8_t const &)*arg3,(uint8_t const &)*arg4,arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -55744,7 +56177,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_ins_basic_configuration_vn300__SWIG_3(
   } 
   temp4 = static_cast< uint8_t >(val4);
   arg4 = &temp4;
-  (arg1)->writeInsBasicConfigurationVn300(arg2,(uint8_t const &)*arg3,(uint8_t const &)*arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeInsBasicConfigurationVn300(arg2,(uint8_t const &)*arg3,(uint8_t const &)*arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -55884,7 +56321,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_user_tag(PyObject *SWIGUNUSEDPARM(self)
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_user_tag" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readUserTag();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readUserTag();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_From_std_string(static_cast< std::string >(result));
   return resultobj;
 fail:
@@ -55928,7 +56369,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_user_tag__SWIG_0(PyObject *SWIGUNUSEDP
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_user_tag" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeUserTag((std::string const &)*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeUserTag((std::string const &)*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   if (SWIG_IsNewObj(res2)) delete arg2;
   return resultobj;
@@ -55965,7 +56410,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_user_tag__SWIG_1(PyObject *SWIGUNUSEDP
     }
     arg2 = ptr;
   }
-  (arg1)->writeUserTag((std::string const &)*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeUserTag((std::string const &)*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   if (SWIG_IsNewObj(res2)) delete arg2;
   return resultobj;
@@ -56043,7 +56492,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_model_number(PyObject *SWIGUNUSEDPARM(s
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_model_number" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readModelNumber();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readModelNumber();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_From_std_string(static_cast< std::string >(result));
   return resultobj;
 fail:
@@ -56065,7 +56518,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_hardware_revision(PyObject *SWIGUNUSEDP
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_hardware_revision" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (uint32_t)(arg1)->readHardwareRevision();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (uint32_t)(arg1)->readHardwareRevision();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
   return resultobj;
 fail:
@@ -56087,7 +56544,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_serial_number(PyObject *SWIGUNUSEDPARM(
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_serial_number" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (uint32_t)(arg1)->readSerialNumber();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (uint32_t)(arg1)->readSerialNumber();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
   return resultobj;
 fail:
@@ -56109,7 +56570,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_firmware_version(PyObject *SWIGUNUSEDPA
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_firmware_version" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readFirmwareVersion();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readFirmwareVersion();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_From_std_string(static_cast< std::string >(result));
   return resultobj;
 fail:
@@ -56131,7 +56596,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_serial_baudrate__SWIG_1(PyObject *SWIGU
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_serial_baudrate" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (uint32_t)(arg1)->readSerialBaudRate();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (uint32_t)(arg1)->readSerialBaudRate();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
   return resultobj;
 fail:
@@ -56218,7 +56687,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_serial_baudrate__SWIG_2(PyObject *SWIG
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_serial_baudrate" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeSerialBaudRate((uint32_t const &)*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeSerialBaudRate((uint32_t const &)*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -56250,7 +56723,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_serial_baudrate__SWIG_3(PyObject *SWIG
   } 
   temp2 = static_cast< uint32_t >(val2);
   arg2 = &temp2;
-  (arg1)->writeSerialBaudRate((uint32_t const &)*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeSerialBaudRate((uint32_t const &)*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -56380,7 +56857,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_async_data_output_type__SWIG_1(PyObject
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_async_data_output_type" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (vn::protocol::uart::AsciiAsync)(arg1)->readAsyncDataOutputType();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (vn::protocol::uart::AsciiAsync)(arg1)->readAsyncDataOutputType();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_From_int(static_cast< int >(result));
   return resultobj;
 fail:
@@ -56465,7 +56946,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_async_data_output_type__SWIG_2(PyObjec
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_async_data_output_type" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeAsyncDataOutputType(arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeAsyncDataOutputType(arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -56495,7 +56980,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_async_data_output_type__SWIG_3(PyObjec
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "VnSensor_write_async_data_output_type" "', argument " "2"" of type '" "vn::protocol::uart::AsciiAsync""'");
   } 
   arg2 = static_cast< vn::protocol::uart::AsciiAsync >(val2);
-  (arg1)->writeAsyncDataOutputType(arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeAsyncDataOutputType(arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -56625,7 +57114,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_async_data_output_frequency__SWIG_1(PyO
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_async_data_output_frequency" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (uint32_t)(arg1)->readAsyncDataOutputFrequency();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (uint32_t)(arg1)->readAsyncDataOutputFrequency();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
   return resultobj;
 fail:
@@ -56712,7 +57205,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_async_data_output_frequency__SWIG_2(Py
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_async_data_output_frequency" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeAsyncDataOutputFrequency((uint32_t const &)*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeAsyncDataOutputFrequency((uint32_t const &)*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -56744,7 +57241,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_async_data_output_frequency__SWIG_3(Py
   } 
   temp2 = static_cast< uint32_t >(val2);
   arg2 = &temp2;
-  (arg1)->writeAsyncDataOutputFrequency((uint32_t const &)*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeAsyncDataOutputFrequency((uint32_t const &)*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -56874,7 +57375,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_yaw_pitch_roll(PyObject *SWIGUNUSEDPARM
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_yaw_pitch_roll" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readYawPitchRoll();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readYawPitchRoll();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::math::vec3f(static_cast< const vn::math::vec3f& >(result))), SWIGTYPE_p_vn__math__vecT_3_float_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -56896,7 +57401,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_attitude_quaternion(PyObject *SWIGUNUSE
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_attitude_quaternion" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readAttitudeQuaternion();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readAttitudeQuaternion();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::math::vec4f(static_cast< const vn::math::vec4f& >(result))), SWIGTYPE_p_vn__math__vecT_4_float_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -56918,7 +57427,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_quaternion_magnetic_acceleration_and_an
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_quaternion_magnetic_acceleration_and_angular_rates" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readQuaternionMagneticAccelerationAndAngularRates();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readQuaternionMagneticAccelerationAndAngularRates();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::QuaternionMagneticAccelerationAndAngularRatesRegister(static_cast< const vn::sensors::QuaternionMagneticAccelerationAndAngularRatesRegister& >(result))), SWIGTYPE_p_vn__sensors__QuaternionMagneticAccelerationAndAngularRatesRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -56940,7 +57453,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_magnetic_measurements(PyObject *SWIGUNU
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_magnetic_measurements" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readMagneticMeasurements();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readMagneticMeasurements();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::math::vec3f(static_cast< const vn::math::vec3f& >(result))), SWIGTYPE_p_vn__math__vecT_3_float_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -56962,7 +57479,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_acceleration_measurements(PyObject *SWI
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_acceleration_measurements" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readAccelerationMeasurements();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readAccelerationMeasurements();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::math::vec3f(static_cast< const vn::math::vec3f& >(result))), SWIGTYPE_p_vn__math__vecT_3_float_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -56984,7 +57505,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_angular_rate_measurements(PyObject *SWI
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_angular_rate_measurements" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readAngularRateMeasurements();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readAngularRateMeasurements();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::math::vec3f(static_cast< const vn::math::vec3f& >(result))), SWIGTYPE_p_vn__math__vecT_3_float_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -57006,7 +57531,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_magnetic_acceleration_and_angular_rates
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_magnetic_acceleration_and_angular_rates" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readMagneticAccelerationAndAngularRates();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readMagneticAccelerationAndAngularRates();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::MagneticAccelerationAndAngularRatesRegister(static_cast< const vn::sensors::MagneticAccelerationAndAngularRatesRegister& >(result))), SWIGTYPE_p_vn__sensors__MagneticAccelerationAndAngularRatesRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -57028,7 +57557,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_magnetic_and_gravity_reference_vectors(
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_magnetic_and_gravity_reference_vectors" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readMagneticAndGravityReferenceVectors();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readMagneticAndGravityReferenceVectors();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::MagneticAndGravityReferenceVectorsRegister(static_cast< const vn::sensors::MagneticAndGravityReferenceVectorsRegister& >(result))), SWIGTYPE_p_vn__sensors__MagneticAndGravityReferenceVectorsRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -57070,7 +57603,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_magnetic_and_gravity_reference_vectors
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_magnetic_and_gravity_reference_vectors" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeMagneticAndGravityReferenceVectors(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeMagneticAndGravityReferenceVectors(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -57103,7 +57640,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_magnetic_and_gravity_reference_vectors
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_magnetic_and_gravity_reference_vectors" "', argument " "2"" of type '" "vn::sensors::MagneticAndGravityReferenceVectorsRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::MagneticAndGravityReferenceVectorsRegister * >(argp2);
-  (arg1)->writeMagneticAndGravityReferenceVectors(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeMagneticAndGravityReferenceVectors(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -57157,7 +57698,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_magnetic_and_gravity_reference_vectors
     SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "VnSensor_write_magnetic_and_gravity_reference_vectors" "', argument " "4"" of type '" "bool""'");
   } 
   arg4 = static_cast< bool >(val4);
-  (arg1)->writeMagneticAndGravityReferenceVectors((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeMagneticAndGravityReferenceVectors((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -57202,7 +57747,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_magnetic_and_gravity_reference_vectors
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_magnetic_and_gravity_reference_vectors" "', argument " "3"" of type '" "vn::math::vec3f const &""'"); 
   }
   arg3 = reinterpret_cast< vn::math::vec3f * >(argp3);
-  (arg1)->writeMagneticAndGravityReferenceVectors((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeMagneticAndGravityReferenceVectors((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -57322,7 +57871,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_filter_measurements_variance_parameters
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_filter_measurements_variance_parameters" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readFilterMeasurementsVarianceParameters();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readFilterMeasurementsVarianceParameters();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::FilterMeasurementsVarianceParametersRegister(static_cast< const vn::sensors::FilterMeasurementsVarianceParametersRegister& >(result))), SWIGTYPE_p_vn__sensors__FilterMeasurementsVarianceParametersRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -57364,7 +57917,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_filter_measurements_variance_parameter
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_filter_measurements_variance_parameters" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeFilterMeasurementsVarianceParameters(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeFilterMeasurementsVarianceParameters(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -57397,7 +57954,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_filter_measurements_variance_parameter
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_filter_measurements_variance_parameters" "', argument " "2"" of type '" "vn::sensors::FilterMeasurementsVarianceParametersRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::FilterMeasurementsVarianceParametersRegister * >(argp2);
-  (arg1)->writeFilterMeasurementsVarianceParameters(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeFilterMeasurementsVarianceParameters(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -57474,7 +58035,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_filter_measurements_variance_parameter
     SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "VnSensor_write_filter_measurements_variance_parameters" "', argument " "6"" of type '" "bool""'");
   } 
   arg6 = static_cast< bool >(val6);
-  (arg1)->writeFilterMeasurementsVarianceParameters((float const &)*arg2,(vn::math::vec3f const &)*arg3,(vn::math::vec3f const &)*arg4,(vn::math::vec3f const &)*arg5,arg6);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeFilterMeasurementsVarianceParameters((float const &)*arg2,(vn::math::vec3f const &)*arg3,(vn::math::vec3f const &)*arg4,(vn::math::vec3f const &)*arg5,arg6);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -57542,7 +58107,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_filter_measurements_variance_parameter
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_filter_measurements_variance_parameters" "', argument " "5"" of type '" "vn::math::vec3f const &""'"); 
   }
   arg5 = reinterpret_cast< vn::math::vec3f * >(argp5);
-  (arg1)->writeFilterMeasurementsVarianceParameters((float const &)*arg2,(vn::math::vec3f const &)*arg3,(vn::math::vec3f const &)*arg4,(vn::math::vec3f const &)*arg5);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeFilterMeasurementsVarianceParameters((float const &)*arg2,(vn::math::vec3f const &)*arg3,(vn::math::vec3f const &)*arg4,(vn::math::vec3f const &)*arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -57682,7 +58251,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_magnetometer_compensation(PyObject *SWI
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_magnetometer_compensation" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readMagnetometerCompensation();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readMagnetometerCompensation();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::MagnetometerCompensationRegister(static_cast< const vn::sensors::MagnetometerCompensationRegister& >(result))), SWIGTYPE_p_vn__sensors__MagnetometerCompensationRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -57724,7 +58297,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_magnetometer_compensation__SWIG_0(PyOb
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_magnetometer_compensation" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeMagnetometerCompensation(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeMagnetometerCompensation(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -57757,7 +58334,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_magnetometer_compensation__SWIG_1(PyOb
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_magnetometer_compensation" "', argument " "2"" of type '" "vn::sensors::MagnetometerCompensationRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::MagnetometerCompensationRegister * >(argp2);
-  (arg1)->writeMagnetometerCompensation(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeMagnetometerCompensation(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -57811,7 +58392,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_magnetometer_compensation__SWIG_2(PyOb
     SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "VnSensor_write_magnetometer_compensation" "', argument " "4"" of type '" "bool""'");
   } 
   arg4 = static_cast< bool >(val4);
-  (arg1)->writeMagnetometerCompensation((vn::math::mat3f const &)*arg2,(vn::math::vec3f const &)*arg3,arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeMagnetometerCompensation((vn::math::mat3f const &)*arg2,(vn::math::vec3f const &)*arg3,arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -57856,7 +58441,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_magnetometer_compensation__SWIG_3(PyOb
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_magnetometer_compensation" "', argument " "3"" of type '" "vn::math::vec3f const &""'"); 
   }
   arg3 = reinterpret_cast< vn::math::vec3f * >(argp3);
-  (arg1)->writeMagnetometerCompensation((vn::math::mat3f const &)*arg2,(vn::math::vec3f const &)*arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeMagnetometerCompensation((vn::math::mat3f const &)*arg2,(vn::math::vec3f const &)*arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -57976,7 +58565,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_filter_active_tuning_parameters(PyObjec
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_filter_active_tuning_parameters" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readFilterActiveTuningParameters();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readFilterActiveTuningParameters();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::FilterActiveTuningParametersRegister(static_cast< const vn::sensors::FilterActiveTuningParametersRegister& >(result))), SWIGTYPE_p_vn__sensors__FilterActiveTuningParametersRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -58018,7 +58611,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_filter_active_tuning_parameters__SWIG_
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_filter_active_tuning_parameters" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeFilterActiveTuningParameters(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeFilterActiveTuningParameters(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -58051,7 +58648,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_filter_active_tuning_parameters__SWIG_
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_filter_active_tuning_parameters" "', argument " "2"" of type '" "vn::sensors::FilterActiveTuningParametersRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::FilterActiveTuningParametersRegister * >(argp2);
-  (arg1)->writeFilterActiveTuningParameters(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeFilterActiveTuningParameters(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -58125,7 +58726,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_filter_active_tuning_parameters__SWIG_
     SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "VnSensor_write_filter_active_tuning_parameters" "', argument " "6"" of type '" "bool""'");
   } 
   arg6 = static_cast< bool >(val6);
-  (arg1)->writeFilterActiveTuningParameters((float const &)*arg2,(float const &)*arg3,(float const &)*arg4,(float const &)*arg5,arg6);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeFilterActiveTuningParameters((float const &)*arg2,(float const &)*arg3,(float const &)*arg4,(float const &)*arg5,arg6);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -58190,7 +58795,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_filter_active_tuning_parameters__SWIG_
   } 
   temp5 = static_cast< float >(val5);
   arg5 = &temp5;
-  (arg1)->writeFilterActiveTuningParameters((float const &)*arg2,(float const &)*arg3,(float const &)*arg4,(float const &)*arg5);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeFilterActiveTuningParameters((float const &)*arg2,(float const &)*arg3,(float const &)*arg4,(float const &)*arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -58342,7 +58951,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_acceleration_compensation(PyObject *SWI
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_acceleration_compensation" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readAccelerationCompensation();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readAccelerationCompensation();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::AccelerationCompensationRegister(static_cast< const vn::sensors::AccelerationCompensationRegister& >(result))), SWIGTYPE_p_vn__sensors__AccelerationCompensationRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -58384,7 +58997,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_acceleration_compensation__SWIG_0(PyOb
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_acceleration_compensation" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeAccelerationCompensation(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeAccelerationCompensation(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -58417,7 +59034,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_acceleration_compensation__SWIG_1(PyOb
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_acceleration_compensation" "', argument " "2"" of type '" "vn::sensors::AccelerationCompensationRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::AccelerationCompensationRegister * >(argp2);
-  (arg1)->writeAccelerationCompensation(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeAccelerationCompensation(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -58471,7 +59092,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_acceleration_compensation__SWIG_2(PyOb
     SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "VnSensor_write_acceleration_compensation" "', argument " "4"" of type '" "bool""'");
   } 
   arg4 = static_cast< bool >(val4);
-  (arg1)->writeAccelerationCompensation((vn::math::mat3f const &)*arg2,(vn::math::vec3f const &)*arg3,arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeAccelerationCompensation((vn::math::mat3f const &)*arg2,(vn::math::vec3f const &)*arg3,arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -58516,7 +59141,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_acceleration_compensation__SWIG_3(PyOb
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_acceleration_compensation" "', argument " "3"" of type '" "vn::math::vec3f const &""'"); 
   }
   arg3 = reinterpret_cast< vn::math::vec3f * >(argp3);
-  (arg1)->writeAccelerationCompensation((vn::math::mat3f const &)*arg2,(vn::math::vec3f const &)*arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeAccelerationCompensation((vn::math::mat3f const &)*arg2,(vn::math::vec3f const &)*arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -58636,7 +59265,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_reference_frame_rotation(PyObject *SWIG
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_reference_frame_rotation" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readReferenceFrameRotation();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readReferenceFrameRotation();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::math::mat3f(static_cast< const vn::math::mat3f& >(result))), SWIGTYPE_p_vn__math__matT_3_3_float_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -58678,7 +59311,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_reference_frame_rotation__SWIG_0(PyObj
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_reference_frame_rotation" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeReferenceFrameRotation((vn::math::mat3f const &)*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeReferenceFrameRotation((vn::math::mat3f const &)*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -58711,7 +59348,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_reference_frame_rotation__SWIG_1(PyObj
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_reference_frame_rotation" "', argument " "2"" of type '" "vn::math::mat3f const &""'"); 
   }
   arg2 = reinterpret_cast< vn::math::mat3f * >(argp2);
-  (arg1)->writeReferenceFrameRotation((vn::math::mat3f const &)*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeReferenceFrameRotation((vn::math::mat3f const &)*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -58787,7 +59428,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_yaw_pitch_roll_magnetic_acceleration_an
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_yaw_pitch_roll_magnetic_acceleration_and_angular_rates" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readYawPitchRollMagneticAccelerationAndAngularRates();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readYawPitchRollMagneticAccelerationAndAngularRates();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::YawPitchRollMagneticAccelerationAndAngularRatesRegister(static_cast< const vn::sensors::YawPitchRollMagneticAccelerationAndAngularRatesRegister& >(result))), SWIGTYPE_p_vn__sensors__YawPitchRollMagneticAccelerationAndAngularRatesRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -58809,7 +59454,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_communication_protocol_control(PyObject
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_communication_protocol_control" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readCommunicationProtocolControl();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readCommunicationProtocolControl();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::CommunicationProtocolControlRegister(static_cast< const vn::sensors::CommunicationProtocolControlRegister& >(result))), SWIGTYPE_p_vn__sensors__CommunicationProtocolControlRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -58851,7 +59500,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_communication_protocol_control__SWIG_0
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_communication_protocol_control" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeCommunicationProtocolControl(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeCommunicationProtocolControl(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -58884,7 +59537,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_communication_protocol_control__SWIG_1
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_communication_protocol_control" "', argument " "2"" of type '" "vn::sensors::CommunicationProtocolControlRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::CommunicationProtocolControlRegister * >(argp2);
-  (arg1)->writeCommunicationProtocolControl(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeCommunicationProtocolControl(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -58977,7 +59634,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_communication_protocol_control__SWIG_2
     SWIG_exception_fail(SWIG_ArgError(ecode9), "in method '" "VnSensor_write_communication_protocol_control" "', argument " "9"" of type '" "bool""'");
   } 
   arg9 = static_cast< bool >(val9);
-  (arg1)->writeCommunicationProtocolControl(arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeCommunicationProtocolControl(arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -59061,7 +59722,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_communication_protocol_control__SWIG_3
     SWIG_exception_fail(SWIG_ArgError(ecode8), "in method '" "VnSensor_write_communication_protocol_control" "', argument " "8"" of type '" "vn::protocol::uart::ErrorMode""'");
   } 
   arg8 = static_cast< vn::protocol::uart::ErrorMode >(val8);
-  (arg1)->writeCommunicationProtocolControl(arg2,arg3,arg4,arg5,arg6,arg7,arg8);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeCommunicationProtocolControl(arg2,arg3,arg4,arg5,arg6,arg7,arg8);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -59249,7 +59914,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_synchronization_control(PyObject *SWIGU
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_synchronization_control" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readSynchronizationControl();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readSynchronizationControl();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::SynchronizationControlRegister(static_cast< const vn::sensors::SynchronizationControlRegister& >(result))), SWIGTYPE_p_vn__sensors__SynchronizationControlRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -59291,7 +59960,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_synchronization_control__SWIG_0(PyObje
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_synchronization_control" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeSynchronizationControl(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeSynchronizationControl(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -59324,7 +59997,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_synchronization_control__SWIG_1(PyObje
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_synchronization_control" "', argument " "2"" of type '" "vn::sensors::SynchronizationControlRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::SynchronizationControlRegister * >(argp2);
-  (arg1)->writeSynchronizationControl(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeSynchronizationControl(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -59423,7 +60100,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_synchronization_control__SWIG_2(PyObje
     SWIG_exception_fail(SWIG_ArgError(ecode9), "in method '" "VnSensor_write_synchronization_control" "', argument " "9"" of type '" "bool""'");
   } 
   arg9 = static_cast< bool >(val9);
-  (arg1)->writeSynchronizationControl(arg2,arg3,(uint16_t const &)*arg4,arg5,arg6,(uint16_t const &)*arg7,(uint32_t const &)*arg8,arg9);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeSynchronizationControl(arg2,arg3,(uint16_t const &)*arg4,arg5,arg6,(uint16_t const &)*arg7,(uint32_t const &)*arg8,arg9);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -59513,7 +60194,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_synchronization_control__SWIG_3(PyObje
   } 
   temp8 = static_cast< uint32_t >(val8);
   arg8 = &temp8;
-  (arg1)->writeSynchronizationControl(arg2,arg3,(uint16_t const &)*arg4,arg5,arg6,(uint16_t const &)*arg7,(uint32_t const &)*arg8);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeSynchronizationControl(arg2,arg3,(uint16_t const &)*arg4,arg5,arg6,(uint16_t const &)*arg7,(uint32_t const &)*arg8);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -59701,7 +60386,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_synchronization_status(PyObject *SWIGUN
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_synchronization_status" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readSynchronizationStatus();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readSynchronizationStatus();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::SynchronizationStatusRegister(static_cast< const vn::sensors::SynchronizationStatusRegister& >(result))), SWIGTYPE_p_vn__sensors__SynchronizationStatusRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -59743,7 +60432,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_synchronization_status__SWIG_0(PyObjec
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_synchronization_status" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeSynchronizationStatus(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeSynchronizationStatus(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -59776,7 +60469,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_synchronization_status__SWIG_1(PyObjec
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_synchronization_status" "', argument " "2"" of type '" "vn::sensors::SynchronizationStatusRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::SynchronizationStatusRegister * >(argp2);
-  (arg1)->writeSynchronizationStatus(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeSynchronizationStatus(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -59839,7 +60536,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_synchronization_status__SWIG_2(PyObjec
     SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "VnSensor_write_synchronization_status" "', argument " "5"" of type '" "bool""'");
   } 
   arg5 = static_cast< bool >(val5);
-  (arg1)->writeSynchronizationStatus((uint32_t const &)*arg2,(uint32_t const &)*arg3,(uint32_t const &)*arg4,arg5);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeSynchronizationStatus((uint32_t const &)*arg2,(uint32_t const &)*arg3,(uint32_t const &)*arg4,arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -59893,7 +60594,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_synchronization_status__SWIG_3(PyObjec
   } 
   temp4 = static_cast< uint32_t >(val4);
   arg4 = &temp4;
-  (arg1)->writeSynchronizationStatus((uint32_t const &)*arg2,(uint32_t const &)*arg3,(uint32_t const &)*arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeSynchronizationStatus((uint32_t const &)*arg2,(uint32_t const &)*arg3,(uint32_t const &)*arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -60033,7 +60738,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_filter_basic_control(PyObject *SWIGUNUS
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_filter_basic_control" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readFilterBasicControl();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readFilterBasicControl();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::FilterBasicControlRegister(static_cast< const vn::sensors::FilterBasicControlRegister& >(result))), SWIGTYPE_p_vn__sensors__FilterBasicControlRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -60075,7 +60784,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_filter_basic_control__SWIG_0(PyObject
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_filter_basic_control" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeFilterBasicControl(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeFilterBasicControl(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -60108,7 +60821,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_filter_basic_control__SWIG_1(PyObject
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_filter_basic_control" "', argument " "2"" of type '" "vn::sensors::FilterBasicControlRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::FilterBasicControlRegister * >(argp2);
-  (arg1)->writeFilterBasicControl(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeFilterBasicControl(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -60186,7 +60903,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_filter_basic_control__SWIG_2(PyObject
     SWIG_exception_fail(SWIG_ArgError(ecode7), "in method '" "VnSensor_write_filter_basic_control" "', argument " "7"" of type '" "bool""'");
   } 
   arg7 = static_cast< bool >(val7);
-  (arg1)->writeFilterBasicControl(arg2,arg3,arg4,arg5,(vn::math::vec3f const &)*arg6,arg7);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeFilterBasicControl(arg2,arg3,arg4,arg5,(vn::math::vec3f const &)*arg6,arg7);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -60255,7 +60976,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_filter_basic_control__SWIG_3(PyObject
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_filter_basic_control" "', argument " "6"" of type '" "vn::math::vec3f const &""'"); 
   }
   arg6 = reinterpret_cast< vn::math::vec3f * >(argp6);
-  (arg1)->writeFilterBasicControl(arg2,arg3,arg4,arg5,(vn::math::vec3f const &)*arg6);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeFilterBasicControl(arg2,arg3,arg4,arg5,(vn::math::vec3f const &)*arg6);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -60415,7 +61140,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_vpe_basic_control(PyObject *SWIGUNUSEDP
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_vpe_basic_control" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readVpeBasicControl();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readVpeBasicControl();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::VpeBasicControlRegister(static_cast< const vn::sensors::VpeBasicControlRegister& >(result))), SWIGTYPE_p_vn__sensors__VpeBasicControlRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -60457,7 +61186,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_basic_control__SWIG_0(PyObject *SW
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_vpe_basic_control" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeVpeBasicControl(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeBasicControl(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -60490,7 +61223,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_basic_control__SWIG_1(PyObject *SW
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_vpe_basic_control" "', argument " "2"" of type '" "vn::sensors::VpeBasicControlRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::VpeBasicControlRegister * >(argp2);
-  (arg1)->writeVpeBasicControl(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeBasicControl(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -60556,7 +61293,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_basic_control__SWIG_2(PyObject *SW
     SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "VnSensor_write_vpe_basic_control" "', argument " "6"" of type '" "bool""'");
   } 
   arg6 = static_cast< bool >(val6);
-  (arg1)->writeVpeBasicControl(arg2,arg3,arg4,arg5,arg6);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeBasicControl(arg2,arg3,arg4,arg5,arg6);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -60613,7 +61354,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_basic_control__SWIG_3(PyObject *SW
     SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "VnSensor_write_vpe_basic_control" "', argument " "5"" of type '" "vn::protocol::uart::VpeMode""'");
   } 
   arg5 = static_cast< vn::protocol::uart::VpeMode >(val5);
-  (arg1)->writeVpeBasicControl(arg2,arg3,arg4,arg5);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeBasicControl(arg2,arg3,arg4,arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -60765,7 +61510,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_vpe_magnetometer_basic_tuning(PyObject
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_vpe_magnetometer_basic_tuning" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readVpeMagnetometerBasicTuning();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readVpeMagnetometerBasicTuning();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::VpeMagnetometerBasicTuningRegister(static_cast< const vn::sensors::VpeMagnetometerBasicTuningRegister& >(result))), SWIGTYPE_p_vn__sensors__VpeMagnetometerBasicTuningRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -60807,7 +61556,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_magnetometer_basic_tuning__SWIG_0(
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_vpe_magnetometer_basic_tuning" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeVpeMagnetometerBasicTuning(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeMagnetometerBasicTuning(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -60840,7 +61593,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_magnetometer_basic_tuning__SWIG_1(
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_vpe_magnetometer_basic_tuning" "', argument " "2"" of type '" "vn::sensors::VpeMagnetometerBasicTuningRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::VpeMagnetometerBasicTuningRegister * >(argp2);
-  (arg1)->writeVpeMagnetometerBasicTuning(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeMagnetometerBasicTuning(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -60906,7 +61663,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_magnetometer_basic_tuning__SWIG_2(
     SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "VnSensor_write_vpe_magnetometer_basic_tuning" "', argument " "5"" of type '" "bool""'");
   } 
   arg5 = static_cast< bool >(val5);
-  (arg1)->writeVpeMagnetometerBasicTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(vn::math::vec3f const &)*arg4,arg5);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeMagnetometerBasicTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(vn::math::vec3f const &)*arg4,arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -60963,7 +61724,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_magnetometer_basic_tuning__SWIG_3(
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_vpe_magnetometer_basic_tuning" "', argument " "4"" of type '" "vn::math::vec3f const &""'"); 
   }
   arg4 = reinterpret_cast< vn::math::vec3f * >(argp4);
-  (arg1)->writeVpeMagnetometerBasicTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(vn::math::vec3f const &)*arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeMagnetometerBasicTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(vn::math::vec3f const &)*arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -61091,7 +61856,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_vpe_magnetometer_advanced_tuning(PyObje
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_vpe_magnetometer_advanced_tuning" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readVpeMagnetometerAdvancedTuning();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readVpeMagnetometerAdvancedTuning();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::VpeMagnetometerAdvancedTuningRegister(static_cast< const vn::sensors::VpeMagnetometerAdvancedTuningRegister& >(result))), SWIGTYPE_p_vn__sensors__VpeMagnetometerAdvancedTuningRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -61133,7 +61902,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_magnetometer_advanced_tuning__SWIG
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_vpe_magnetometer_advanced_tuning" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeVpeMagnetometerAdvancedTuning(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeMagnetometerAdvancedTuning(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -61166,7 +61939,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_magnetometer_advanced_tuning__SWIG
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_vpe_magnetometer_advanced_tuning" "', argument " "2"" of type '" "vn::sensors::VpeMagnetometerAdvancedTuningRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::VpeMagnetometerAdvancedTuningRegister * >(argp2);
-  (arg1)->writeVpeMagnetometerAdvancedTuning(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeMagnetometerAdvancedTuning(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -61253,7 +62030,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_magnetometer_advanced_tuning__SWIG
     SWIG_exception_fail(SWIG_ArgError(ecode7), "in method '" "VnSensor_write_vpe_magnetometer_advanced_tuning" "', argument " "7"" of type '" "bool""'");
   } 
   arg7 = static_cast< bool >(val7);
-  (arg1)->writeVpeMagnetometerAdvancedTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(float const &)*arg4,(float const &)*arg5,(float const &)*arg6,arg7);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeMagnetometerAdvancedTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(float const &)*arg4,(float const &)*arg5,(float const &)*arg6,arg7);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -61331,7 +62112,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_magnetometer_advanced_tuning__SWIG
   } 
   temp6 = static_cast< float >(val6);
   arg6 = &temp6;
-  (arg1)->writeVpeMagnetometerAdvancedTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(float const &)*arg4,(float const &)*arg5,(float const &)*arg6);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeMagnetometerAdvancedTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(float const &)*arg4,(float const &)*arg5,(float const &)*arg6);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -61487,7 +62272,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_vpe_accelerometer_basic_tuning(PyObject
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_vpe_accelerometer_basic_tuning" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readVpeAccelerometerBasicTuning();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readVpeAccelerometerBasicTuning();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::VpeAccelerometerBasicTuningRegister(static_cast< const vn::sensors::VpeAccelerometerBasicTuningRegister& >(result))), SWIGTYPE_p_vn__sensors__VpeAccelerometerBasicTuningRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -61529,7 +62318,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_accelerometer_basic_tuning__SWIG_0
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_vpe_accelerometer_basic_tuning" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeVpeAccelerometerBasicTuning(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeAccelerometerBasicTuning(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -61562,7 +62355,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_accelerometer_basic_tuning__SWIG_1
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_vpe_accelerometer_basic_tuning" "', argument " "2"" of type '" "vn::sensors::VpeAccelerometerBasicTuningRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::VpeAccelerometerBasicTuningRegister * >(argp2);
-  (arg1)->writeVpeAccelerometerBasicTuning(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeAccelerometerBasicTuning(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -61628,7 +62425,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_accelerometer_basic_tuning__SWIG_2
     SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "VnSensor_write_vpe_accelerometer_basic_tuning" "', argument " "5"" of type '" "bool""'");
   } 
   arg5 = static_cast< bool >(val5);
-  (arg1)->writeVpeAccelerometerBasicTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(vn::math::vec3f const &)*arg4,arg5);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeAccelerometerBasicTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(vn::math::vec3f const &)*arg4,arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -61685,7 +62486,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_accelerometer_basic_tuning__SWIG_3
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_vpe_accelerometer_basic_tuning" "', argument " "4"" of type '" "vn::math::vec3f const &""'"); 
   }
   arg4 = reinterpret_cast< vn::math::vec3f * >(argp4);
-  (arg1)->writeVpeAccelerometerBasicTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(vn::math::vec3f const &)*arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeAccelerometerBasicTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(vn::math::vec3f const &)*arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -61813,7 +62618,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_vpe_accelerometer_advanced_tuning(PyObj
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_vpe_accelerometer_advanced_tuning" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readVpeAccelerometerAdvancedTuning();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readVpeAccelerometerAdvancedTuning();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::VpeAccelerometerAdvancedTuningRegister(static_cast< const vn::sensors::VpeAccelerometerAdvancedTuningRegister& >(result))), SWIGTYPE_p_vn__sensors__VpeAccelerometerAdvancedTuningRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -61855,7 +62664,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_accelerometer_advanced_tuning__SWI
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_vpe_accelerometer_advanced_tuning" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeVpeAccelerometerAdvancedTuning(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeAccelerometerAdvancedTuning(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -61888,7 +62701,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_accelerometer_advanced_tuning__SWI
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_vpe_accelerometer_advanced_tuning" "', argument " "2"" of type '" "vn::sensors::VpeAccelerometerAdvancedTuningRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::VpeAccelerometerAdvancedTuningRegister * >(argp2);
-  (arg1)->writeVpeAccelerometerAdvancedTuning(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeAccelerometerAdvancedTuning(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -61975,7 +62792,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_accelerometer_advanced_tuning__SWI
     SWIG_exception_fail(SWIG_ArgError(ecode7), "in method '" "VnSensor_write_vpe_accelerometer_advanced_tuning" "', argument " "7"" of type '" "bool""'");
   } 
   arg7 = static_cast< bool >(val7);
-  (arg1)->writeVpeAccelerometerAdvancedTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(float const &)*arg4,(float const &)*arg5,(float const &)*arg6,arg7);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeAccelerometerAdvancedTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(float const &)*arg4,(float const &)*arg5,(float const &)*arg6,arg7);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -62053,7 +62874,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_vpe_accelerometer_advanced_tuning__SWI
   } 
   temp6 = static_cast< float >(val6);
   arg6 = &temp6;
-  (arg1)->writeVpeAccelerometerAdvancedTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(float const &)*arg4,(float const &)*arg5,(float const &)*arg6);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeAccelerometerAdvancedTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(float const &)*arg4,(float const &)*arg5,(float const &)*arg6);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -62209,7 +63034,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_readVpeGyroBasicTuning(PyObject *SWIGUNUSEDP
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_readVpeGyroBasicTuning" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readVpeGyroBasicTuning();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readVpeGyroBasicTuning();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::VpeGyroBasicTuningRegister(static_cast< const vn::sensors::VpeGyroBasicTuningRegister& >(result))), SWIGTYPE_p_vn__sensors__VpeGyroBasicTuningRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -62251,7 +63080,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_writeVpeGyroBasicTuning__SWIG_0(PyObject *SW
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_writeVpeGyroBasicTuning" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeVpeGyroBasicTuning(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeGyroBasicTuning(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -62284,7 +63117,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_writeVpeGyroBasicTuning__SWIG_1(PyObject *SW
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_writeVpeGyroBasicTuning" "', argument " "2"" of type '" "vn::sensors::VpeGyroBasicTuningRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::VpeGyroBasicTuningRegister * >(argp2);
-  (arg1)->writeVpeGyroBasicTuning(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeGyroBasicTuning(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -62350,7 +63187,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_writeVpeGyroBasicTuning__SWIG_2(PyObject *SW
     SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "VnSensor_writeVpeGyroBasicTuning" "', argument " "5"" of type '" "bool""'");
   } 
   arg5 = static_cast< bool >(val5);
-  (arg1)->writeVpeGyroBasicTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(vn::math::vec3f const &)*arg4,arg5);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeGyroBasicTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(vn::math::vec3f const &)*arg4,arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -62407,7 +63248,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_writeVpeGyroBasicTuning__SWIG_3(PyObject *SW
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_writeVpeGyroBasicTuning" "', argument " "4"" of type '" "vn::math::vec3f const &""'"); 
   }
   arg4 = reinterpret_cast< vn::math::vec3f * >(argp4);
-  (arg1)->writeVpeGyroBasicTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(vn::math::vec3f const &)*arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVpeGyroBasicTuning((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(vn::math::vec3f const &)*arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -62535,7 +63380,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_filter_startup_gyro_bias(PyObject *SWIG
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_filter_startup_gyro_bias" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readFilterStartupGyroBias();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readFilterStartupGyroBias();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::math::vec3f(static_cast< const vn::math::vec3f& >(result))), SWIGTYPE_p_vn__math__vecT_3_float_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -62577,7 +63426,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_filter_startup_gyro_bias__SWIG_0(PyObj
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_filter_startup_gyro_bias" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeFilterStartupGyroBias((vn::math::vec3f const &)*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeFilterStartupGyroBias((vn::math::vec3f const &)*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -62610,7 +63463,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_filter_startup_gyro_bias__SWIG_1(PyObj
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_filter_startup_gyro_bias" "', argument " "2"" of type '" "vn::math::vec3f const &""'"); 
   }
   arg2 = reinterpret_cast< vn::math::vec3f * >(argp2);
-  (arg1)->writeFilterStartupGyroBias((vn::math::vec3f const &)*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeFilterStartupGyroBias((vn::math::vec3f const &)*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -62686,7 +63543,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_magnetometer_calibration_control(PyObje
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_magnetometer_calibration_control" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readMagnetometerCalibrationControl();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readMagnetometerCalibrationControl();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::MagnetometerCalibrationControlRegister(static_cast< const vn::sensors::MagnetometerCalibrationControlRegister& >(result))), SWIGTYPE_p_vn__sensors__MagnetometerCalibrationControlRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -62728,7 +63589,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_magnetometer_calibration_control__SWIG
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_magnetometer_calibration_control" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeMagnetometerCalibrationControl(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeMagnetometerCalibrationControl(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -62761,7 +63626,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_magnetometer_calibration_control__SWIG
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_magnetometer_calibration_control" "', argument " "2"" of type '" "vn::sensors::MagnetometerCalibrationControlRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::MagnetometerCalibrationControlRegister * >(argp2);
-  (arg1)->writeMagnetometerCalibrationControl(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeMagnetometerCalibrationControl(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -62820,7 +63689,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_magnetometer_calibration_control__SWIG
     SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "VnSensor_write_magnetometer_calibration_control" "', argument " "5"" of type '" "bool""'");
   } 
   arg5 = static_cast< bool >(val5);
-  (arg1)->writeMagnetometerCalibrationControl(arg2,arg3,(uint8_t const &)*arg4,arg5);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeMagnetometerCalibrationControl(arg2,arg3,(uint8_t const &)*arg4,arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -62870,7 +63743,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_magnetometer_calibration_control__SWIG
   } 
   temp4 = static_cast< uint8_t >(val4);
   arg4 = &temp4;
-  (arg1)->writeMagnetometerCalibrationControl(arg2,arg3,(uint8_t const &)*arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeMagnetometerCalibrationControl(arg2,arg3,(uint8_t const &)*arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -63010,7 +63887,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_calculated_magnetometer_calibration(PyO
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_calculated_magnetometer_calibration" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readCalculatedMagnetometerCalibration();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readCalculatedMagnetometerCalibration();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::CalculatedMagnetometerCalibrationRegister(static_cast< const vn::sensors::CalculatedMagnetometerCalibrationRegister& >(result))), SWIGTYPE_p_vn__sensors__CalculatedMagnetometerCalibrationRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -63032,7 +63913,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_indoor_heading_mode_control(PyObject *S
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_indoor_heading_mode_control" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (float)(arg1)->readIndoorHeadingModeControl();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (float)(arg1)->readIndoorHeadingModeControl();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_From_float(static_cast< float >(result));
   return resultobj;
 fail:
@@ -63073,7 +63958,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_indoor_heading_mode_control__SWIG_0(Py
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_indoor_heading_mode_control" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeIndoorHeadingModeControl((float const &)*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeIndoorHeadingModeControl((float const &)*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -63105,7 +63994,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_indoor_heading_mode_control__SWIG_1(Py
   } 
   temp2 = static_cast< float >(val2);
   arg2 = &temp2;
-  (arg1)->writeIndoorHeadingModeControl((float const &)*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeIndoorHeadingModeControl((float const &)*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -63185,7 +64078,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_velocity_compensation_measurement(PyObj
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_velocity_compensation_measurement" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readVelocityCompensationMeasurement();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readVelocityCompensationMeasurement();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::math::vec3f(static_cast< const vn::math::vec3f& >(result))), SWIGTYPE_p_vn__math__vecT_3_float_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -63227,7 +64124,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_velocity_compensation_measurement__SWI
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_velocity_compensation_measurement" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeVelocityCompensationMeasurement((vn::math::vec3f const &)*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVelocityCompensationMeasurement((vn::math::vec3f const &)*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -63260,7 +64161,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_velocity_compensation_measurement__SWI
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_velocity_compensation_measurement" "', argument " "2"" of type '" "vn::math::vec3f const &""'"); 
   }
   arg2 = reinterpret_cast< vn::math::vec3f * >(argp2);
-  (arg1)->writeVelocityCompensationMeasurement((vn::math::vec3f const &)*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVelocityCompensationMeasurement((vn::math::vec3f const &)*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -63336,7 +64241,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_velocity_compensation_control(PyObject
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_velocity_compensation_control" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readVelocityCompensationControl();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readVelocityCompensationControl();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::VelocityCompensationControlRegister(static_cast< const vn::sensors::VelocityCompensationControlRegister& >(result))), SWIGTYPE_p_vn__sensors__VelocityCompensationControlRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -63378,7 +64287,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_velocity_compensation_control__SWIG_0(
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_velocity_compensation_control" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeVelocityCompensationControl(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVelocityCompensationControl(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -63411,7 +64324,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_velocity_compensation_control__SWIG_1(
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_velocity_compensation_control" "', argument " "2"" of type '" "vn::sensors::VelocityCompensationControlRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::VelocityCompensationControlRegister * >(argp2);
-  (arg1)->writeVelocityCompensationControl(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVelocityCompensationControl(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -63472,7 +64389,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_velocity_compensation_control__SWIG_2(
     SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "VnSensor_write_velocity_compensation_control" "', argument " "5"" of type '" "bool""'");
   } 
   arg5 = static_cast< bool >(val5);
-  (arg1)->writeVelocityCompensationControl(arg2,(float const &)*arg3,(float const &)*arg4,arg5);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVelocityCompensationControl(arg2,(float const &)*arg3,(float const &)*arg4,arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -63524,7 +64445,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_velocity_compensation_control__SWIG_3(
   } 
   temp4 = static_cast< float >(val4);
   arg4 = &temp4;
-  (arg1)->writeVelocityCompensationControl(arg2,(float const &)*arg3,(float const &)*arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeVelocityCompensationControl(arg2,(float const &)*arg3,(float const &)*arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -63664,7 +64589,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_velocity_compensation_status(PyObject *
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_velocity_compensation_status" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readVelocityCompensationStatus();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readVelocityCompensationStatus();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::VelocityCompensationStatusRegister(static_cast< const vn::sensors::VelocityCompensationStatusRegister& >(result))), SWIGTYPE_p_vn__sensors__VelocityCompensationStatusRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -63686,7 +64615,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_imu_measurements(PyObject *SWIGUNUSEDPA
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_imu_measurements" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readImuMeasurements();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readImuMeasurements();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::ImuMeasurementsRegister(static_cast< const vn::sensors::ImuMeasurementsRegister& >(result))), SWIGTYPE_p_vn__sensors__ImuMeasurementsRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -63708,7 +64641,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_gps_configuration(PyObject *SWIGUNUSEDP
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_gps_configuration" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readGpsConfiguration();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readGpsConfiguration();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::GpsConfigurationRegister(static_cast< const vn::sensors::GpsConfigurationRegister& >(result))), SWIGTYPE_p_vn__sensors__GpsConfigurationRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -63750,7 +64687,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_gps_configuration__SWIG_0(PyObject *SW
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_gps_configuration" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeGpsConfiguration(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeGpsConfiguration(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -63783,7 +64724,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_gps_configuration__SWIG_1(PyObject *SW
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_gps_configuration" "', argument " "2"" of type '" "vn::sensors::GpsConfigurationRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::GpsConfigurationRegister * >(argp2);
-  (arg1)->writeGpsConfiguration(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeGpsConfiguration(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -63831,7 +64776,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_gps_configuration__SWIG_2(PyObject *SW
     SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "VnSensor_write_gps_configuration" "', argument " "4"" of type '" "bool""'");
   } 
   arg4 = static_cast< bool >(val4);
-  (arg1)->writeGpsConfiguration(arg2,arg3,arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeGpsConfiguration(arg2,arg3,arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -63870,7 +64819,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_gps_configuration__SWIG_3(PyObject *SW
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_gps_configuration" "', argument " "3"" of type '" "vn::protocol::uart::PpsSource""'");
   } 
   arg3 = static_cast< vn::protocol::uart::PpsSource >(val3);
-  (arg1)->writeGpsConfiguration(arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeGpsConfiguration(arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -63998,7 +64951,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_gps_antenna_offset(PyObject *SWIGUNUSED
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_gps_antenna_offset" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readGpsAntennaOffset();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readGpsAntennaOffset();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::math::vec3f(static_cast< const vn::math::vec3f& >(result))), SWIGTYPE_p_vn__math__vecT_3_float_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -64040,7 +64997,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_gps_antenna_offset__SWIG_0(PyObject *S
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_gps_antenna_offset" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeGpsAntennaOffset((vn::math::vec3f const &)*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeGpsAntennaOffset((vn::math::vec3f const &)*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -64073,7 +65034,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_gps_antenna_offset__SWIG_1(PyObject *S
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_gps_antenna_offset" "', argument " "2"" of type '" "vn::math::vec3f const &""'"); 
   }
   arg2 = reinterpret_cast< vn::math::vec3f * >(argp2);
-  (arg1)->writeGpsAntennaOffset((vn::math::vec3f const &)*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeGpsAntennaOffset((vn::math::vec3f const &)*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -64149,7 +65114,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_gps_solution_lla(PyObject *SWIGUNUSEDPA
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_gps_solution_lla" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readGpsSolutionLla();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readGpsSolutionLla();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::GpsSolutionLlaRegister(static_cast< const vn::sensors::GpsSolutionLlaRegister& >(result))), SWIGTYPE_p_vn__sensors__GpsSolutionLlaRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -64171,7 +65140,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_gps_solution_ecef(PyObject *SWIGUNUSEDP
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_gps_solution_ecef" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readGpsSolutionEcef();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readGpsSolutionEcef();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::GpsSolutionEcefRegister(static_cast< const vn::sensors::GpsSolutionEcefRegister& >(result))), SWIGTYPE_p_vn__sensors__GpsSolutionEcefRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -64193,7 +65166,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_ins_solution_lla(PyObject *SWIGUNUSEDPA
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_ins_solution_lla" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readInsSolutionLla();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readInsSolutionLla();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::InsSolutionLlaRegister(static_cast< const vn::sensors::InsSolutionLlaRegister& >(result))), SWIGTYPE_p_vn__sensors__InsSolutionLlaRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -64215,7 +65192,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_ins_solution_ecef(PyObject *SWIGUNUSEDP
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_ins_solution_ecef" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readInsSolutionEcef();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readInsSolutionEcef();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::InsSolutionEcefRegister(static_cast< const vn::sensors::InsSolutionEcefRegister& >(result))), SWIGTYPE_p_vn__sensors__InsSolutionEcefRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -64237,7 +65218,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_ins_advanced_configuration(PyObject *SW
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_ins_advanced_configuration" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readInsAdvancedConfiguration();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readInsAdvancedConfiguration();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::InsAdvancedConfigurationRegister(static_cast< const vn::sensors::InsAdvancedConfigurationRegister& >(result))), SWIGTYPE_p_vn__sensors__InsAdvancedConfigurationRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -64279,7 +65264,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_ins_advanced_configuration__SWIG_0(PyO
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_ins_advanced_configuration" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeInsAdvancedConfiguration(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeInsAdvancedConfiguration(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -64312,7 +65301,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_ins_advanced_configuration__SWIG_1(PyO
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_ins_advanced_configuration" "', argument " "2"" of type '" "vn::sensors::InsAdvancedConfigurationRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::InsAdvancedConfigurationRegister * >(argp2);
-  (arg1)->writeInsAdvancedConfiguration(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeInsAdvancedConfiguration(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -64505,7 +65498,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_ins_advanced_configuration__SWIG_2(PyO
     SWIG_exception_fail(SWIG_ArgError(ecode17), "in method '" "VnSensor_write_ins_advanced_configuration" "', argument " "17"" of type '" "bool""'");
   } 
   arg17 = static_cast< bool >(val17);
-  (arg1)->writeInsAdvancedConfiguration((uint8_t const &)*arg2,(uint8_t const &)*arg3,(uint8_t const &)*arg4,(uint8_t const &)*arg5,(uint8_t const &)*arg6,arg7,(uint8_t const &)*arg8,(uint8_t const &)*arg9,(float const &)*arg10,(float const &)*arg11,(float const &)*arg12,(float const &)*arg13,(float const &)*arg14,(float const &)*arg15,(float const &)*arg16,arg17);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeInsAdvancedConfiguration((uint8_t const &)*arg2,(uint8_t const &)*arg3,(uint8_t const &)*arg4,(uint8_t const &)*arg5,(uint8_t const &)*arg6,arg7,(uint8_t const &)*arg8,(uint8_t const &)*arg9,(float const &)*arg10,(float const &)*arg11,(float const &)*arg12,(float const &)*arg13,(float const &)*arg14,(float const &)*arg15,(float const &)*arg16,arg17);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -64689,7 +65686,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_ins_advanced_configuration__SWIG_3(PyO
   } 
   temp16 = static_cast< float >(val16);
   arg16 = &temp16;
-  (arg1)->writeInsAdvancedConfiguration((uint8_t const &)*arg2,(uint8_t const &)*arg3,(uint8_t const &)*arg4,(uint8_t const &)*arg5,(uint8_t const &)*arg6,arg7,(uint8_t const &)*arg8,(uint8_t const &)*arg9,(float const &)*arg10,(float const &)*arg11,(float const &)*arg12,(float const &)*arg13,(float const &)*arg14,(float const &)*arg15,(float const &)*arg16);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeInsAdvancedConfiguration((uint8_t const &)*arg2,(uint8_t const &)*arg3,(uint8_t const &)*arg4,(uint8_t const &)*arg5,(uint8_t const &)*arg6,arg7,(uint8_t const &)*arg8,(uint8_t const &)*arg9,(float const &)*arg10,(float const &)*arg11,(float const &)*arg12,(float const &)*arg13,(float const &)*arg14,(float const &)*arg15,(float const &)*arg16);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -64973,7 +65974,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_ins_state_lla(PyObject *SWIGUNUSEDPARM(
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_ins_state_lla" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readInsStateLla();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readInsStateLla();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::InsStateLlaRegister(static_cast< const vn::sensors::InsStateLlaRegister& >(result))), SWIGTYPE_p_vn__sensors__InsStateLlaRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -64995,7 +66000,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_ins_state_ecef(PyObject *SWIGUNUSEDPARM
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_ins_state_ecef" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readInsStateEcef();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readInsStateEcef();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::InsStateEcefRegister(static_cast< const vn::sensors::InsStateEcefRegister& >(result))), SWIGTYPE_p_vn__sensors__InsStateEcefRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -65017,7 +66026,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_startup_filter_bias_estimate(PyObject *
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_startup_filter_bias_estimate" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readStartupFilterBiasEstimate();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readStartupFilterBiasEstimate();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::StartupFilterBiasEstimateRegister(static_cast< const vn::sensors::StartupFilterBiasEstimateRegister& >(result))), SWIGTYPE_p_vn__sensors__StartupFilterBiasEstimateRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -65059,7 +66072,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_startup_filter_bias_estimate__SWIG_0(P
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_startup_filter_bias_estimate" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeStartupFilterBiasEstimate(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeStartupFilterBiasEstimate(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -65092,7 +66109,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_startup_filter_bias_estimate__SWIG_1(P
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_startup_filter_bias_estimate" "', argument " "2"" of type '" "vn::sensors::StartupFilterBiasEstimateRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::StartupFilterBiasEstimateRegister * >(argp2);
-  (arg1)->writeStartupFilterBiasEstimate(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeStartupFilterBiasEstimate(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -65157,7 +66178,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_startup_filter_bias_estimate__SWIG_2(P
     SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "VnSensor_write_startup_filter_bias_estimate" "', argument " "5"" of type '" "bool""'");
   } 
   arg5 = static_cast< bool >(val5);
-  (arg1)->writeStartupFilterBiasEstimate((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(float const &)*arg4,arg5);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeStartupFilterBiasEstimate((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(float const &)*arg4,arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -65213,7 +66238,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_startup_filter_bias_estimate__SWIG_3(P
   } 
   temp4 = static_cast< float >(val4);
   arg4 = &temp4;
-  (arg1)->writeStartupFilterBiasEstimate((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(float const &)*arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeStartupFilterBiasEstimate((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,(float const &)*arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -65345,7 +66374,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_delta_theta_and_delta_velocity(PyObject
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_delta_theta_and_delta_velocity" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readDeltaThetaAndDeltaVelocity();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readDeltaThetaAndDeltaVelocity();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::DeltaThetaAndDeltaVelocityRegister(static_cast< const vn::sensors::DeltaThetaAndDeltaVelocityRegister& >(result))), SWIGTYPE_p_vn__sensors__DeltaThetaAndDeltaVelocityRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -65367,7 +66400,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_delta_theta_and_delta_velocity_configur
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_delta_theta_and_delta_velocity_configuration" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readDeltaThetaAndDeltaVelocityConfiguration();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readDeltaThetaAndDeltaVelocityConfiguration();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::DeltaThetaAndDeltaVelocityConfigurationRegister(static_cast< const vn::sensors::DeltaThetaAndDeltaVelocityConfigurationRegister& >(result))), SWIGTYPE_p_vn__sensors__DeltaThetaAndDeltaVelocityConfigurationRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -65409,7 +66446,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_writeDeltaThetaAndDeltaVelocityConfiguration
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_writeDeltaThetaAndDeltaVelocityConfiguration" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeDeltaThetaAndDeltaVelocityConfiguration(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeDeltaThetaAndDeltaVelocityConfiguration(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -65442,7 +66483,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_writeDeltaThetaAndDeltaVelocityConfiguration
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_writeDeltaThetaAndDeltaVelocityConfiguration" "', argument " "2"" of type '" "vn::sensors::DeltaThetaAndDeltaVelocityConfigurationRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::DeltaThetaAndDeltaVelocityConfigurationRegister * >(argp2);
-  (arg1)->writeDeltaThetaAndDeltaVelocityConfiguration(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeDeltaThetaAndDeltaVelocityConfiguration(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -65499,7 +66544,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_writeDeltaThetaAndDeltaVelocityConfiguration
     SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "VnSensor_writeDeltaThetaAndDeltaVelocityConfiguration" "', argument " "5"" of type '" "bool""'");
   } 
   arg5 = static_cast< bool >(val5);
-  (arg1)->writeDeltaThetaAndDeltaVelocityConfiguration(arg2,arg3,arg4,arg5);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeDeltaThetaAndDeltaVelocityConfiguration(arg2,arg3,arg4,arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -65547,7 +66596,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_writeDeltaThetaAndDeltaVelocityConfiguration
     SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "VnSensor_writeDeltaThetaAndDeltaVelocityConfiguration" "', argument " "4"" of type '" "vn::protocol::uart::CompensationMode""'");
   } 
   arg4 = static_cast< vn::protocol::uart::CompensationMode >(val4);
-  (arg1)->writeDeltaThetaAndDeltaVelocityConfiguration(arg2,arg3,arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeDeltaThetaAndDeltaVelocityConfiguration(arg2,arg3,arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -65687,7 +66740,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_reference_vector_configuration(PyObject
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_reference_vector_configuration" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readReferenceVectorConfiguration();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readReferenceVectorConfiguration();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::ReferenceVectorConfigurationRegister(static_cast< const vn::sensors::ReferenceVectorConfigurationRegister& >(result))), SWIGTYPE_p_vn__sensors__ReferenceVectorConfigurationRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -65729,7 +66786,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_reference_vector_configuration__SWIG_0
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_reference_vector_configuration" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeReferenceVectorConfiguration(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeReferenceVectorConfiguration(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -65762,7 +66823,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_reference_vector_configuration__SWIG_1
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_reference_vector_configuration" "', argument " "2"" of type '" "vn::sensors::ReferenceVectorConfigurationRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::ReferenceVectorConfigurationRegister * >(argp2);
-  (arg1)->writeReferenceVectorConfiguration(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeReferenceVectorConfiguration(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -65848,7 +66913,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_reference_vector_configuration__SWIG_2
     SWIG_exception_fail(SWIG_ArgError(ecode7), "in method '" "VnSensor_write_reference_vector_configuration" "', argument " "7"" of type '" "bool""'");
   } 
   arg7 = static_cast< bool >(val7);
-  (arg1)->writeReferenceVectorConfiguration((uint8_t const &)*arg2,(uint8_t const &)*arg3,(uint32_t const &)*arg4,(float const &)*arg5,(vn::math::vec3d const &)*arg6,arg7);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeReferenceVectorConfiguration((uint8_t const &)*arg2,(uint8_t const &)*arg3,(uint32_t const &)*arg4,(float const &)*arg5,(vn::math::vec3d const &)*arg6,arg7);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -65925,7 +66994,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_reference_vector_configuration__SWIG_3
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_reference_vector_configuration" "', argument " "6"" of type '" "vn::math::vec3d const &""'"); 
   }
   arg6 = reinterpret_cast< vn::math::vec3d * >(argp6);
-  (arg1)->writeReferenceVectorConfiguration((uint8_t const &)*arg2,(uint8_t const &)*arg3,(uint32_t const &)*arg4,(float const &)*arg5,(vn::math::vec3d const &)*arg6);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeReferenceVectorConfiguration((uint8_t const &)*arg2,(uint8_t const &)*arg3,(uint32_t const &)*arg4,(float const &)*arg5,(vn::math::vec3d const &)*arg6);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -66085,7 +67158,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_gyro_compensation(PyObject *SWIGUNUSEDP
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_gyro_compensation" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readGyroCompensation();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readGyroCompensation();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::GyroCompensationRegister(static_cast< const vn::sensors::GyroCompensationRegister& >(result))), SWIGTYPE_p_vn__sensors__GyroCompensationRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -66127,7 +67204,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_gyro_compensation__SWIG_0(PyObject *SW
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_gyro_compensation" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeGyroCompensation(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeGyroCompensation(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -66160,7 +67241,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_gyro_compensation__SWIG_1(PyObject *SW
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_gyro_compensation" "', argument " "2"" of type '" "vn::sensors::GyroCompensationRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::GyroCompensationRegister * >(argp2);
-  (arg1)->writeGyroCompensation(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeGyroCompensation(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -66214,7 +67299,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_gyro_compensation__SWIG_2(PyObject *SW
     SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "VnSensor_write_gyro_compensation" "', argument " "4"" of type '" "bool""'");
   } 
   arg4 = static_cast< bool >(val4);
-  (arg1)->writeGyroCompensation((vn::math::mat3f const &)*arg2,(vn::math::vec3f const &)*arg3,arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeGyroCompensation((vn::math::mat3f const &)*arg2,(vn::math::vec3f const &)*arg3,arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -66259,7 +67348,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_gyro_compensation__SWIG_3(PyObject *SW
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_gyro_compensation" "', argument " "3"" of type '" "vn::math::vec3f const &""'"); 
   }
   arg3 = reinterpret_cast< vn::math::vec3f * >(argp3);
-  (arg1)->writeGyroCompensation((vn::math::mat3f const &)*arg2,(vn::math::vec3f const &)*arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeGyroCompensation((vn::math::mat3f const &)*arg2,(vn::math::vec3f const &)*arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -66379,7 +67472,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_imu_filtering_configuration(PyObject *S
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_imu_filtering_configuration" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readImuFilteringConfiguration();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readImuFilteringConfiguration();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::ImuFilteringConfigurationRegister(static_cast< const vn::sensors::ImuFilteringConfigurationRegister& >(result))), SWIGTYPE_p_vn__sensors__ImuFilteringConfigurationRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -66421,7 +67518,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_imu_filtering_configuration__SWIG_0(Py
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_imu_filtering_configuration" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeImuFilteringConfiguration(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeImuFilteringConfiguration(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -66454,7 +67555,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_imu_filtering_configuration__SWIG_1(Py
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_imu_filtering_configuration" "', argument " "2"" of type '" "vn::sensors::ImuFilteringConfigurationRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::ImuFilteringConfigurationRegister * >(argp2);
-  (arg1)->writeImuFilteringConfiguration(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeImuFilteringConfiguration(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -66584,7 +67689,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_imu_filtering_configuration__SWIG_2(Py
     SWIG_exception_fail(SWIG_ArgError(ecode12), "in method '" "VnSensor_write_imu_filtering_configuration" "', argument " "12"" of type '" "bool""'");
   } 
   arg12 = static_cast< bool >(val12);
-  (arg1)->writeImuFilteringConfiguration((uint16_t const &)*arg2,(uint16_t const &)*arg3,(uint16_t const &)*arg4,(uint16_t const &)*arg5,(uint16_t const &)*arg6,arg7,arg8,arg9,arg10,arg11,arg12);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeImuFilteringConfiguration((uint16_t const &)*arg2,(uint16_t const &)*arg3,(uint16_t const &)*arg4,(uint16_t const &)*arg5,(uint16_t const &)*arg6,arg7,arg8,arg9,arg10,arg11,arg12);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -66705,7 +67814,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_imu_filtering_configuration__SWIG_3(Py
     SWIG_exception_fail(SWIG_ArgError(ecode11), "in method '" "VnSensor_write_imu_filtering_configuration" "', argument " "11"" of type '" "vn::protocol::uart::FilterMode""'");
   } 
   arg11 = static_cast< vn::protocol::uart::FilterMode >(val11);
-  (arg1)->writeImuFilteringConfiguration((uint16_t const &)*arg2,(uint16_t const &)*arg3,(uint16_t const &)*arg4,(uint16_t const &)*arg5,(uint16_t const &)*arg6,arg7,arg8,arg9,arg10,arg11);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeImuFilteringConfiguration((uint16_t const &)*arg2,(uint16_t const &)*arg3,(uint16_t const &)*arg4,(uint16_t const &)*arg5,(uint16_t const &)*arg6,arg7,arg8,arg9,arg10,arg11);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -66929,7 +68042,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_gps_compass_baseline(PyObject *SWIGUNUS
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_gps_compass_baseline" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readGpsCompassBaseline();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readGpsCompassBaseline();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::GpsCompassBaselineRegister(static_cast< const vn::sensors::GpsCompassBaselineRegister& >(result))), SWIGTYPE_p_vn__sensors__GpsCompassBaselineRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -66971,7 +68088,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_gps_compass_baseline__SWIG_0(PyObject
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_gps_compass_baseline" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeGpsCompassBaseline(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeGpsCompassBaseline(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -67004,7 +68125,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_gps_compass_baseline__SWIG_1(PyObject
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_gps_compass_baseline" "', argument " "2"" of type '" "vn::sensors::GpsCompassBaselineRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::GpsCompassBaselineRegister * >(argp2);
-  (arg1)->writeGpsCompassBaseline(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeGpsCompassBaseline(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -67058,7 +68183,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_gps_compass_baseline__SWIG_2(PyObject
     SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "VnSensor_write_gps_compass_baseline" "', argument " "4"" of type '" "bool""'");
   } 
   arg4 = static_cast< bool >(val4);
-  (arg1)->writeGpsCompassBaseline((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,arg4);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeGpsCompassBaseline((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3,arg4);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -67103,7 +68232,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_gps_compass_baseline__SWIG_3(PyObject
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_gps_compass_baseline" "', argument " "3"" of type '" "vn::math::vec3f const &""'"); 
   }
   arg3 = reinterpret_cast< vn::math::vec3f * >(argp3);
-  (arg1)->writeGpsCompassBaseline((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeGpsCompassBaseline((vn::math::vec3f const &)*arg2,(vn::math::vec3f const &)*arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -67223,7 +68356,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_gps_compass_estimated_baseline(PyObject
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_gps_compass_estimated_baseline" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readGpsCompassEstimatedBaseline();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readGpsCompassEstimatedBaseline();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::GpsCompassEstimatedBaselineRegister(static_cast< const vn::sensors::GpsCompassEstimatedBaselineRegister& >(result))), SWIGTYPE_p_vn__sensors__GpsCompassEstimatedBaselineRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -67245,7 +68382,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_imu_rate_configuration(PyObject *SWIGUN
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_imu_rate_configuration" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readImuRateConfiguration();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readImuRateConfiguration();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::ImuRateConfigurationRegister(static_cast< const vn::sensors::ImuRateConfigurationRegister& >(result))), SWIGTYPE_p_vn__sensors__ImuRateConfigurationRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -67287,7 +68428,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_imu_rate_configuration__SWIG_0(PyObjec
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "VnSensor_write_imu_rate_configuration" "', argument " "3"" of type '" "bool""'");
   } 
   arg3 = static_cast< bool >(val3);
-  (arg1)->writeImuRateConfiguration(*arg2,arg3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeImuRateConfiguration(*arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -67320,7 +68465,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_imu_rate_configuration__SWIG_1(PyObjec
     SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "VnSensor_write_imu_rate_configuration" "', argument " "2"" of type '" "vn::sensors::ImuRateConfigurationRegister &""'"); 
   }
   arg2 = reinterpret_cast< vn::sensors::ImuRateConfigurationRegister * >(argp2);
-  (arg1)->writeImuRateConfiguration(*arg2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeImuRateConfiguration(*arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -67394,7 +68543,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_imu_rate_configuration__SWIG_2(PyObjec
     SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "VnSensor_write_imu_rate_configuration" "', argument " "6"" of type '" "bool""'");
   } 
   arg6 = static_cast< bool >(val6);
-  (arg1)->writeImuRateConfiguration((uint16_t const &)*arg2,(uint16_t const &)*arg3,(float const &)*arg4,(float const &)*arg5,arg6);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeImuRateConfiguration((uint16_t const &)*arg2,(uint16_t const &)*arg3,(float const &)*arg4,(float const &)*arg5,arg6);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -67459,7 +68612,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_write_imu_rate_configuration__SWIG_3(PyObjec
   } 
   temp5 = static_cast< float >(val5);
   arg5 = &temp5;
-  (arg1)->writeImuRateConfiguration((uint16_t const &)*arg2,(uint16_t const &)*arg3,(float const &)*arg4,(float const &)*arg5);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->writeImuRateConfiguration((uint16_t const &)*arg2,(uint16_t const &)*arg3,(float const &)*arg4,(float const &)*arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -67611,7 +68768,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_yaw_pitch_roll_true_body_acceleration_a
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_yaw_pitch_roll_true_body_acceleration_and_angular_rates_register" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readYawPitchRollTrueBodyAccelerationAndAngularRates();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readYawPitchRollTrueBodyAccelerationAndAngularRates();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::YawPitchRollTrueBodyAccelerationAndAngularRatesRegister(static_cast< const vn::sensors::YawPitchRollTrueBodyAccelerationAndAngularRatesRegister& >(result))), SWIGTYPE_p_vn__sensors__YawPitchRollTrueBodyAccelerationAndAngularRatesRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -67633,7 +68794,11 @@ SWIGINTERN PyObject *_wrap_VnSensor_read_yaw_pitch_roll_true_inertial_accelerati
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_read_yaw_pitch_roll_true_inertial_acceleration_and_angular_rates_register" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
-  result = (arg1)->readYawPitchRollTrueInertialAccelerationAndAngularRates();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (arg1)->readYawPitchRollTrueInertialAccelerationAndAngularRates();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_NewPointerObj((new vn::sensors::YawPitchRollTrueInertialAccelerationAndAngularRatesRegister(static_cast< const vn::sensors::YawPitchRollTrueInertialAccelerationAndAngularRatesRegister& >(result))), SWIGTYPE_p_vn__sensors__YawPitchRollTrueInertialAccelerationAndAngularRatesRegister, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -67871,6 +69036,86 @@ SWIGINTERN PyObject *VnSensor_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObj
   return SWIG_Py_Void();
 }
 
+
+/* Called on the thread that reads the port, which does not hold the GIL. */
+static void VnSensor_rawDataReceivedHandler(void *userData, const char *rawData, size_t length, size_t runningIndex) {
+  PyGILState_STATE state = PyGILState_Ensure();
+  PyObject *data = PyBytes_FromStringAndSize(rawData, static_cast< Py_ssize_t >(length));
+  PyObject *result = data ? PyObject_CallFunction(reinterpret_cast< PyObject * >(userData), (char *)"(On)", data, static_cast< Py_ssize_t >(runningIndex)) : NULL;
+  
+  Py_XDECREF(data);
+  if (result)
+    Py_DECREF(result);
+  else
+    PyErr_Print();
+  PyGILState_Release(state);
+}
+
+
+SWIGINTERN PyObject *_wrap_VnSensor_register_raw_data_received_handler(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  vn::sensors::VnSensor *arg1 = (vn::sensors::VnSensor *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:VnSensor_register_raw_data_received_handler",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_vn__sensors__VnSensor, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_register_raw_data_received_handler" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
+  }
+  arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
+  if (!PyCallable_Check(obj1)) {
+    PyErr_SetString(PyExc_TypeError, "handler must be callable");
+    SWIG_fail;
+  }
+  try
+  {
+    /* The reader thread may be inside the handler it replaces: release the GIL */
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->registerRawDataReceivedHandler(obj1, &VnSensor_rawDataReceivedHandler);
+  }
+  catch (vn::invalid_operation &)
+  {
+    PyErr_SetString(PyExc_RuntimeError, "a raw data received handler is already registered");
+    return NULL;
+  }
+  SWIG_HoldHandler(arg1, obj1);
+  return SWIG_Py_Void();
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_VnSensor_unregister_raw_data_received_handler(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  vn::sensors::VnSensor *arg1 = (vn::sensors::VnSensor *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:VnSensor_unregister_raw_data_received_handler",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_vn__sensors__VnSensor, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VnSensor_unregister_raw_data_received_handler" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
+  }
+  arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
+  try
+  {
+    /* Waits for a call of the handler in progress on the reader thread */
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->unregisterRawDataReceivedHandler();
+  }
+  catch (vn::invalid_operation &)
+  {
+    PyErr_SetString(PyExc_RuntimeError, "no raw data received handler is registered");
+    return NULL;
+  }
+  SWIG_ReleaseHandler(arg1);
+  return SWIG_Py_Void();
+fail:
+  return NULL;
+}
+
 SWIGINTERN PyObject *_wrap_UInt32Vector_iterator(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< uint32_t > *arg1 = (std::vector< uint32_t > *) 0 ;
@@ -73222,7 +74467,14 @@ SWIGINTERN PyObject *_wrap_delete_EzAsyncData(PyObject *SWIGUNUSEDPARM(self), Py
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_EzAsyncData" "', argument " "1"" of type '" "vn::sensors::EzAsyncData *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::EzAsyncData * >(argp1);
-  delete arg1;
+  {
+    /* Deleting disconnects the sensor, which waits for its reader thread */
+    vn::sensors::VnSensor *sensor = (arg1)->sensor();
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    delete arg1;
+    SWIG_PYTHON_THREAD_END_ALLOW;
+    SWIG_ReleaseHandler(sensor);
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -73308,7 +74560,11 @@ SWIGINTERN PyObject *_wrap_EzAsyncData_disconnect(PyObject *SWIGUNUSEDPARM(self)
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "EzAsyncData_disconnect" "', argument " "1"" of type '" "vn::sensors::EzAsyncData *""'"); 
   }
   arg1 = reinterpret_cast< vn::sensors::EzAsyncData * >(argp1);
-  (arg1)->disconnect();
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    (arg1)->disconnect();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -73353,15 +74609,20 @@ SWIGINTERN PyObject *_wrap_EzAsyncData_next_data__SWIG_0(PyObject *SWIGUNUSEDPAR
   }
   arg1 = reinterpret_cast< vn::sensors::EzAsyncData * >(argp1);
   {
+    // Waiting for the next packet can take a while, so let other Python
+    // threads (e.g. the GUI) run while we block.
+    PyThreadState *_save = PyEval_SaveThread();
     try
     {
       result = (arg1)->getNextData();
     }
     catch (vn::timeout &e)
     {
+      PyEval_RestoreThread(_save);
       PyErr_SetString(PyExc_TimeoutError, const_cast<char*>(e.what()));
       return NULL;
     }
+    PyEval_RestoreThread(_save);
   }
   resultobj = SWIG_NewPointerObj((new vn::sensors::CompositeData(static_cast< const vn::sensors::CompositeData& >(result))), SWIGTYPE_p_vn__sensors__CompositeData, SWIG_POINTER_OWN |  0 );
   return resultobj;
@@ -73394,15 +74655,20 @@ SWIGINTERN PyObject *_wrap_EzAsyncData_next_data__SWIG_1(PyObject *SWIGUNUSEDPAR
   } 
   arg2 = static_cast< int >(val2);
   {
+    // Waiting for the next packet can take a while, so let other Python
+    // threads (e.g. the GUI) run while we block.
+    PyThreadState *_save = PyEval_SaveThread();
     try
     {
       result = (arg1)->getNextData(arg2);
     }
     catch (vn::timeout &e)
     {
+      PyEval_RestoreThread(_save);
       PyErr_SetString(PyExc_TimeoutError, const_cast<char*>(e.what()));
       return NULL;
     }
+    PyEval_RestoreThread(_save);
   }
   resultobj = SWIG_NewPointerObj((new vn::sensors::CompositeData(static_cast< const vn::sensors::CompositeData& >(result))), SWIGTYPE_p_vn__sensors__CompositeData, SWIG_POINTER_OWN |  0 );
   return resultobj;
@@ -73457,6 +74723,292 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_EzAsyncData_enable_queue(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  vn::sensors::EzAsyncData *arg1 = (vn::sensors::EzAsyncData *) 0 ;
+  size_t arg2 ;
+  vn::sensors::EzAsyncData::OverflowPolicy arg3 = vn::sensors::EzAsyncData::OVERFLOW_DROP_OLDEST ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  size_t val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO|O:EzAsyncData_enable_queue",&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_vn__sensors__EzAsyncData, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "EzAsyncData_enable_queue" "', argument " "1"" of type '" "vn::sensors::EzAsyncData *""'"); 
+  }
+  arg1 = reinterpret_cast< vn::sensors::EzAsyncData * >(argp1);
+  ecode2 = SWIG_AsVal_size_t(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "EzAsyncData_enable_queue" "', argument " "2"" of type '" "size_t""'");
+  } 
+  arg2 = static_cast< size_t >(val2);
+  if (obj2) {
+    ecode3 = SWIG_AsVal_int(obj2, &val3);
+    if (!SWIG_IsOK(ecode3)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "EzAsyncData_enable_queue" "', argument " "3"" of type '" "vn::sensors::EzAsyncData::OverflowPolicy""'");
+    } 
+    arg3 = static_cast< vn::sensors::EzAsyncData::OverflowPolicy >(val3);
+  }
+  {
+    try
+    {
+      (arg1)->enableQueue(arg2,arg3);
+    }
+    catch (std::invalid_argument &e)
+    {
+      PyErr_SetString(PyExc_ValueError, "queue capacity must be greater than zero");
+      return NULL;
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_EzAsyncData_disable_queue(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  vn::sensors::EzAsyncData *arg1 = (vn::sensors::EzAsyncData *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:EzAsyncData_disable_queue",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_vn__sensors__EzAsyncData, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "EzAsyncData_disable_queue" "', argument " "1"" of type '" "vn::sensors::EzAsyncData *""'"); 
+  }
+  arg1 = reinterpret_cast< vn::sensors::EzAsyncData * >(argp1);
+  (arg1)->disableQueue();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_EzAsyncData___queueEnabled(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  vn::sensors::EzAsyncData *arg1 = (vn::sensors::EzAsyncData *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  bool result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:EzAsyncData___queueEnabled",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_vn__sensors__EzAsyncData, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "EzAsyncData___queueEnabled" "', argument " "1"" of type '" "vn::sensors::EzAsyncData *""'"); 
+  }
+  arg1 = reinterpret_cast< vn::sensors::EzAsyncData * >(argp1);
+  result = (bool)(arg1)->queueEnabled();
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_EzAsyncData___queueSize(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  vn::sensors::EzAsyncData *arg1 = (vn::sensors::EzAsyncData *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  size_t result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:EzAsyncData___queueSize",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_vn__sensors__EzAsyncData, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "EzAsyncData___queueSize" "', argument " "1"" of type '" "vn::sensors::EzAsyncData *""'"); 
+  }
+  arg1 = reinterpret_cast< vn::sensors::EzAsyncData * >(argp1);
+  result = (arg1)->queueSize();
+  resultobj = SWIG_From_size_t(static_cast< size_t >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_EzAsyncData___droppedCount(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  vn::sensors::EzAsyncData *arg1 = (vn::sensors::EzAsyncData *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  uint64_t result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:EzAsyncData___droppedCount",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_vn__sensors__EzAsyncData, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "EzAsyncData___droppedCount" "', argument " "1"" of type '" "vn::sensors::EzAsyncData *""'"); 
+  }
+  arg1 = reinterpret_cast< vn::sensors::EzAsyncData * >(argp1);
+  result = (uint64_t)(arg1)->droppedCount();
+  resultobj = SWIG_From_unsigned_SS_long_SS_long(static_cast< unsigned long long >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_EzAsyncData___overflowCount(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  vn::sensors::EzAsyncData *arg1 = (vn::sensors::EzAsyncData *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  uint64_t result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:EzAsyncData___overflowCount",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_vn__sensors__EzAsyncData, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "EzAsyncData___overflowCount" "', argument " "1"" of type '" "vn::sensors::EzAsyncData *""'"); 
+  }
+  arg1 = reinterpret_cast< vn::sensors::EzAsyncData * >(argp1);
+  result = (uint64_t)(arg1)->overflowCount();
+  resultobj = SWIG_From_unsigned_SS_long_SS_long(static_cast< unsigned long long >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_EzAsyncData_next_batch(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  vn::sensors::EzAsyncData *arg1 = (vn::sensors::EzAsyncData *) 0 ;
+  size_t arg2 ;
+  int arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  size_t val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  std::vector< vn::sensors::CompositeData > result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOO:EzAsyncData_next_batch",&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_vn__sensors__EzAsyncData, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "EzAsyncData_next_batch" "', argument " "1"" of type '" "vn::sensors::EzAsyncData *""'"); 
+  }
+  arg1 = reinterpret_cast< vn::sensors::EzAsyncData * >(argp1);
+  ecode2 = SWIG_AsVal_size_t(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "EzAsyncData_next_batch" "', argument " "2"" of type '" "size_t""'");
+  } 
+  arg2 = static_cast< size_t >(val2);
+  ecode3 = SWIG_AsVal_int(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "EzAsyncData_next_batch" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = static_cast< int >(val3);
+  {
+    PyThreadState *_save = PyEval_SaveThread();
+    try
+    {
+      result = (arg1)->getNextBatch(arg2,arg3);
+    }
+    catch (std::invalid_argument &e)
+    {
+      PyEval_RestoreThread(_save);
+      PyErr_SetString(PyExc_ValueError, "timeout must not be negative");
+      return NULL;
+    }
+    catch (vn::invalid_operation &e)
+    {
+      PyEval_RestoreThread(_save);
+      PyErr_SetString(PyExc_RuntimeError, "queue mode is not enabled");
+      return NULL;
+    }
+    PyEval_RestoreThread(_save);
+  }
+  resultobj = PyList_New(result.size());
+  if (!resultobj) SWIG_fail;
+  for (size_t i = 0; i < result.size(); i++) {
+    PyList_SET_ITEM(resultobj, i, SWIG_NewPointerObj((new vn::sensors::CompositeData(static_cast< const vn::sensors::CompositeData& >(result[i]))), SWIGTYPE_p_vn__sensors__CompositeData, SWIG_POINTER_OWN |  0 ));
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_EzAsyncData_drain_into(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  vn::sensors::EzAsyncData *arg1 = (vn::sensors::EzAsyncData *) 0 ;
+  int arg3 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  Py_buffer view;
+  size_t result = 0;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO|O:EzAsyncData_drain_into",&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_vn__sensors__EzAsyncData, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "EzAsyncData_drain_into" "', argument " "1"" of type '" "vn::sensors::EzAsyncData *""'"); 
+  }
+  arg1 = reinterpret_cast< vn::sensors::EzAsyncData * >(argp1);
+  if (obj2) {
+    ecode3 = SWIG_AsVal_int(obj2, &val3);
+    if (!SWIG_IsOK(ecode3)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "EzAsyncData_drain_into" "', argument " "3"" of type '" "int""'");
+    } 
+    arg3 = static_cast< int >(val3);
+  }
+  if (PyObject_GetBuffer(obj1, &view, PyBUF_WRITABLE | PyBUF_ANY_CONTIGUOUS) != 0) SWIG_fail;
+  if (view.itemsize != (Py_ssize_t) sizeof(vn::sensors::CompositeDataRecord)) {
+    PyBuffer_Release(&view);
+    PyErr_Format(PyExc_ValueError, "array items must be %d bytes (use vnpy.records.COMPOSITE_RECORD_DTYPE)", (int) sizeof(vn::sensors::CompositeDataRecord));
+    SWIG_fail;
+  }
+  {
+    PyThreadState *_save = PyEval_SaveThread();
+    try
+    {
+      result = (arg1)->drainInto(reinterpret_cast< vn::sensors::CompositeDataRecord * >(view.buf), static_cast< size_t >(view.len / view.itemsize), arg3);
+    }
+    catch (std::invalid_argument &e)
+    {
+      PyEval_RestoreThread(_save);
+      PyBuffer_Release(&view);
+      PyErr_SetString(PyExc_ValueError, "timeout must not be negative");
+      return NULL;
+    }
+    catch (vn::invalid_operation &e)
+    {
+      PyEval_RestoreThread(_save);
+      PyBuffer_Release(&view);
+      PyErr_SetString(PyExc_RuntimeError, "queue mode is not enabled");
+      return NULL;
+    }
+    PyEval_RestoreThread(_save);
+  }
+  PyBuffer_Release(&view);
+  resultobj = SWIG_From_size_t(static_cast< size_t >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *EzAsyncData_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *obj;
   if (!PyArg_ParseTuple(args,(char*)"O:swigregister", &obj)) return NULL;
@@ -73464,6 +75016,296 @@ SWIGINTERN PyObject *EzAsyncData_swigregister(PyObject *SWIGUNUSEDPARM(self), Py
   return SWIG_Py_Void();
 }
 
+SWIGINTERN PyObject *_wrap_new_EzAsyncData(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  vn::sensors::VnSensor *arg1 = (vn::sensors::VnSensor *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  vn::sensors::EzAsyncData *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:new_EzAsyncData",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_vn__sensors__VnSensor, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_EzAsyncData" "', argument " "1"" of type '" "vn::sensors::VnSensor *""'"); 
+  }
+  arg1 = reinterpret_cast< vn::sensors::VnSensor * >(argp1);
+  result = (vn::sensors::EzAsyncData *)new vn::sensors::EzAsyncData(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_vn__sensors__EzAsyncData, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+/* vn::util::MemoryPort is handed to Python as a vn::xplat::IPort pointer so that it
+   can be passed straight to VnSensor.connect(). */
+SWIGINTERN vn::util::MemoryPort *SWIG_AsMemoryPort(PyObject *obj, const char *method) {
+  void *argp = 0 ;
+  int res = SWIG_ConvertPtr(obj, &argp, SWIGTYPE_p_vn__xplat__IPort, 0 |  0 );
+  vn::util::MemoryPort *port = 0 ;
+  
+  if (SWIG_IsOK(res))
+    port = dynamic_cast< vn::util::MemoryPort * >(reinterpret_cast< vn::xplat::IPort * >(argp));
+  if (!port)
+    PyErr_Format(PyExc_TypeError, "in method '%s', argument 1 of type 'vn::util::MemoryPort *'", method);
+  return port;
+}
+
+
+/* Called by MemoryPort::write() on whatever thread the sensor writes from. */
+static void MemoryPort_dataWrittenHandler(void *userData, const char *rawData, size_t length) {
+  PyGILState_STATE state = PyGILState_Ensure();
+  PyObject *data = PyBytes_FromStringAndSize(rawData, static_cast< Py_ssize_t >(length));
+  PyObject *result = data ? PyObject_CallFunctionObjArgs(reinterpret_cast< PyObject * >(userData), data, NULL) : NULL;
+  
+  Py_XDECREF(data);
+  if (result)
+    Py_DECREF(result);
+  else
+    PyErr_Print();
+  PyGILState_Release(state);
+}
+
+
+SWIGINTERN PyObject *_wrap_new_MemoryPort(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  vn::xplat::IPort *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)":new_MemoryPort")) SWIG_fail;
+  result = static_cast< vn::xplat::IPort * >(new vn::util::MemoryPort());
+  return SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_vn__xplat__IPort, 0 |  0 );
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_MemoryPort_send_data_back_door(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  vn::util::MemoryPort *arg1 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  Py_buffer view;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:MemoryPort_send_data_back_door",&obj0,&obj1)) SWIG_fail;
+  arg1 = SWIG_AsMemoryPort(obj0, "MemoryPort_send_data_back_door");
+  if (!arg1) SWIG_fail;
+  if (PyObject_GetBuffer(obj1, &view, PyBUF_SIMPLE) != 0) SWIG_fail;
+  {
+    PyThreadState *_save = PyEval_SaveThread();
+    (arg1)->SendDataBackDoor(reinterpret_cast< const uint8_t * >(view.buf), static_cast< size_t >(view.len));
+    PyEval_RestoreThread(_save);
+  }
+  PyBuffer_Release(&view);
+  return SWIG_Py_Void();
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_MemoryPort_register_data_written_handler(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  vn::util::MemoryPort *arg1 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:MemoryPort_register_data_written_handler",&obj0,&obj1)) SWIG_fail;
+  arg1 = SWIG_AsMemoryPort(obj0, "MemoryPort_register_data_written_handler");
+  if (!arg1) SWIG_fail;
+  if (!PyCallable_Check(obj1)) {
+    PyErr_SetString(PyExc_TypeError, "handler must be callable");
+    SWIG_fail;
+  }
+  try
+  {
+    (arg1)->registerDataWrittenHandler(obj1, &MemoryPort_dataWrittenHandler);
+  }
+  catch (vn::invalid_operation &)
+  {
+    PyErr_SetString(PyExc_RuntimeError, "a data written handler is already registered");
+    return NULL;
+  }
+  SWIG_HoldHandler(arg1, obj1);
+  return SWIG_Py_Void();
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_MemoryPort_unregister_data_written_handler(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  vn::util::MemoryPort *arg1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:MemoryPort_unregister_data_written_handler",&obj0)) SWIG_fail;
+  arg1 = SWIG_AsMemoryPort(obj0, "MemoryPort_unregister_data_written_handler");
+  if (!arg1) SWIG_fail;
+  try
+  {
+    (arg1)->unregisterDataWrittenHandler();
+  }
+  catch (vn::invalid_operation &)
+  {
+    PyErr_SetString(PyExc_RuntimeError, "no data written handler is registered");
+    return NULL;
+  }
+  SWIG_ReleaseHandler(arg1);
+  return SWIG_Py_Void();
+fail:
+  return NULL;
+}
+
+
+
+/* Called by PacketFinder::processReceivedData() for every possible packet, on the
+   thread that processes the data, which has released the GIL.  The packet only
+   lives for the duration of the call, so Python gets its own copy. */
+static void PacketFinder_possiblePacketFoundHandler(void *userData, vn::protocol::uart::Packet &packet, size_t runningIndex, vn::xplat::TimeStamp timestamp) {
+  PyGILState_STATE state = PyGILState_Ensure();
+  PyObject *copy = SWIG_NewPointerObj(SWIG_as_voidptr(new vn::protocol::uart::Packet(packet)), SWIGTYPE_p_vn__protocol__uart__Packet, SWIG_POINTER_OWN |  0 );
+  PyObject *result = copy ? PyObject_CallFunction(reinterpret_cast< PyObject * >(userData), (char *)"(On)", copy, static_cast< Py_ssize_t >(runningIndex)) : NULL;
+  
+  Py_XDECREF(copy);
+  if (result)
+    Py_DECREF(result);
+  else
+    PyErr_Print();
+  PyGILState_Release(state);
+}
+
+
+SWIGINTERN PyObject *_wrap_new_PacketFinder(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  Py_ssize_t size = -1 ;
+  vn::protocol::uart::PacketFinder *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"|n:new_PacketFinder",&size)) SWIG_fail;
+  if (size == 0 || size < -1) {
+    PyErr_SetString(PyExc_ValueError, "internal_receive_buffer_size must be positive");
+    SWIG_fail;
+  }
+  if (size == -1)
+    result = new vn::protocol::uart::PacketFinder();
+  else
+    result = new vn::protocol::uart::PacketFinder(static_cast< size_t >(size));
+  return SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_vn__protocol__uart__PacketFinder, SWIG_POINTER_NEW |  0 );
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_PacketFinder(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  vn::protocol::uart::PacketFinder *arg1 = (vn::protocol::uart::PacketFinder *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:delete_PacketFinder",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_vn__protocol__uart__PacketFinder, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_PacketFinder" "', argument " "1"" of type '" "vn::protocol::uart::PacketFinder *""'"); 
+  }
+  arg1 = reinterpret_cast< vn::protocol::uart::PacketFinder * >(argp1);
+  delete arg1;
+  SWIG_ReleaseHandler(arg1);
+  return SWIG_Py_Void();
+fail:
+  return NULL;
+}
+
+
+/* Parses straight from the memory of any object with the buffer protocol (bytes,
+   bytearray, memoryview, mmap, contiguous numpy uint8 arrays); nothing is copied. */
+SWIGINTERN PyObject *_wrap_PacketFinder_process_received_data(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  vn::protocol::uart::PacketFinder *arg1 = (vn::protocol::uart::PacketFinder *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  Py_buffer view;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:PacketFinder_process_received_data",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_vn__protocol__uart__PacketFinder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PacketFinder_process_received_data" "', argument " "1"" of type '" "vn::protocol::uart::PacketFinder *""'"); 
+  }
+  arg1 = reinterpret_cast< vn::protocol::uart::PacketFinder * >(argp1);
+  if (PyObject_GetBuffer(obj1, &view, PyBUF_SIMPLE) != 0) SWIG_fail;
+  {
+    PyThreadState *_save = PyEval_SaveThread();
+    (arg1)->processReceivedData(reinterpret_cast< char * >(view.buf), static_cast< size_t >(view.len));
+    PyEval_RestoreThread(_save);
+  }
+  PyBuffer_Release(&view);
+  return SWIG_Py_Void();
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_PacketFinder_register_possible_packet_found_handler(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  vn::protocol::uart::PacketFinder *arg1 = (vn::protocol::uart::PacketFinder *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:PacketFinder_register_possible_packet_found_handler",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_vn__protocol__uart__PacketFinder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PacketFinder_register_possible_packet_found_handler" "', argument " "1"" of type '" "vn::protocol::uart::PacketFinder *""'"); 
+  }
+  arg1 = reinterpret_cast< vn::protocol::uart::PacketFinder * >(argp1);
+  if (!PyCallable_Check(obj1)) {
+    PyErr_SetString(PyExc_TypeError, "handler must be callable");
+    SWIG_fail;
+  }
+  try
+  {
+    (arg1)->registerPossiblePacketFoundHandler(obj1, &PacketFinder_possiblePacketFoundHandler);
+  }
+  catch (vn::invalid_operation &)
+  {
+    PyErr_SetString(PyExc_RuntimeError, "a possible packet found handler is already registered");
+    return NULL;
+  }
+  SWIG_HoldHandler(arg1, obj1);
+  return SWIG_Py_Void();
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_PacketFinder_unregister_possible_packet_found_handler(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  vn::protocol::uart::PacketFinder *arg1 = (vn::protocol::uart::PacketFinder *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:PacketFinder_unregister_possible_packet_found_handler",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_vn__protocol__uart__PacketFinder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PacketFinder_unregister_possible_packet_found_handler" "', argument " "1"" of type '" "vn::protocol::uart::PacketFinder *""'"); 
+  }
+  arg1 = reinterpret_cast< vn::protocol::uart::PacketFinder * >(argp1);
+  try
+  {
+    (arg1)->unregisterPossiblePacketFoundHandler();
+  }
+  catch (vn::invalid_operation &)
+  {
+    PyErr_SetString(PyExc_RuntimeError, "no possible packet found handler is registered");
+    return NULL;
+  }
+  SWIG_ReleaseHandler(arg1);
+  return SWIG_Py_Void();
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *PacketFinder_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!PyArg_ParseTuple(args,(char*)"O:swigregister", &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_vn__protocol__uart__PacketFinder, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
 static PyMethodDef SwigMethods[] = {
 	 { (char *)"SWIG_PyInstanceMethod_New", (PyCFunction)SWIG_PyInstanceMethod_New, METH_O, NULL},
 	 { (char *)"new_vec3f", _wrap_new_vec3f, METH_VARARGS, (char *)"\n"
@@ -73679,6 +75521,17 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"dcm2omega_phi_kappa_rads", _wrap_dcm2omega_phi_kappa_rads, METH_VARARGS, (char *)"dcm2omega_phi_kappa_rads(mat3f dcm) -> vec3f"},
 	 { (char *)"ypr_degs2omega_phi_kappa_rads", _wrap_ypr_degs2omega_phi_kappa_rads, METH_VARARGS, (char *)"ypr_degs2omega_phi_kappa_rads(vec3f yprDegs) -> vec3f"},
 	 { (char *)"ypr_rads2omega_phi_kappa_rads", _wrap_ypr_rads2omega_phi_kappa_rads, METH_VARARGS, (char *)"ypr_rads2omega_phi_kappa_rads(vec3f yprRads) -> vec3f"},
+	 { (char *)"__quat2ypr_degs_array", _wrap___quat2ypr_degs_array, METH_VARARGS, (char *)"__quat2ypr_degs_array(buffer quats, buffer yprs)"},
+	 { (char *)"__quat2ypr_rads_array", _wrap___quat2ypr_rads_array, METH_VARARGS, (char *)"__quat2ypr_rads_array(buffer quats, buffer yprs)"},
+	 { (char *)"__ypr_degs2quat_array", _wrap___ypr_degs2quat_array, METH_VARARGS, (char *)"__ypr_degs2quat_array(buffer yprs, buffer quats)"},
+	 { (char *)"__quat2dcm_array", _wrap___quat2dcm_array, METH_VARARGS, (char *)"__quat2dcm_array(buffer quats, buffer dcms)"},
+	 { (char *)"__dcm2quat_array", _wrap___dcm2quat_array, METH_VARARGS, (char *)"__dcm2quat_array(buffer dcms, buffer quats)"},
+	 { (char *)"__quat2omega_phi_kappa_rads_array", _wrap___quat2omega_phi_kappa_rads_array, METH_VARARGS, (char *)"__quat2omega_phi_kappa_rads_array(buffer quats, buffer angles)"},
+	 { (char *)"vec3f_from_buffer", _wrap_vec3f_from_buffer, METH_VARARGS, (char *)"vec3f_from_buffer(buffer data) -> vec3f"},
+	 { (char *)"vec3d_from_buffer", _wrap_vec3d_from_buffer, METH_VARARGS, (char *)"vec3d_from_buffer(buffer data) -> vec3d"},
+	 { (char *)"vec4f_from_buffer", _wrap_vec4f_from_buffer, METH_VARARGS, (char *)"vec4f_from_buffer(buffer data) -> vec4f"},
+	 { (char *)"mat3f_from_buffer", _wrap_mat3f_from_buffer, METH_VARARGS, (char *)"mat3f_from_buffer(buffer data) -> mat3f"},
+	 { (char *)"plain_data", _wrap_plain_data, METH_VARARGS, (char *)"plain_data(vec3f, vec3d, vec4f or mat3f value) -> PlainVec3, PlainVec4 or PlainMat3"},
 	 { (char *)"__rad2deg_v3f", _wrap___rad2deg_v3f, METH_VARARGS, (char *)"__rad2deg_v3f(vec3f anglesInRads) -> vec3f"},
 	 { (char *)"__rad2deg_v3d", _wrap___rad2deg_v3d, METH_VARARGS, (char *)"__rad2deg_v3d(vec3f anglesInRads) -> vec3f"},
 	 { (char *)"__deg2rad_v3f", _wrap___deg2rad_v3f, METH_VARARGS, (char *)"__deg2rad_v3f(vec3f anglesInDegs) -> vec3f"},
@@ -75220,6 +77073,8 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"VnSensor_retransmit_delay_ms_set", _wrap_VnSensor_retransmit_delay_ms_set, METH_VARARGS, (char *)"VnSensor_retransmit_delay_ms_set(VnSensor self, uint16_t retransmit_delay_ms)"},
 	 { (char *)"VnSensor_retransmit_delay_ms_get", _wrap_VnSensor_retransmit_delay_ms_get, METH_VARARGS, (char *)"VnSensor_retransmit_delay_ms_get(VnSensor self) -> uint16_t"},
 	 { (char *)"VnSensor_swigregister", VnSensor_swigregister, METH_VARARGS, NULL},
+	 { (char *)"VnSensor_register_raw_data_received_handler", _wrap_VnSensor_register_raw_data_received_handler, METH_VARARGS, (char *)"VnSensor_register_raw_data_received_handler(VnSensor self, callable handler)"},
+	 { (char *)"VnSensor_unregister_raw_data_received_handler", _wrap_VnSensor_unregister_raw_data_received_handler, METH_VARARGS, (char *)"VnSensor_unregister_raw_data_received_handler(VnSensor self)"},
 	 { (char *)"UInt32Vector_iterator", _wrap_UInt32Vector_iterator, METH_VARARGS, (char *)"UInt32Vector_iterator(UInt32Vector self) -> SwigPyIterator"},
 	 { (char *)"UInt32Vector___nonzero__", _wrap_UInt32Vector___nonzero__, METH_VARARGS, (char *)"UInt32Vector___nonzero__(UInt32Vector self) -> bool"},
 	 { (char *)"UInt32Vector___bool__", _wrap_UInt32Vector___bool__, METH_VARARGS, (char *)"UInt32Vector___bool__(UInt32Vector self) -> bool"},
@@ -75428,7 +77283,26 @@ static PyMethodDef SwigMethods[] = {
 		"next_data() -> CompositeData\n"
 		"EzAsyncData_next_data(EzAsyncData self, int timeoutMs) -> CompositeData\n"
 		""},
+	 { (char *)"EzAsyncData_enable_queue", _wrap_EzAsyncData_enable_queue, METH_VARARGS, (char *)"EzAsyncData_enable_queue(EzAsyncData self, size_t capacity, vn::sensors::EzAsyncData::OverflowPolicy policy=OVERFLOW_DROP_OLDEST)"},
+	 { (char *)"EzAsyncData_disable_queue", _wrap_EzAsyncData_disable_queue, METH_VARARGS, (char *)"EzAsyncData_disable_queue(EzAsyncData self)"},
+	 { (char *)"EzAsyncData___queueEnabled", _wrap_EzAsyncData___queueEnabled, METH_VARARGS, (char *)"EzAsyncData___queueEnabled(EzAsyncData self) -> bool"},
+	 { (char *)"EzAsyncData___queueSize", _wrap_EzAsyncData___queueSize, METH_VARARGS, (char *)"EzAsyncData___queueSize(EzAsyncData self) -> size_t"},
+	 { (char *)"EzAsyncData___droppedCount", _wrap_EzAsyncData___droppedCount, METH_VARARGS, (char *)"EzAsyncData___droppedCount(EzAsyncData self) -> uint64_t"},
+	 { (char *)"EzAsyncData___overflowCount", _wrap_EzAsyncData___overflowCount, METH_VARARGS, (char *)"EzAsyncData___overflowCount(EzAsyncData self) -> uint64_t"},
+	 { (char *)"EzAsyncData_next_batch", _wrap_EzAsyncData_next_batch, METH_VARARGS, (char *)"EzAsyncData_next_batch(EzAsyncData self, size_t maxItems, int timeoutMs) -> list of CompositeData"},
+	 { (char *)"EzAsyncData_drain_into", _wrap_EzAsyncData_drain_into, METH_VARARGS, (char *)"EzAsyncData_drain_into(EzAsyncData self, buffer records, int timeoutMs=0) -> size_t"},
 	 { (char *)"EzAsyncData_swigregister", EzAsyncData_swigregister, METH_VARARGS, NULL},
+	 { (char *)"new_EzAsyncData", _wrap_new_EzAsyncData, METH_VARARGS, (char *)"new_EzAsyncData(VnSensor sensor) -> EzAsyncData"},
+	 { (char *)"new_MemoryPort", _wrap_new_MemoryPort, METH_VARARGS, (char *)"new_MemoryPort() -> MemoryPort"},
+	 { (char *)"MemoryPort_send_data_back_door", _wrap_MemoryPort_send_data_back_door, METH_VARARGS, (char *)"MemoryPort_send_data_back_door(MemoryPort self, buffer data)"},
+	 { (char *)"MemoryPort_register_data_written_handler", _wrap_MemoryPort_register_data_written_handler, METH_VARARGS, (char *)"MemoryPort_register_data_written_handler(MemoryPort self, callable handler)"},
+	 { (char *)"MemoryPort_unregister_data_written_handler", _wrap_MemoryPort_unregister_data_written_handler, METH_VARARGS, (char *)"MemoryPort_unregister_data_written_handler(MemoryPort self)"},
+	 { (char *)"new_PacketFinder", _wrap_new_PacketFinder, METH_VARARGS, (char *)"new_PacketFinder(size_t internalReceiveBufferSize=None) -> PacketFinder"},
+	 { (char *)"delete_PacketFinder", _wrap_delete_PacketFinder, METH_VARARGS, (char *)"delete_PacketFinder(PacketFinder self)"},
+	 { (char *)"PacketFinder_process_received_data", _wrap_PacketFinder_process_received_data, METH_VARARGS, (char *)"PacketFinder_process_received_data(PacketFinder self, buffer data)"},
+	 { (char *)"PacketFinder_register_possible_packet_found_handler", _wrap_PacketFinder_register_possible_packet_found_handler, METH_VARARGS, (char *)"PacketFinder_register_possible_packet_found_handler(PacketFinder self, callable handler)"},
+	 { (char *)"PacketFinder_unregister_possible_packet_found_handler", _wrap_PacketFinder_unregister_possible_packet_found_handler, METH_VARARGS, (char *)"PacketFinder_unregister_possible_packet_found_handler(PacketFinder self)"},
+	 { (char *)"PacketFinder_swigregister", PacketFinder_swigregister, METH_VARARGS, NULL},
 	 { NULL, NULL, 0, NULL }
 };
 
@@ -75513,6 +77387,7 @@ static swig_type_info _swigt__p_vn__protocol__uart__HsiOutput = {"_p_vn__protoco
 static swig_type_info _swigt__p_vn__protocol__uart__IntegrationFrame = {"_p_vn__protocol__uart__IntegrationFrame", "enum vn::protocol::uart::IntegrationFrame *|vn::protocol::uart::IntegrationFrame *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_vn__protocol__uart__MagneticMode = {"_p_vn__protocol__uart__MagneticMode", "enum vn::protocol::uart::MagneticMode *|vn::protocol::uart::MagneticMode *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_vn__protocol__uart__Packet = {"_p_vn__protocol__uart__Packet", "vn::protocol::uart::Packet *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_vn__protocol__uart__PacketFinder = {"_p_vn__protocol__uart__PacketFinder", "vn::protocol::uart::PacketFinder *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_vn__protocol__uart__PpsSource = {"_p_vn__protocol__uart__PpsSource", "enum vn::protocol::uart::PpsSource *|vn::protocol::uart::PpsSource *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_vn__protocol__uart__Scenario = {"_p_vn__protocol__uart__Scenario", "enum vn::protocol::uart::Scenario *|vn::protocol::uart::Scenario *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_vn__protocol__uart__StatusMode = {"_p_vn__protocol__uart__StatusMode", "enum vn::protocol::uart::StatusMode *|vn::protocol::uart::StatusMode *", 0, 0, (void*)0, 0};
@@ -75654,6 +77529,7 @@ static swig_type_info *swig_type_initial[] = {
   &_swigt__p_vn__protocol__uart__IntegrationFrame,
   &_swigt__p_vn__protocol__uart__MagneticMode,
   &_swigt__p_vn__protocol__uart__Packet,
+  &_swigt__p_vn__protocol__uart__PacketFinder,
   &_swigt__p_vn__protocol__uart__PpsSource,
   &_swigt__p_vn__protocol__uart__Scenario,
   &_swigt__p_vn__protocol__uart__StatusMode,
@@ -75795,6 +77671,7 @@ static swig_cast_info _swigc__p_vn__protocol__uart__HsiOutput[] = {  {&_swigt__p
 static swig_cast_info _swigc__p_vn__protocol__uart__IntegrationFrame[] = {  {&_swigt__p_vn__protocol__uart__IntegrationFrame, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_vn__protocol__uart__MagneticMode[] = {  {&_swigt__p_vn__protocol__uart__MagneticMode, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_vn__protocol__uart__Packet[] = {  {&_swigt__p_vn__protocol__uart__Packet, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_vn__protocol__uart__PacketFinder[] = {  {&_swigt__p_vn__protocol__uart__PacketFinder, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_vn__protocol__uart__PpsSource[] = {  {&_swigt__p_vn__protocol__uart__PpsSource, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_vn__protocol__uart__Scenario[] = {  {&_swigt__p_vn__protocol__uart__Scenario, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_vn__protocol__uart__StatusMode[] = {  {&_swigt__p_vn__protocol__uart__StatusMode, 0, 0, 0},{0, 0, 0, 0}};
@@ -75936,6 +77813,7 @@ static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_vn__protocol__uart__IntegrationFrame,
   _swigc__p_vn__protocol__uart__MagneticMode,
   _swigc__p_vn__protocol__uart__Packet,
+  _swigc__p_vn__protocol__uart__PacketFinder,
   _swigc__p_vn__protocol__uart__PpsSource,
   _swigc__p_vn__protocol__uart__Scenario,
   _swigc__p_vn__protocol__uart__StatusMode,
@@ -76814,6 +78692,17 @@ SWIG_init(void) {
   SWIG_Python_SetConstant(d, "VnSensor_VnSensor_Family_Vn100",SWIG_From_int(static_cast< int >(vn::sensors::VnSensor::VnSensor_Family_Vn100)));
   SWIG_Python_SetConstant(d, "VnSensor_VnSensor_Family_Vn200",SWIG_From_int(static_cast< int >(vn::sensors::VnSensor::VnSensor_Family_Vn200)));
   SWIG_Python_SetConstant(d, "VnSensor_VnSensor_Family_Vn300",SWIG_From_int(static_cast< int >(vn::sensors::VnSensor::VnSensor_Family_Vn300)));
+  SWIG_Python_SetConstant(d, "EzAsyncData_OVERFLOW_BLOCK",SWIG_From_int(static_cast< int >(vn::sensors::EzAsyncData::OVERFLOW_BLOCK)));
+  SWIG_Python_SetConstant(d, "EzAsyncData_OVERFLOW_DROP_OLDEST",SWIG_From_int(static_cast< int >(vn::sensors::EzAsyncData::OVERFLOW_DROP_OLDEST)));
+  SWIG_Python_SetConstant(d, "EzAsyncData_OVERFLOW_DROP_NEWEST",SWIG_From_int(static_cast< int >(vn::sensors::EzAsyncData::OVERFLOW_DROP_NEWEST)));
+  if (!SWIG_PlainVec3Type.tp_name) {
+    PyStructSequence_InitType(&SWIG_PlainVec3Type, &SWIG_PlainVec3Desc);
+    PyStructSequence_InitType(&SWIG_PlainVec4Type, &SWIG_PlainVec4Desc);
+    PyStructSequence_InitType(&SWIG_PlainMat3Type, &SWIG_PlainMat3Desc);
+  }
+  PyDict_SetItemString(d, "PlainVec3", (PyObject *) &SWIG_PlainVec3Type);
+  PyDict_SetItemString(d, "PlainVec4", (PyObject *) &SWIG_PlainVec4Type);
+  PyDict_SetItemString(d, "PlainMat3", (PyObject *) &SWIG_PlainMat3Type);
 #if PY_VERSION_HEX >= 0x03000000
   return m;
 #else
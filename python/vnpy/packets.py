@@ -0,0 +1,8 @@
+""" Packets of the sensor's serial protocol: Packet, PacketFinder, the ASCII
+    asynchronous output types (VNYPR etc.) and the error detection modes. """
+
+from .libvncxx import (Packet, PacketFinder, ERRORDETECTIONMODE_CHECKSUM, ERRORDETECTIONMODE_CRC,
+                       ERRORDETECTIONMODE_NONE, VNACC, VNDTV, VNGPE, VNGPS, VNGYR, VNIMU, VNINE, VNINS, VNISE, VNISL,
+                       VNMAG, VNMAR, VNOFF, VNQMR, VNQTN, VNYBA, VNYIA, VNYMR, VNYPR)
+
+__all__ = [name for name in dir() if not name.startswith('_')]
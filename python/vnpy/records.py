@@ -0,0 +1,18 @@
+""" NumPy views of EzAsyncData.drain_into() output.
+
+    Importing this module requires NumPy; the rest of vnpy does not. """
+
+import numpy as np
+
+# Must match vn::sensors::CompositeDataRecord (vn/ezasyncdata.h), 72 bytes, no padding.
+COMPOSITE_RECORD_DTYPE = np.dtype([('time', '=f8'),
+                                   ('ypr', '=f4', (3,)),
+                                   ('rate', '=f4', (3,)),
+                                   ('accel', '=f4', (3,)),
+                                   ('mag', '=f4', (3,)),
+                                   ('quat', '=f4', (4,))])
+
+
+def empty_records(n):
+    """ Returns an uninitialized array of n records to pass to drain_into(). """
+    return np.empty(n, dtype=COMPOSITE_RECORD_DTYPE)
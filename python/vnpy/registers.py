@@ -0,0 +1,50 @@
+""" The register classes of the sensor, the constants of their fields and the
+    parse() and to_string() helpers of those constants. """
+
+from .libvncxx import (BinaryOutputRegister, QuaternionMagneticAccelerationAndAngularRatesRegister,
+                       MagneticAccelerationAndAngularRatesRegister, MagneticAndGravityReferenceVectorsRegister,
+                       FilterMeasurementsVarianceParametersRegister, MagnetometerCompensationRegister,
+                       FilterActiveTuningParametersRegister, AccelerationCompensationRegister,
+                       YawPitchRollMagneticAccelerationAndAngularRatesRegister, CommunicationProtocolControlRegister,
+                       SynchronizationControlRegister, SynchronizationStatusRegister, FilterBasicControlRegister,
+                       VpeBasicControlRegister, VpeMagnetometerBasicTuningRegister,
+                       VpeMagnetometerAdvancedTuningRegister, VpeAccelerometerBasicTuningRegister,
+                       VpeAccelerometerAdvancedTuningRegister, VpeGyroBasicTuningRegister,
+                       MagnetometerCalibrationControlRegister, CalculatedMagnetometerCalibrationRegister,
+                       VelocityCompensationControlRegister, VelocityCompensationStatusRegister,
+                       ImuMeasurementsRegister, GpsConfigurationRegister, GpsSolutionLlaRegister,
+                       GpsSolutionEcefRegister, InsSolutionLlaRegister, InsSolutionEcefRegister,
+                       InsBasicConfigurationRegisterVn200, InsBasicConfigurationRegisterVn300,
+                       InsAdvancedConfigurationRegister, InsStateLlaRegister, InsStateEcefRegister,
+                       StartupFilterBiasEstimateRegister, DeltaThetaAndDeltaVelocityRegister,
+                       DeltaThetaAndDeltaVelocityConfigurationRegister, ReferenceVectorConfigurationRegister,
+                       GyroCompensationRegister, ImuFilteringConfigurationRegister, GpsCompassBaselineRegister,
+                       GpsCompassEstimatedBaselineRegister, ImuRateConfigurationRegister,
+                       YawPitchRollTrueBodyAccelerationAndAngularRatesRegister,
+                       YawPitchRollTrueInertialAccelerationAndAngularRatesRegister, CHECKSUMMODE_CHECKSUM,
+                       CHECKSUMMODE_CRC, CHECKSUMMODE_OFF, COMPENSATIONMODE_BIAS, COMPENSATIONMODE_NONE,
+                       COUNTMODE_GPSPPS, COUNTMODE_NONE, COUNTMODE_SYNCINCOUNT, COUNTMODE_SYNCINTIME,
+                       COUNTMODE_SYNCOUTCOUNTER, ERRORMODE_IGNORE, ERRORMODE_SEND, ERRORMODE_SENDANDOFF,
+                       EXTERNALSENSORMODE_EXTERNAL200HZ, EXTERNALSENSORMODE_EXTERNALONUPDATE,
+                       EXTERNALSENSORMODE_INTERNAL, FILTERMODE_BOTH, FILTERMODE_NOFILTERING,
+                       FILTERMODE_ONLYCOMPENSATED, FILTERMODE_ONLYRAW, FOAMINIT_FOAMINITHEADINGPITCHROLL,
+                       FOAMINIT_FOAMINITHEADINGPITCHROLLCOVARIANCE, FOAMINIT_FOAMINITPITCHROLL,
+                       FOAMINIT_FOAMINITPITCHROLLCOVARIANCE, FOAMINIT_NOFOAMINIT, GPSFIX_2D, GPSFIX_3D, GPSFIX_NOFIX,
+                       GPSFIX_TIMEONLY, GPSMODE_EXTERNALGPS, GPSMODE_EXTERNALVN200GPS, GPSMODE_ONBOARDGPS,
+                       HEADINGMODE_ABSOLUTE, HEADINGMODE_INDOOR, HEADINGMODE_RELATIVE, HSIMODE_OFF, HSIMODE_RESET,
+                       HSIMODE_RUN, HSIOUTPUT_NOONBOARD, HSIOUTPUT_USEONBOARD, INSSTATUS_GPS_ERROR, INSSTATUS_GPS_FIX,
+                       INSSTATUS_IMU_ERROR, INSSTATUS_MAG_PRES_ERROR, INSSTATUS_NOT_TRACKING,
+                       INSSTATUS_SUFFICIENT_DYNAMIC_MOTION, INSSTATUS_TIME_ERROR, INSSTATUS_TRACKING,
+                       INTEGRATIONFRAME_BODY, INTEGRATIONFRAME_NED, MAGNETICMODE_2D, MAGNETICMODE_3D,
+                       PPSSOURCE_GPSPPSFALLING, PPSSOURCE_GPSPPSRISING, PPSSOURCE_SYNCINFALLING,
+                       PPSSOURCE_SYNCINRISING, SCENARIO_AHRS, SCENARIO_GPSMOVINGBASELINEDYNAMIC,
+                       SCENARIO_GPSMOVINGBASELINESTATIC, SCENARIO_INSWITHOUTPRESSURE, SCENARIO_INSWITHPRESSURE,
+                       SENSSAT_ACCX, SENSSAT_ACCY, SENSSAT_ACCZ, SENSSAT_GYROX, SENSSAT_GYROY, SENSSAT_GYROZ,
+                       SENSSAT_MAGX, SENSSAT_MAGY, SENSSAT_MAGZ, SENSSAT_PRES, STATUSMODE_INSSTATUS, STATUSMODE_OFF,
+                       STATUSMODE_VPESTATUS, SYNCINEDGE_FALLING, SYNCINEDGE_RISING, SYNCINMODE_ASYNC,
+                       SYNCINMODE_COUNT, SYNCINMODE_IMU, SYNCOUTMODE_GPSPPS, SYNCOUTMODE_IMUREADY, SYNCOUTMODE_INS,
+                       SYNCOUTMODE_ITEMSTART, SYNCOUTMODE_NONE, SYNCOUTPOLARITY_NEGATIVE, SYNCOUTPOLARITY_POSITIVE,
+                       VELOCITYCOMPENSATIONMODE_BODYMEASUREMENT, VELOCITYCOMPENSATIONMODE_DISABLED, VPEENABLE_DISABLE,
+                       VPEENABLE_ENABLE, VPEMODE_MODE1, VPEMODE_OFF, parse, to_string)
+
+__all__ = [name for name in dir() if not name.startswith('_')]